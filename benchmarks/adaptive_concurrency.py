@@ -0,0 +1,87 @@
+"""Throughput of a fixed concurrency limit vs the AIMD limiter.
+
+A simulated downstream serves `capacity` requests at once at its base
+latency; beyond that latency grows with the queue, and past twice the
+capacity it answers 429. Capacity drops partway through the run. Workers
+keep the limiter's slots busy; reports successful requests per second,
+the 429 rate and the limit at the end of each phase.
+
+    python -m benchmarks.adaptive_concurrency --capacity 40,10 --phase 3
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+from pipeline.adaptive_limiter import AdaptiveLimiter
+
+class Overloaded(Exception):
+    status = 429
+
+class Downstream:
+    def __init__(self, capacity: int, latency: float):
+        self.capacity = capacity
+        self.latency = latency
+        self.active = 0
+
+    async def call(self):
+        self.active += 1
+        try:
+            if self.active > 2 * self.capacity:
+                await asyncio.sleep(self.latency / 10)
+                raise Overloaded()
+            await asyncio.sleep(self.latency * max(1.0, self.active / self.capacity))
+        finally:
+            self.active -= 1
+
+class FixedLimiter(AdaptiveLimiter):
+    """The previous behaviour: a semaphore-like limit that never moves"""
+
+    def _observe(self, slot, latency, saturated):
+        pass
+
+    def _decrease(self, slot, reason):
+        pass
+
+async def run_phase(limiter: AdaptiveLimiter, downstream: Downstream, seconds: float) -> Dict[str, Any]:
+    done = errors = 0
+    deadline = time.monotonic() + seconds
+
+    async def worker():
+        nonlocal done, errors
+        while time.monotonic() < deadline:
+            try:
+                async with limiter.slot():
+                    await downstream.call()
+                done += 1
+            except Overloaded:
+                errors += 1
+
+    # More workers than any limit, so the limiter is what bounds concurrency
+    await asyncio.gather(*(worker() for _ in range(200)))
+    return {'rps': done / seconds, 'errors': errors / max(done + errors, 1), 'limit': limiter.max_in_flight}
+
+async def run(limiter: AdaptiveLimiter, capacities: List[int], seconds: float, latency: float) -> List[Dict[str, Any]]:
+    downstream = Downstream(capacities[0], latency)
+    rows = []
+    for capacity in capacities:
+        downstream.capacity = capacity
+        rows.append(await run_phase(limiter, downstream, seconds))
+    return rows
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark adaptive concurrency")
+    parser.add_argument('--capacity', default='40,10', help="Comma-separated downstream capacity per phase")
+    parser.add_argument('--phase', type=float, default=3.0, help="Seconds per phase")
+    parser.add_argument('--latency', type=float, default=0.02, help="Base downstream latency in seconds")
+    args = parser.parse_args()
+
+    capacities = [int(c) for c in args.capacity.split(',')]
+    # Everything else comes from COLLECTION_CONCURRENCY_CONFIG
+    config = {'initial': 5, 'max': 100}
+    print(f"{'limiter':<10} {'capacity':>8} {'req/s':>8} {'429s':>7} {'limit':>6}")
+    for name, limiter in (('fixed 5', FixedLimiter('bench_fixed', config)), ('aimd', AdaptiveLimiter('bench_aimd', config))):
+        for capacity, row in zip(capacities, await run(limiter, capacities, args.phase, args.latency)):
+            print(f"{name:<10} {capacity:>8} {row['rps']:>8.0f} {row['errors']:>7.1%} {row['limit']:>6}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
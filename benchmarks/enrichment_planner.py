@@ -0,0 +1,107 @@
+"""Provider calls per profile: calling every source vs the source planner.
+
+Simulated sources fill each catalog field with a fixed probability after
+a fixed latency (scaled down by --scale). Each profile starts with a
+random subset of the wanted fields already present. Reports calls, cost
+and wall time per profile and the share of missing fields filled.
+
+    python -m benchmarks.enrichment_planner --profiles 500 --scale 0.01
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Set, Tuple
+from integrations.source_planner import SOURCE_CATALOG, SourcePlanner, SourceStats, missing_fields
+
+WANTED = [
+    'email', 'phone', 'title', 'linkedin_url', 'experience', 'education', 'skills',
+    'email_verification', 'background_check', 'company_info'
+]
+
+# Source -> (chance of filling each of its fields, latency in seconds, cost per call)
+SIMULATED = {
+    'linkedin': (0.8, 0.6, 0.0),
+    'hunter': (0.9, 0.3, 0.01),
+    'rocketreach': (0.5, 1.5, 0.15),
+    'apollo': (0.5, 0.8, 0.05),
+    'pdl': (0.6, 1.0, 0.10),
+    'lexisnexis': (0.7, 2.5, 0.50),
+    'clearbit': (0.7, 0.5, 0.10),
+    'zoominfo': (0.6, 1.2, 0.20)
+}
+
+def synthetic_profile(rng: random.Random) -> Dict[str, Any]:
+    profile = {'first_name': 'Jane', 'last_name': 'Roe', 'company_domain': 'example.com'}
+    for name in WANTED:
+        if rng.random() < 0.4:
+            profile[name] = 'known'
+    return profile
+
+def fetchers(rng: random.Random, scale: float, calls: List[str]):
+    def make(name: str):
+        chance, latency, _ = SIMULATED[name]
+
+        async def fetch(profile: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(name)
+            await asyncio.sleep(latency * scale)
+            return {
+                keys[0]: 'value'
+                for keys in SOURCE_CATALOG[name].fields.values()
+                if rng.random() < chance
+            }
+        return fetch
+    return {name: make(name) for name in SIMULATED}
+
+def filled_by(results: Dict[str, Any]) -> Set[str]:
+    filled: Set[str] = set()
+    for name, result in results.items():
+        filled |= SOURCE_CATALOG[name].filled(result)
+    return filled
+
+async def call_all(profile: Dict[str, Any], fetch: Dict[str, Any], planner: SourcePlanner) -> Tuple[Dict[str, Any], Set[str]]:
+    names = planner.callable_sources(profile, fetch)
+    outcomes = await asyncio.gather(*(fetch[name](profile) for name in names))
+    return dict(zip(names, outcomes)), missing_fields(profile, WANTED)
+
+async def run(mode: str, profiles: List[Dict[str, Any]], scale: float) -> Dict[str, float]:
+    rng = random.Random(1)
+    calls: List[str] = []
+    fetch = fetchers(rng, scale, calls)
+    costs = {name: spec[2] for name, spec in SIMULATED.items()}
+    planner = SourcePlanner(stats=SourceStats(), costs=costs, config={
+        'fields': WANTED, 'cost_weight': 10, 'latency_weight': 1, 'max_waves': 3
+    })
+    wanted_missing = filled = 0
+    start = time.perf_counter()
+    for profile in profiles:
+        missing = missing_fields(profile, WANTED)
+        if mode == 'planner':
+            results, _ = await planner.run(profile, fetch)
+        else:
+            results, _ = await call_all(profile, fetch, planner)
+        wanted_missing += len(missing)
+        filled += len(missing & filled_by(results))
+    elapsed = time.perf_counter() - start
+    return {
+        'calls': len(calls) / len(profiles),
+        'cost': sum(costs[name] for name in calls) / len(profiles),
+        'ms': elapsed / len(profiles) * 1000,
+        'fill': filled / max(wanted_missing, 1)
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark enrichment source planning")
+    parser.add_argument('--profiles', type=int, default=500)
+    parser.add_argument('--scale', type=float, default=0.01, help="Multiplier on simulated latencies")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    profiles = [synthetic_profile(rng) for _ in range(args.profiles)]
+    print(f"{'mode':<10} {'calls':>7} {'cost':>7} {'ms':>8} {'filled':>7}")
+    for mode in ('call all', 'planner'):
+        row = await run('planner' if mode == 'planner' else 'all', profiles, args.scale)
+        print(f"{mode:<10} {row['calls']:>7.2f} {row['cost']:>7.3f} {row['ms']:>8.1f} {row['fill']:>7.1%}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""Lookup latency and match quality of the entity resolution index.
+
+Generates distinct people, then duplicates of some of them the way
+they arrive from different sources: name typos, email case and +tags,
+reformatted LinkedIn URLs, missing fields. Reports microseconds per
+resolve (mean, p50, p99) and the precision and recall of duplicate
+detection.
+
+    python -m benchmarks.entity_resolution --people 50000 --duplicates 0.3
+"""
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Tuple
+from pipeline.entity_resolver import EntityIndex
+
+FIRST = [
+    'John', 'Jane', 'Maria', 'José', 'Wei', 'Aisha', 'Liam', 'Olivia', 'Noah', 'Emma', 'Lucas', 'Sofia',
+    'James', 'Mary', 'Ahmed', 'Fatima', 'Chen', 'Yuki', 'Ivan', 'Anna', 'David', 'Sarah', 'Omar', 'Priya'
+]
+SYLLABLES = ['al', 'ber', 'can', 'dor', 'el', 'fin', 'gar', 'hol', 'is', 'jen', 'kov', 'lin', 'mar', 'nor',
+             'os', 'per', 'quin', 'ros', 'sen', 'tor', 'ul', 'van', 'wes', 'yam', 'zel', 'ström', 'ez', 'ski']
+COMPANIES = [f'company{i}.com' for i in range(2000)]
+
+def person(rng: random.Random, i: int) -> Dict[str, Any]:
+    first = rng.choice(FIRST)
+    # Common given names, surnames from a long tail as in real populations
+    last = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+    domain = rng.choice(COMPANIES)
+    return {
+        'first_name': first,
+        'last_name': last,
+        'email': f"{first.lower()}.{last.lower()}@{domain}" if rng.random() < 0.7 else f"{first.lower()}{i}@gmail.com",
+        'company_domain': domain,
+        'linkedin_url': f"https://www.linkedin.com/in/{first.lower()}-{last.lower()}-{i}" if rng.random() < 0.6 else None
+    }
+
+def variant(rng: random.Random, record: Dict[str, Any]) -> Dict[str, Any]:
+    dup = dict(record)
+    roll = rng.random()
+    if roll < 0.3:
+        dup['email'] = dup['email'].upper()
+        dup['linkedin_url'] = None
+    elif roll < 0.6:
+        local, domain = dup['email'].split('@')
+        dup['email'] = f"{local}+lead@{domain}"
+        dup['first_name'] = dup['first_name'][0] + '.'
+    elif roll < 0.8:
+        # A different mailbox, but the same name at the same company
+        dup['email'] = None
+        last = dup['last_name']
+        cut = rng.randrange(len(last))
+        dup['last_name'] = last[:cut] + last[cut + 1:]
+    else:
+        dup['email'] = None
+        if dup['linkedin_url']:
+            dup['linkedin_url'] = dup['linkedin_url'].replace('https://www.', 'http://') + '/'
+    return dup
+
+def stream(people: int, duplicates: float, seed: int = 0) -> List[Tuple[Dict[str, Any], int]]:
+    rng = random.Random(seed)
+    originals = [person(rng, i) for i in range(people)]
+    records = [(record, i) for i, record in enumerate(originals)]
+    records += [(variant(rng, originals[i]), i) for i in rng.sample(range(people), int(people * duplicates))]
+    rng.shuffle(records)
+    return records
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark entity resolution")
+    parser.add_argument('--people', type=int, default=50000)
+    parser.add_argument('--duplicates', type=float, default=0.3, help="Share of people that arrive twice")
+    args = parser.parse_args()
+
+    records = stream(args.people, args.duplicates)
+    index = EntityIndex()
+    entity_of_person: Dict[int, str] = {}
+    true_dup = false_dup = expected = 0
+    timings = []
+    for record, person_id in records:
+        start = time.perf_counter()
+        entity_id, duplicate = index.resolve(record)
+        timings.append(time.perf_counter() - start)
+        expected += person_id in entity_of_person
+        if duplicate:
+            if entity_of_person.get(person_id) == entity_id:
+                true_dup += 1
+            else:
+                false_dup += 1
+        entity_of_person.setdefault(person_id, entity_id)
+    timings.sort()
+
+    print(f"records      {len(records)}")
+    print(f"us/resolve   mean {sum(timings) / len(timings) * 1e6:.1f}  "
+          f"p50 {timings[len(timings) // 2] * 1e6:.1f}  p99 {timings[int(len(timings) * 0.99)] * 1e6:.1f}")
+    print(f"precision    {true_dup / max(true_dup + false_dup, 1):.3f}")
+    print(f"recall       {true_dup / max(expected, 1):.3f}")
+    print(f"entities     {len(index.entities)}")
+
+if __name__ == "__main__":
+    main()
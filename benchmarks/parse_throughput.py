@@ -0,0 +1,89 @@
+"""Parse-stage throughput benchmark.
+
+Runs the parse stage over synthetic chunks for every combination of
+concurrency and packing, and reports chunks/sec and tokens/sec.
+
+    python -m benchmarks.parse_throughput --concurrency 1,2,4,8 --pack 1,2,4
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+from llm import FakeLLMBackend, get_backend
+from parse import aparse_chunks
+
+def synthetic_chunks(count: int, chunk_size: int, seed: int = 0) -> List[str]:
+    """Generate deterministic page-like text chunks of roughly `chunk_size` characters."""
+    rng = random.Random(seed)
+    vocabulary = [
+        'engineer', 'manager', 'director', 'company', 'email', 'phone',
+        'experience', 'education', 'skills', 'python', 'sales', 'located',
+        'contact', 'profile', 'team', 'senior', 'product', 'research'
+    ]
+    chunks = []
+    for _ in range(count):
+        words, size = [], 0
+        while size < chunk_size:
+            word = rng.choice(vocabulary)
+            words.append(word)
+            size += len(word) + 1
+        chunks.append(" ".join(words))
+    return chunks
+
+async def run_case(backend, chunks: List[str], concurrency: int, pack_size: int) -> dict:
+    """Measure one concurrency/packing combination."""
+    backend.reset_stats()
+    start = time.perf_counter()
+    await aparse_chunks(
+        chunks,
+        "Extract job titles",
+        backend,
+        concurrency=concurrency,
+        pack_size=pack_size
+    )
+    elapsed = time.perf_counter() - start
+    tokens = backend.stats['prompt_tokens'] + backend.stats['completion_tokens']
+    return {
+        'concurrency': concurrency,
+        'pack_size': pack_size,
+        'calls': backend.stats['calls'],
+        'seconds': elapsed,
+        'chunks_per_sec': len(chunks) / elapsed,
+        'tokens_per_sec': tokens / elapsed
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark parse-stage throughput")
+    parser.add_argument('--backend', choices=['fake', 'ollama'], default='fake')
+    parser.add_argument('--model', default='llama2:3.2')
+    parser.add_argument('--chunks', type=int, default=64)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--concurrency', default='1,2,4,8')
+    parser.add_argument('--pack', default='1,2,4')
+    parser.add_argument('--server-slots', type=int, default=4,
+                        help="Concurrency limit of the fake backend")
+    parser.add_argument('--base-latency-ms', type=float, default=50.0)
+    args = parser.parse_args()
+
+    if args.backend == 'fake':
+        backend = FakeLLMBackend(
+            base_latency_ms=args.base_latency_ms,
+            max_concurrency=args.server_slots
+        )
+    else:
+        backend = get_backend('ollama', model_name=args.model)
+
+    chunks = synthetic_chunks(args.chunks, args.chunk_size)
+    print(f"{'conc':>5} {'pack':>5} {'calls':>6} {'secs':>8} {'chunks/s':>10} {'tokens/s':>10}")
+    for concurrency in [int(c) for c in args.concurrency.split(',')]:
+        for pack_size in [int(p) for p in args.pack.split(',')]:
+            result = await run_case(backend, chunks, concurrency, pack_size)
+            print(
+                f"{result['concurrency']:>5} {result['pack_size']:>5} {result['calls']:>6} "
+                f"{result['seconds']:>8.2f} {result['chunks_per_sec']:>10.1f} "
+                f"{result['tokens_per_sec']:>10.0f}"
+            )
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,188 @@
+"""End-to-end pipeline throughput benchmark on the in-memory broker.
+
+Pushes synthetic profile pages through extraction, enrichment and
+validation with the real stage handlers and reports messages/sec,
+per-stage handler latency, end-to-end latency and the peak consumer lag of
+each stage group. Enrichment is simulated with a fixed per-call latency.
+
+    python -m benchmarks.pipeline_throughput --messages 2000 --workers 1,2,4
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import Dict, List
+from pipeline import KafkaConfig, KafkaPipelineManager, DataProducer, DataProcessor
+from pipeline.html_extractor import extract_profile_fields
+from pipeline.memory_broker import MemoryBroker
+from pipeline.partitioning import profile_key
+
+class SimulatedEnricher:
+    """Enricher that waits a fixed time, standing in for API lookups"""
+
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+
+    async def enrich(self, data: Dict) -> Dict:
+        await asyncio.sleep(self.latency)
+        return {**data, 'enrichment': {'source': 'simulated'}}
+
+class AcceptingValidator:
+    """Validator that accepts any profile with an email"""
+
+    async def validate(self, data: Dict) -> bool:
+        return bool(data.get('email'))
+
+def synthetic_page(i: int) -> str:
+    """A small profile page with JSON-LD Person markup"""
+    return f"""<html><head><title>Person {i}</title>
+<script type="application/ld+json">
+{{"@type": "Person", "name": "Person {i}", "givenName": "Person", "familyName": "{i}",
+  "email": "person{i}@example.com", "jobTitle": "Engineer",
+  "worksFor": {{"name": "Company {i % 50}"}},
+  "sameAs": ["https://www.linkedin.com/in/person{i}"]}}
+</script></head>
+<body><p>{'Experienced engineer. ' * 20}</p></body></html>"""
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def timed(handler, latencies: List[float]):
+    """Wrap a stage handler to record its latency in milliseconds"""
+    async def wrapper(msg):
+        start = time.perf_counter()
+        try:
+            return await handler(msg)
+        finally:
+            latencies.append((time.perf_counter() - start) * 1000)
+    return wrapper
+
+async def run_case(messages: int, workers: int, enrich_latency_ms: float, timeout: float) -> dict:
+    """Run one pipeline configuration to completion on a fresh broker"""
+    config = KafkaConfig()
+    config.BACKEND = 'memory'
+    config.BOOTSTRAP_SERVERS = f'memory://benchmark-{workers}'
+    config.BLOB_STORE_PATH = tempfile.mkdtemp(prefix='pipeline-bench-')
+    config.AUDIT_SPOOL_DIR = tempfile.mkdtemp(prefix='pipeline-bench-audit-')
+    config.CONSUMER_BATCH_TIMEOUT = 0.05
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+    broker = MemoryBroker.for_servers(config.BOOTSTRAP_SERVERS)
+    await KafkaPipelineManager(config).setup_pipeline()
+
+    producer = DataProducer(config)
+    await producer.start()
+    enricher = SimulatedEnricher(enrich_latency_ms)
+    validator = AcceptingValidator()
+
+    stage_latencies: Dict[str, List[float]] = {stage: [] for stage in config.STAGE_INPUT_TOPICS}
+    handler_names = {
+        'extraction': '_handle_raw_html',
+        'enrichment': '_handle_extracted_data',
+        'validation': '_handle_enriched_data'
+    }
+    processors = []
+    tasks = []
+    for stage in config.STAGE_INPUT_TOPICS:
+        for _ in range(workers):
+            processor = DataProcessor(
+                config,
+                stages=[stage],
+                producer=producer,
+                enricher=enricher,
+                validator=validator
+            )
+            name = handler_names[stage]
+            setattr(processor, name, timed(getattr(processor, name), stage_latencies[stage]))
+            processors.append(processor)
+            tasks.append(asyncio.create_task(processor.run_stage(stage)))
+
+    # Final key of each page, to join raw and validated messages afterwards
+    pages = [(f"https://example.com/people/{i}", synthetic_page(i)) for i in range(messages)]
+    final_keys = {
+        profile_key({'url': url}): profile_key(extract_profile_fields(html), default=url)
+        for url, html in pages
+    }
+
+    validated_topic = config.TOPICS['validated_data']
+    failed_topic = config.TOPICS['failed_processing']
+    peak_lag = {stage: 0 for stage in config.STAGE_INPUT_TOPICS}
+
+    def sample_lag():
+        for stage, name in config.STAGE_INPUT_TOPICS.items():
+            lag = broker.group_lag(config.CONSUMER_GROUPS[stage], config.TOPICS[name])
+            peak_lag[stage] = max(peak_lag[stage], sum(lag.values()))
+
+    def finished() -> int:
+        return sum(
+            broker.high_watermark(topic, p)
+            for topic in (validated_topic, failed_topic)
+            for p in range(len(broker.partitions(topic)))
+        )
+
+    start = time.perf_counter()
+    for url, html in pages:
+        await producer.produce_raw_html(url, html)
+    while finished() < messages and time.perf_counter() - start < timeout:
+        sample_lag()
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - start
+
+    for processor in processors:
+        for consumer in processor.consumers.values():
+            consumer.stop()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    for processor in processors:
+        await processor.close(close_producer=False)
+    await producer.close()
+
+    # End-to-end latency from the raw append to the validated append
+    produced_at = {}
+    for partition in broker.partitions(config.TOPICS['raw_html']):
+        for msg in partition:
+            produced_at[final_keys[msg.key().decode('utf-8')]] = msg.timestamp()[1]
+    end_to_end = [
+        msg.timestamp()[1] - produced_at[msg.key().decode('utf-8')]
+        for partition in broker.partitions(validated_topic)
+        for msg in partition
+    ]
+
+    return {
+        'workers': workers,
+        'completed': len(end_to_end),
+        'seconds': elapsed,
+        'msgs_per_sec': len(end_to_end) / elapsed,
+        'stage_p50_ms': {s: statistics.median(l) if l else 0.0 for s, l in stage_latencies.items()},
+        'e2e_p50_ms': percentile(end_to_end, 50),
+        'e2e_p99_ms': percentile(end_to_end, 99),
+        'peak_lag': peak_lag
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end pipeline throughput")
+    parser.add_argument('--messages', type=int, default=1000)
+    parser.add_argument('--workers', default='1,2,4',
+                        help="Comma-separated workers per stage to compare")
+    parser.add_argument('--enrich-latency-ms', type=float, default=5.0)
+    parser.add_argument('--timeout', type=float, default=120.0)
+    args = parser.parse_args()
+
+    print(
+        f"{'workers':>7} {'done':>6} {'secs':>7} {'msgs/s':>8} "
+        f"{'extract':>8} {'enrich':>8} {'validate':>8} {'e2e p50':>8} {'e2e p99':>8}  peak lag"
+    )
+    for workers in [int(w) for w in args.workers.split(',')]:
+        result = await run_case(args.messages, workers, args.enrich_latency_ms, args.timeout)
+        stage = result['stage_p50_ms']
+        lag = ' '.join(f"{s[:3]}={n}" for s, n in result['peak_lag'].items())
+        print(
+            f"{result['workers']:>7} {result['completed']:>6} {result['seconds']:>7.2f} "
+            f"{result['msgs_per_sec']:>8.1f} {stage['extraction']:>8.2f} {stage['enrichment']:>8.2f} "
+            f"{stage['validation']:>8.2f} {result['e2e_p50_ms']:>8.0f} {result['e2e_p99_ms']:>8.0f}  {lag}"
+        )
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""Per-record cost of the stages DataProcessor.
+
+Processes the same synthetic raw records three ways and reports
+microseconds per record: the old path that builds a DataFrame for every
+record, the single-record path without pandas, and per batch, either
+`process_batch` or `process_api_frame` for consumers that stay columnar.
+
+    python -m benchmarks.processor_throughput --records 20000 --rows 3 --batch 100,1000,10000
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Dict, List
+from pipeline.stages.data_processor import DataProcessor
+
+def synthetic_raw(rng: random.Random, rows: int) -> Dict[str, Any]:
+    """A raw record with a few API result rows, some fields missing, and one web page"""
+    results = []
+    for i in range(rows):
+        row = {'name': f'Person {i}', 'title': 'Engineer', 'company': 'Acme', 'email': None}
+        if rng.random() < 0.5:
+            row['phone'] = '+14155550100'
+        results.append(row)
+    return {
+        'api_data': {'results': results},
+        'web_data': [{
+            'url': 'https://example.com/about',
+            'title': ' About ',
+            'content': 'Some   page\n content',
+            'links': ['https://example.com', 'mailto:someone@example.com']
+        }]
+    }
+
+class FramePerRecordProcessor(DataProcessor):
+    """The previous behaviour: a DataFrame round trip for every record"""
+
+    def _process_api_data(self, api_data: Dict[str, Any]) -> Dict[str, Any]:
+        if not api_data:
+            return {}
+        return self._process_api_frame(api_data)
+
+async def per_record(processor: DataProcessor, records: List[Dict[str, Any]]) -> float:
+    start = time.perf_counter()
+    for record in records:
+        await processor.process(record)
+    return time.perf_counter() - start
+
+async def batched(processor: DataProcessor, records: List[Dict[str, Any]], size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(records), size):
+        await processor.process_batch(records[i:i + size])
+    return time.perf_counter() - start
+
+def framed(processor: DataProcessor, records: List[Dict[str, Any]], size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(records), size):
+        processor.process_api_frame(records[i:i + size])
+    return time.perf_counter() - start
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark DataProcessor per-record cost")
+    parser.add_argument('--records', type=int, default=20000)
+    parser.add_argument('--rows', type=int, default=3, help="API result rows per record")
+    parser.add_argument('--batch', default='100,1000,10000', help="Comma-separated batch sizes")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    records = [synthetic_raw(rng, args.rows) for _ in range(args.records)]
+    processor = DataProcessor()
+
+    # The old path is slow enough that a slice of the records is plenty
+    sample = records[:min(len(records), 2000)]
+    print(f"{'mode':<22} {'us/record':>10}")
+    print(f"{'dataframe per record':<22} {await per_record(FramePerRecordProcessor(), sample) / len(sample) * 1e6:>10.1f}")
+    print(f"{'single record':<22} {await per_record(processor, records) / len(records) * 1e6:>10.1f}")
+    for size in [int(s) for s in args.batch.split(',')]:
+        secs = await batched(processor, records, size)
+        print(f"{f'batch of {size}':<22} {secs / len(records) * 1e6:>10.1f}")
+    for size in [int(s) for s in args.batch.split(',')]:
+        secs = framed(processor, records, size)
+        print(f"{f'frame of {size}':<22} {secs / len(records) * 1e6:>10.1f}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
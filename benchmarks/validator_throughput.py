@@ -0,0 +1,96 @@
+"""Validator microbenchmark: DataValidator, CompiledValidator and validate_batch.
+
+Validates the same synthetic profiles, nested to a configurable depth,
+with each implementation, checks that they agree, and reports
+records/sec for each.
+
+    python -m benchmarks.validator_throughput --records 5000 --depth 1,3,5
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Dict, List
+from pipeline.stages.data_validator import DataValidator
+from pipeline.stages.compiled_validator import CompiledValidator
+from pipeline.stages.batch_validator import validate_batch
+
+OPTIONAL_FIELDS = ['phone', 'end_date', 'birth_date', 'risk_score']
+
+def synthetic_profile(rng: random.Random, depth: int) -> Dict[str, Any]:
+    """A profile whose fields are spread over `depth` levels of nesting, plus noise.
+
+    Optional fields are left out at random, as they are in collected
+    profiles, so lookups for them have to search the whole record.
+    """
+    fields = {
+        'name': 'Jane Roe',
+        'first_name': 'Jane',
+        'last_name': 'Roe',
+        'full_name': 'Jane Roe',
+        'email': rng.choice(['jane.roe@example.com', 'not-an-email']),
+        'phone': '+14155550100',
+        'linkedin_url': 'https://linkedin.com/in/janeroe',
+        'location': 'Austin, TX',
+        'skills': ['python', 'sql'],
+        'start_date': '2019-04-01',
+        'end_date': rng.choice(['2023-01-15', '2018-01-01']),
+        'birth_date': '1990-06-30',
+        'confidence_score': 0.9,
+        'risk_score': 0.1
+    }
+    for key in OPTIONAL_FIELDS:
+        if rng.random() < 0.5:
+            del fields[key]
+    record: Dict[str, Any] = {}
+    levels = [record]
+    for level in range(depth - 1):
+        child: Dict[str, Any] = {}
+        levels[-1][f'section_{level}'] = child
+        levels.append(child)
+    for key, value in fields.items():
+        rng.choice(levels)[key] = value
+    for level in levels:
+        level['history'] = [{'company': f'Company {i}', 'title': 'Engineer'} for i in range(5)]
+    return record
+
+async def time_validator(validate, records: List[Dict[str, Any]]) -> tuple:
+    start = time.perf_counter()
+    verdicts = [await validate(record) for record in records]
+    return verdicts, time.perf_counter() - start
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark DataValidator against CompiledValidator")
+    parser.add_argument('--records', type=int, default=5000)
+    parser.add_argument('--depth', default='1,3,5', help="Comma-separated nesting depths")
+    args = parser.parse_args()
+
+    # Only the checks both implementations share are compared
+    rules = {'required_fields': ['name', 'location', 'skills']}
+    baseline = DataValidator()
+    baseline.validation_rules = rules
+    compiled = CompiledValidator(rules)
+
+    print(
+        f"{'depth':>5} {'baseline rec/s':>15} {'compiled rec/s':>15} {'speedup':>8} "
+        f"{'batch rec/s':>12} {'speedup':>8} {'agree':>6}"
+    )
+    for depth in [int(d) for d in args.depth.split(',')]:
+        rng = random.Random(depth)
+        records = [synthetic_profile(rng, depth) for _ in range(args.records)]
+        base_verdicts, base_secs = await time_validator(baseline.validate, records)
+        compiled_verdicts, compiled_secs = await time_validator(compiled.validate, records)
+        start = time.perf_counter()
+        batch_verdicts = validate_batch(records, rules).valid.tolist()
+        batch_secs = time.perf_counter() - start
+        agree = base_verdicts == compiled_verdicts == batch_verdicts
+        print(
+            f"{depth:>5} {len(records) / base_secs:>15.0f} {len(records) / compiled_secs:>15.0f} "
+            f"{base_secs / compiled_secs:>7.1f}x {len(records) / batch_secs:>12.0f} "
+            f"{base_secs / batch_secs:>7.1f}x {str(agree):>6}"
+        )
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.WARNING)
+    asyncio.run(main())
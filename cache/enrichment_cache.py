@@ -0,0 +1,180 @@
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from config.settings import ENRICHMENT_CACHE_CONFIG
+from monitoring.prometheus_metrics import record_enrichment_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'enrichment'
+
+def normalize_identity(value: Any) -> Any:
+    """Reduce a lookup's arguments to what identifies the person or company.
+
+    Strings are case- and whitespace-folded and empty values dropped, so
+    `" Jane@Example.com"` and `"jane@example.com"` share a cache entry.
+    """
+    if isinstance(value, str):
+        return ' '.join(value.lower().split())
+    if isinstance(value, dict):
+        return {
+            str(key): normalize_identity(item)
+            for key, item in sorted(value.items(), key=lambda pair: str(pair[0]))
+            if item not in (None, '', [], {})
+        }
+    if isinstance(value, (list, tuple)):
+        return [normalize_identity(item) for item in value if item not in (None, '', [], {})]
+    return value
+
+def lookup_key(source: str, operation: str, identity: Any) -> str:
+    """Key of a lookup: source, operation and a hash of the normalized identity"""
+    encoded = json.dumps(normalize_identity(identity), sort_keys=True, default=str)
+    return f"{KEY_PREFIX}:{source}:{operation}:{hashlib.sha256(encoded.encode()).hexdigest()}"
+
+def call_identity(signature: inspect.Signature, instance: Any, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """A method call's arguments by parameter name, defaults filled in.
+
+    `enrich(params)` and `enrich(params=params)` get the same identity.
+    """
+    bound = signature.bind(instance, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop(next(iter(signature.parameters)))
+    return arguments
+
+def is_not_found(result: Any = None, error: Optional[Exception] = None) -> bool:
+    """Whether a lookup found nothing: an empty result or a 404"""
+    if error is not None:
+        status = getattr(error, 'status', None) or getattr(getattr(error, 'response', None), 'status_code', None)
+        return status == 404
+    return result in (None, {}, [])
+
+class EnrichmentCache:
+    """Two-tier cache of enrichment API results, shared by every enrichment path.
+
+    Entries are keyed by source, operation and normalized lookup identity.
+    A bounded in-process LRU sits in front of Redis; found results live
+    for the source's TTL and "not found" results for the shorter negative
+    TTL. Errors other than 404 are never cached.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, redis: Any = None):
+        self.config = config or ENRICHMENT_CACHE_CONFIG
+        self.redis = redis
+        self.memory: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+
+    def key(self, source: str, operation: str, identity: Any) -> str:
+        return lookup_key(source, operation, identity)
+
+    def ttl(self, source: str, negative: bool) -> int:
+        if negative:
+            return self.config['negative_ttl']
+        return self.config['ttls'].get(source, self.config['negative_ttl'])
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The cached entry for a key, from memory first and then Redis"""
+        now = time.time()
+        if key in self.memory:
+            expires_at, entry = self.memory[key]
+            if expires_at > now:
+                self.memory.move_to_end(key)
+                return entry
+            del self.memory[key]
+        if self.redis is not None:
+            entry = await self.redis.get(key)
+            if entry and entry.get('expires_at', 0) > now:
+                self._remember(key, entry)
+                return entry
+        return None
+
+    async def set(self, key: str, value: Any, ttl: int, negative: bool = False):
+        entry = {'value': value, 'negative': negative, 'expires_at': time.time() + ttl}
+        self._remember(key, entry)
+        if self.redis is not None:
+            await self.redis.set(key, entry, expiry=ttl)
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        expires_at = min(entry['expires_at'], time.time() + self.config['memory_ttl'])
+        self.memory[key] = (expires_at, entry)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.config['memory_entries']:
+            self.memory.popitem(last=False)
+
+    async def fetch(
+        self,
+        source: str,
+        operation: str,
+        identity: Any,
+        loader: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """Return the cached result for a lookup, calling `loader` on a miss.
+
+        Results `cacheable` rejects, such as partial failures, are returned
+        without being stored.
+        """
+        if not self.config['enabled']:
+            return await loader()
+
+        key = self.key(source, operation, identity)
+        cost = self.config['costs'].get(source, 0.0)
+        entry = await self.get(key)
+        if entry is not None:
+            record_enrichment_cache_lookup(source, 'negative_hit' if entry['negative'] else 'hit', cost)
+            return copy.deepcopy(entry['value'])
+
+        record_enrichment_cache_lookup(source, 'miss')
+        try:
+            result = await loader()
+        except Exception as e:
+            if is_not_found(error=e):
+                await self.set(key, {}, self.ttl(source, True), negative=True)
+            raise
+        if cacheable is not None and not cacheable(result):
+            return result
+        negative = is_not_found(result)
+        await self.set(key, result, self.ttl(source, negative), negative=negative)
+        return copy.deepcopy(result)
+
+_cache: Optional[EnrichmentCache] = None
+
+def get_enrichment_cache() -> EnrichmentCache:
+    """The process-wide enrichment cache, backed by Redis when configured"""
+    global _cache
+    if _cache is None:
+        redis = None
+        if ENRICHMENT_CACHE_CONFIG['redis']:
+            # The asyncio client, so lookups never block the event loop
+            from cache.redis_manager import AsyncRedisManager
+            redis = AsyncRedisManager()
+        _cache = EnrichmentCache(redis=redis)
+    return _cache
+
+def set_enrichment_cache(cache: Optional[EnrichmentCache]):
+    """Replace the process-wide cache, e.g. with a memory-only one"""
+    global _cache
+    _cache = cache
+
+def cached_lookup(source: str, operation: str, cacheable: Optional[Callable[[Any], bool]] = None):
+    """Cache an enrichment client method by its arguments.
+
+    While a 404 is negatively cached the method returns `{}` instead of
+    raising, which is what every enrichment path already turns it into.
+    Results `cacheable` rejects are not cached at all.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = get_enrichment_cache()
+            identity = call_identity(signature, self, args, kwargs)
+            return await cache.fetch(source, operation, identity, lambda: func(self, *args, **kwargs), cacheable)
+        return wrapper
+    return decorator
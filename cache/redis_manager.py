@@ -1,4 +1,5 @@
 import redis
+import redis.asyncio
 import json
 import logging
 from typing import Any, Optional
@@ -50,6 +51,54 @@ class RedisManager:
         """Check if key exists in Redis."""
         try:
             return bool(self.redis_client.exists(key))
+        except Exception as e:
+            logger.error(f"Redis exists error: {str(e)}")
+            return False
+
+class AsyncRedisManager(RedisManager):
+    """RedisManager on the asyncio client, for callers on the event loop"""
+    
+    def __init__(self):
+        self.redis_client = redis.asyncio.Redis(
+            host=os.getenv('REDIS_HOST', 'localhost'),
+            port=int(os.getenv('REDIS_PORT', 6379)),
+            db=int(os.getenv('REDIS_DB', 0)),
+            decode_responses=True
+        )
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from Redis."""
+        try:
+            value = await self.redis_client.get(key)
+            return json.loads(value) if value else None
+        except Exception as e:
+            logger.error(f"Redis get error: {str(e)}")
+            return None
+    
+    async def set(self, key: str, value: Any, expiry: int = 3600) -> bool:
+        """Set value in Redis with expiry in seconds."""
+        try:
+            return await self.redis_client.setex(
+                key,
+                expiry,
+                json.dumps(value)
+            )
+        except Exception as e:
+            logger.error(f"Redis set error: {str(e)}")
+            return False
+    
+    async def delete(self, key: str) -> bool:
+        """Delete key from Redis."""
+        try:
+            return bool(await self.redis_client.delete(key))
+        except Exception as e:
+            logger.error(f"Redis delete error: {str(e)}")
+            return False
+    
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in Redis."""
+        try:
+            return bool(await self.redis_client.exists(key))
         except Exception as e:
             logger.error(f"Redis exists error: {str(e)}")
             return False
\ No newline at end of file
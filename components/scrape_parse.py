@@ -1,6 +1,11 @@
 import streamlit as st
 from scraper.advanced_scraper import AdvancedScraper
-from parse import parse_with_ollama
+from scraper.selector_templates import SelectorTemplateStore
+from parse import parse_page
+from llm import get_backend
+from config.settings import SELECTOR_TEMPLATE_CONFIG
+from pipeline.fused_lookup import lookup_profile
+import asyncio
 import json
 from datetime import datetime
 import logging
@@ -8,6 +13,11 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@st.cache_resource
+def get_template_store() -> SelectorTemplateStore:
+    """Selector templates shared across sessions and persisted between runs"""
+    return SelectorTemplateStore(**SELECTOR_TEMPLATE_CONFIG)
+
 def render_scrape_parse_tab():
     col1, col2 = st.columns([2, 1])
     
@@ -59,23 +69,25 @@ def render_scrape_parse_tab():
                         st.error("Failed to scrape the website. Please check the URL and try again.")
                         return
                     
-                    # Prepare content for parsing
-                    content_for_parsing = []
-                    for item in scraped_data['content']:
-                        content_for_parsing.append(item['text'])
-                    
-                    if not content_for_parsing:
+                    if not scraped_data['content']:
                         st.warning("No content found to parse. The page might be empty or blocked.")
                         return
                     
-                    # Parse content
-                    parsed_results = parse_with_ollama(
-                        content_for_parsing,
+                    # Parse content, skipping the LLM on domains with a learned template
+                    template_store = get_template_store()
+                    parsed_results = parse_page(
+                        url,
+                        scraped_data['html'],
                         parse_description,
-                        model_name=model_name,
-                        temperature=temperature,
-                        max_tokens=max_tokens
+                        get_backend(
+                            'ollama',
+                            model_name=model_name,
+                            temperature=temperature,
+                            max_tokens=max_tokens
+                        ),
+                        template_store=template_store
                     )
+                    template_store.save()
                     
                     if not parsed_results:
                         st.warning("No matching content found for your parsing description.")
@@ -86,6 +98,19 @@ def render_scrape_parse_tab():
                     st.session_state["scraped_data"] = scraped_data
                     st.success("Scraping and parsing completed!")
                     
+                    # Build the profile in-process rather than through the Kafka stages
+                    try:
+                        st.session_state["profile"] = asyncio.run(lookup_profile(
+                            url,
+                            scraped_data['html'],
+                            publish=False,
+                            record_failures=False
+                        ))
+                    except Exception as e:
+                        logger.warning(f"Profile lookup failed for {url}: {str(e)}")
+                        st.session_state.pop("profile", None)
+                        st.warning(f"No validated profile for this page: {str(e)}")
+                    
                 except Exception as e:
                     logger.error(f"Error during scraping/parsing: {str(e)}")
                     st.error(f"An error occurred: {str(e)}")
@@ -107,10 +132,15 @@ def render_scrape_parse_tab():
                 with st.expander("Structured Data"):
                     st.json(st.session_state["scraped_data"]["structured_data"])
             
+            if "profile" in st.session_state:
+                with st.expander("Profile"):
+                    st.json(st.session_state["profile"])
+            
             if st.download_button(
                 "Download All Data",
                 json.dumps({
                     "parsed_results": st.session_state["parsed_results"],
+                    "profile": st.session_state.get("profile"),
                     "scraped_data": st.session_state.get("scraped_data", {})
                 }, indent=2),
                 "scraped_results.json",
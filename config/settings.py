@@ -12,6 +12,19 @@ API_CONFIG: Dict[str, Any] = {
         'timeout': 30,
         'retry_attempts': 3
     },
+    'linkedin': {
+        'access_token': os.getenv('LINKEDIN_ACCESS_TOKEN'),
+        'organization_id': os.getenv('LINKEDIN_ORGANIZATION_ID')
+    },
+    'hunter': {
+        'api_key': os.getenv('HUNTER_API_KEY')
+    },
+    'rocketreach': {
+        'api_key': os.getenv('ROCKETREACH_API_KEY')
+    },
+    'pdl': {
+        'api_key': os.getenv('PDL_API_KEY')
+    },
     'scraping': {
         'max_concurrent': 4,
         'timeout': 20,
@@ -27,7 +40,124 @@ PIPELINE_CONFIG: Dict[str, Any] = {
         'min_confidence_score': 0.7
     },
     'update_interval': int(os.getenv('UPDATE_INTERVAL', '10')),
-    'max_workers': int(os.getenv('MAX_WORKERS', '4'))
+    'max_workers': int(os.getenv('MAX_WORKERS', '4')),
+    'enrichment_deadline': float(os.getenv('ENRICHMENT_DEADLINE', '5'))
+}
+
+# Enrichment Cache Configuration
+ENRICHMENT_SOURCES = ['hunter', 'rocketreach', 'pdl', 'lexisnexis', 'clearbit', 'zoominfo', 'apollo']
+
+ENRICHMENT_CACHE_CONFIG: Dict[str, Any] = {
+    'enabled': os.getenv('ENRICHMENT_CACHE_ENABLED', 'true').lower() == 'true',
+    # Shared Redis tier behind the in-process LRU; opt-in
+    'redis': os.getenv('ENRICHMENT_CACHE_REDIS', 'false').lower() == 'true',
+    'memory_entries': int(os.getenv('ENRICHMENT_CACHE_MEMORY_ENTRIES', '10000')),
+    'memory_ttl': int(os.getenv('ENRICHMENT_CACHE_MEMORY_TTL', '3600')),
+    'negative_ttl': int(os.getenv('ENRICHMENT_CACHE_NEGATIVE_TTL', '3600')),
+    # Seconds a finished lookup is handed to identical callers without the cache; 0 shares in-flight calls only
+    'coalesce_share_for': float(os.getenv('ENRICHMENT_COALESCE_SHARE_FOR', '0')),
+    # Seconds a found result stays fresh, per source
+    'ttls': {
+        'hunter': int(os.getenv('HUNTER_CACHE_TTL', str(7 * 86400))),
+        'rocketreach': int(os.getenv('ROCKETREACH_CACHE_TTL', str(30 * 86400))),
+        'pdl': int(os.getenv('PDL_CACHE_TTL', str(30 * 86400))),
+        'lexisnexis': int(os.getenv('LEXISNEXIS_CACHE_TTL', str(86400))),
+        'clearbit': int(os.getenv('CLEARBIT_CACHE_TTL', str(30 * 86400))),
+        'zoominfo': int(os.getenv('ZOOMINFO_CACHE_TTL', str(30 * 86400))),
+        'apollo': int(os.getenv('APOLLO_CACHE_TTL', str(30 * 86400)))
+    },
+    # Cost of one paid call per source, used for the spend-avoided metric
+    'costs': {
+        source: float(os.getenv(f'{source.upper()}_COST_PER_CALL', '0'))
+        for source in ENRICHMENT_SOURCES
+    }
+}
+
+# Provider Micro-batching Configuration
+ENRICHMENT_BATCH_CONFIG: Dict[str, Any] = {
+    'enabled': os.getenv('ENRICHMENT_BATCHING_ENABLED', 'false').lower() == 'true',
+    # A batch is sent when it holds max_records or its first request has waited max_wait_ms
+    'max_records': int(os.getenv('ENRICHMENT_BATCH_MAX_RECORDS', '100')),
+    'max_wait_ms': float(os.getenv('ENRICHMENT_BATCH_MAX_WAIT_MS', '50'))
+}
+
+# Enrichment Source Planner Configuration
+ENRICHMENT_PLANNER_CONFIG: Dict[str, Any] = {
+    'enabled': os.getenv('ENRICHMENT_PLANNER_ENABLED', 'false').lower() == 'true',
+    # Profile fields enrichment tries to fill
+    'fields': [
+        'email', 'phone', 'title', 'linkedin_url', 'experience', 'education', 'skills',
+        'email_verification', 'background_check', 'company_info'
+    ],
+    # A call weighs 1 + cost * cost_weight + p95 seconds * latency_weight
+    'cost_weight': float(os.getenv('ENRICHMENT_PLANNER_COST_WEIGHT', '10')),
+    'latency_weight': float(os.getenv('ENRICHMENT_PLANNER_LATENCY_WEIGHT', '1')),
+    'max_waves': int(os.getenv('ENRICHMENT_PLANNER_MAX_WAVES', '3'))
+}
+
+# Per-field Freshness Configuration
+ENRICHMENT_FRESHNESS_CONFIG: Dict[str, Any] = {
+    # Seconds an enriched value stays fresh, per field class
+    'ttls': {
+        'verification': int(os.getenv('VERIFICATION_FIELD_TTL', str(7 * 86400))),
+        'contact': int(os.getenv('CONTACT_FIELD_TTL', str(30 * 86400))),
+        'employment': int(os.getenv('EMPLOYMENT_FIELD_TTL', str(14 * 86400))),
+        'company': int(os.getenv('COMPANY_FIELD_TTL', str(30 * 86400))),
+        'risk': int(os.getenv('RISK_FIELD_TTL', str(86400))),
+        'profile': int(os.getenv('PROFILE_FIELD_TTL', str(90 * 86400)))
+    },
+    'classes': {
+        'email_verification': 'verification',
+        'email': 'contact',
+        'phone': 'contact',
+        'linkedin_url': 'contact',
+        'title': 'employment',
+        'experience': 'employment',
+        'company_info': 'company',
+        'background_check': 'risk',
+        'education': 'profile',
+        'skills': 'profile'
+    },
+    'default_ttl': int(os.getenv('DEFAULT_FIELD_TTL', str(30 * 86400)))
+}
+
+# Entity Resolution Configuration
+ENTITY_RESOLUTION_CONFIG: Dict[str, Any] = {
+    'enabled': os.getenv('ENTITY_RESOLUTION_ENABLED', 'true').lower() == 'true',
+    # MinHash signature length, split into bands of num_perm / bands rows for LSH
+    'num_perm': int(os.getenv('ENTITY_RESOLUTION_NUM_PERM', '64')),
+    'bands': int(os.getenv('ENTITY_RESOLUTION_BANDS', '16')),
+    # Estimated Jaccard similarity above which an LSH candidate is the same person
+    'threshold': float(os.getenv('ENTITY_RESOLUTION_THRESHOLD', '0.5')),
+    # Entities an LSH bucket holds before it stops taking more
+    'max_bucket': int(os.getenv('ENTITY_RESOLUTION_MAX_BUCKET', '8')),
+    # Entities kept in memory; the oldest are dropped first
+    'max_entities': int(os.getenv('ENTITY_RESOLUTION_MAX_ENTITIES', '1000000')),
+    'free_email_domains': [
+        'gmail.com', 'googlemail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
+        'live.com', 'icloud.com', 'aol.com', 'proton.me', 'protonmail.com'
+    ]
+}
+
+# Adaptive Collection Concurrency Configuration
+COLLECTION_CONCURRENCY_CONFIG: Dict[str, Any] = {
+    'initial': int(os.getenv('COLLECTION_CONCURRENCY_INITIAL', '5')),
+    'min': int(os.getenv('COLLECTION_CONCURRENCY_MIN', '1')),
+    'max': int(os.getenv('COLLECTION_CONCURRENCY_MAX', '100')),
+    # Limit multiplier on a timeout, 429/503 or p95 rise
+    'backoff': float(os.getenv('COLLECTION_CONCURRENCY_BACKOFF', '0.5')),
+    # Completed requests per p95 sample
+    'window': int(os.getenv('COLLECTION_CONCURRENCY_WINDOW', '50')),
+    # A window p95 above the healthy baseline by this factor counts as overload
+    'latency_tolerance': float(os.getenv('COLLECTION_CONCURRENCY_LATENCY_TOLERANCE', '2.0'))
+}
+
+# Learned Selector Template Configuration
+SELECTOR_TEMPLATE_CONFIG: Dict[str, Any] = {
+    'path': os.getenv('SELECTOR_TEMPLATES_PATH', 'selector_templates.json'),
+    # Confirmations needed before a template replaces the LLM for a domain
+    'min_samples': int(os.getenv('SELECTOR_TEMPLATE_MIN_SAMPLES', '3')),
+    'min_confidence': float(os.getenv('SELECTOR_TEMPLATE_MIN_CONFIDENCE', '0.9'))
 }
 
 # Logging Configuration
@@ -11,6 +11,8 @@ from .brightdata_api import BrightDataAPI
 from .clearbit_api import ClearbitAPI
 from .apollo_api import ApolloAPI
 from .zoominfo_api import ZoomInfoAPI
+from .source_planner import get_source_planner
+from config.settings import ENRICHMENT_PLANNER_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +60,9 @@ class APIManager:
     
     async def collect_profile_data(self, profile_params: Dict[str, Any]) -> Dict[str, Any]:
         """Collect profile data from all available sources."""
+        if ENRICHMENT_PLANNER_CONFIG['enabled']:
+            return await self._collect_planned(profile_params)
+        
         tasks = [
             self._collect_linkedin_data(profile_params),
             self._collect_contact_data(profile_params),
@@ -69,6 +74,37 @@ class APIManager:
         
         return self._combine_results(results)
     
+    async def _collect_planned(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect only from the sources likely to fill what the profile lacks."""
+        fetchers = {
+            'linkedin': self._collect_linkedin_data,
+            'hunter': self._verify_email,
+            'rocketreach': self.apis['rocketreach'].lookup_person,
+            'apollo': lambda p: self.apis['apollo'].search_people({'email': p.get('email')}),
+            'clearbit': lambda p: self.apis['clearbit'].enrich_company(p['company_domain']),
+            'zoominfo': lambda p: self.apis['zoominfo'].enrich_company(p['company_domain']),
+            'pdl': self.apis['pdl'].enrich_person,
+            'lexisnexis': self.apis['lexisnexis'].comprehensive_person_check
+        }
+        results, _ = await get_source_planner().run(params, fetchers)
+        
+        def ran(*sources: str) -> List[Any]:
+            return [results[source] for source in sources if source in results]
+        
+        grouped = [
+            results.get('linkedin', {}),
+            self._combine_contact_data(ran('hunter', 'rocketreach', 'apollo')),
+            self._combine_company_data(ran('clearbit', 'zoominfo')),
+            self._combine_enrichment_data(ran('pdl', 'lexisnexis'))
+        ]
+        return self._combine_results(grouped)
+    
+    async def _verify_email(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Verify the profile's email with Hunter.io, if it has one."""
+        if email := params.get('email'):
+            return await self.apis['hunter'].verify_email(email)
+        return {}
+    
     async def _collect_linkedin_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Collect data from LinkedIn."""
         try:
@@ -2,6 +2,8 @@ from typing import Dict, Any, List
 import aiohttp
 import logging
 from .base import BaseIntegration
+from cache.enrichment_cache import cached_lookup
+from .singleflight import coalesced
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,8 @@ class ApolloAPI(BaseIntegration):
             logger.error(f"Apollo people search error: {str(e)}")
             raise
     
+    @coalesced('apollo', 'enrich_person')
+    @cached_lookup('apollo', 'enrich_person')
     async def enrich_person(self, email: str) -> Dict[str, Any]:
         """Enrich person data using email."""
         try:
@@ -45,6 +49,8 @@ class ApolloAPI(BaseIntegration):
             logger.error(f"Apollo person enrichment error: {str(e)}")
             raise
     
+    @coalesced('apollo', 'get_organization')
+    @cached_lookup('apollo', 'get_organization')
     async def get_organization(self, domain: str) -> Dict[str, Any]:
         """Get organization data using domain."""
         try:
@@ -2,6 +2,8 @@ from typing import Dict, Any
 import aiohttp
 import logging
 from .base import BaseIntegration
+from cache.enrichment_cache import cached_lookup
+from .singleflight import coalesced
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,8 @@ class ClearbitAPI(BaseIntegration):
             'Content-Type': 'application/json'
         }
     
+    @coalesced('clearbit', 'enrich_person')
+    @cached_lookup('clearbit', 'enrich_person')
     async def enrich_person(self, email: str) -> Dict[str, Any]:
         """Enrich person data using email."""
         try:
@@ -30,6 +34,8 @@ class ClearbitAPI(BaseIntegration):
             logger.error(f"Clearbit person enrichment error: {str(e)}")
             raise
     
+    @coalesced('clearbit', 'enrich_company')
+    @cached_lookup('clearbit', 'enrich_company')
     async def enrich_company(self, domain: str) -> Dict[str, Any]:
         """Enrich company data using domain."""
         try:
@@ -0,0 +1,72 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Set
+from config.settings import ENRICHMENT_FRESHNESS_CONFIG
+from monitoring.prometheus_metrics import enrichment_field_refreshes
+
+logger = logging.getLogger(__name__)
+
+PROVENANCE_KEY = 'field_provenance'
+
+def field_class(field: str, config: Optional[Dict[str, Any]] = None) -> str:
+    config = config or ENRICHMENT_FRESHNESS_CONFIG
+    return config['classes'].get(field, 'default')
+
+def field_ttl(field: str, config: Optional[Dict[str, Any]] = None) -> timedelta:
+    """How long an enriched value of this field stays fresh"""
+    config = config or ENRICHMENT_FRESHNESS_CONFIG
+    seconds = config['ttls'].get(field_class(field, config), config['default_ttl'])
+    return timedelta(seconds=seconds)
+
+def stamp(
+    record: Dict[str, Any],
+    filled: Dict[str, str],
+    attempted: Iterable[str],
+    now: datetime,
+    config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Record when and from which source each attempted field was fetched.
+
+    `attempted` should only hold fields a source was actually asked for.
+    Those it could not fill are stamped with a `None` source, so a miss
+    is not retried before the field's TTL runs out either.
+    """
+    provenance = dict(record.get(PROVENANCE_KEY) or {})
+    for field in attempted:
+        source = filled.get(field)
+        provenance[field] = {'source': source, 'fetched_at': now.isoformat()}
+        enrichment_field_refreshes.labels(
+            field_class=field_class(field, config),
+            result='filled' if source else 'unfilled'
+        ).inc()
+    record[PROVENANCE_KEY] = provenance
+    return record
+
+def expired_fields(
+    record: Dict[str, Any],
+    wanted: Iterable[str],
+    now: datetime,
+    default_fetched_at: Optional[datetime] = None,
+    config: Optional[Dict[str, Any]] = None
+) -> Set[str]:
+    """Wanted fields that are due for enrichment at `now`.
+
+    A field is due once its TTL has passed since it was last fetched.
+    Fields without provenance count as fetched at `default_fetched_at`,
+    e.g. the profile's last update; without one they are always due.
+    """
+    provenance = record.get(PROVENANCE_KEY) or {}
+    due = set()
+    for field in wanted:
+        entry = provenance.get(field)
+        if entry:
+            try:
+                fetched_at = datetime.fromisoformat(entry['fetched_at'])
+            except (KeyError, TypeError, ValueError):
+                logger.warning(f"Unreadable provenance for {field}: {entry}")
+                fetched_at = None
+        else:
+            fetched_at = default_fetched_at
+        if fetched_at is None or fetched_at + field_ttl(field, config) <= now:
+            due.add(field)
+    return due
@@ -2,6 +2,8 @@ from typing import Dict, Any, Optional
 import aiohttp
 import logging
 from .base import BaseIntegration
+from cache.enrichment_cache import cached_lookup
+from .singleflight import coalesced
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +13,8 @@ class HunterAPI(BaseIntegration):
         self.api_key = api_key
         self.base_url = "https://api.hunter.io/v2"
         
+    @coalesced('hunter', 'find_email')
+    @cached_lookup('hunter', 'find_email')
     async def find_email(self, domain: str, full_name: str = None) -> Dict[str, Any]:
         """Find email addresses for a domain or person."""
         params = {
@@ -23,6 +27,8 @@ class HunterAPI(BaseIntegration):
             
         return await self._make_request(f"{self.base_url}/email-finder", params=params)
     
+    @coalesced('hunter', 'verify_email')
+    @cached_lookup('hunter', 'verify_email')
     async def verify_email(self, email: str) -> Dict[str, Any]:
         """Verify an email address."""
         params = {
@@ -32,6 +38,8 @@ class HunterAPI(BaseIntegration):
         
         return await self._make_request(f"{self.base_url}/email-verifier", params=params)
     
+    @coalesced('hunter', 'domain_search')
+    @cached_lookup('hunter', 'domain_search')
     async def domain_search(self, domain: str, limit: int = 10) -> Dict[str, Any]:
         """Search for email addresses in a domain."""
         params = {
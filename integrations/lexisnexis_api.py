@@ -3,9 +3,22 @@ import logging
 from typing import Dict, Any
 from datetime import datetime
 from .base import BaseIntegration
+from cache.enrichment_cache import cached_lookup
+from .singleflight import coalesced
 
 logger = logging.getLogger(__name__)
 
+# Background check sections fetched by person id, and their endpoints
+SECTIONS = {
+    'professional_background': 'professional-background',
+    'public_records': 'public-records',
+    'risk_assessment': 'risk-assessment'
+}
+
+def _complete(result: Dict[str, Any]) -> bool:
+    """Whether every part of a comprehensive check came back"""
+    return not result.get('failed_checks')
+
 class LexisNexisAPI(BaseIntegration):
     def __init__(self, api_key: str):
         super().__init__()
@@ -45,49 +58,63 @@ class LexisNexisAPI(BaseIntegration):
 
     async def get_professional_background(self, person_id: str) -> Dict[str, Any]:
         """Retrieve professional background information."""
-        endpoint = f"{self.base_url}/professional-background/{person_id}"
-        
         try:
-            return await self._make_request(endpoint)
+            return await self._get_section('professional_background', person_id)
         except Exception as e:
             logger.error(f"Error fetching professional background: {str(e)}")
             return {}
 
     async def get_public_records(self, person_id: str) -> Dict[str, Any]:
         """Retrieve public records information."""
-        endpoint = f"{self.base_url}/public-records/{person_id}"
-        
         try:
-            return await self._make_request(endpoint)
+            return await self._get_section('public_records', person_id)
         except Exception as e:
             logger.error(f"Error fetching public records: {str(e)}")
             return {}
 
     async def get_risk_indicators(self, person_id: str) -> Dict[str, Any]:
         """Retrieve risk assessment indicators."""
-        endpoint = f"{self.base_url}/risk-assessment/{person_id}"
-        
         try:
-            return await self._make_request(endpoint)
+            return await self._get_section('risk_assessment', person_id)
         except Exception as e:
             logger.error(f"Error fetching risk indicators: {str(e)}")
             return {}
 
+    async def _get_section(self, section: str, person_id: str) -> Dict[str, Any]:
+        return await self._make_request(f"{self.base_url}/{SECTIONS[section]}/{person_id}")
+
+    @coalesced('lexisnexis', 'comprehensive_person_check')
+    @cached_lookup('lexisnexis', 'comprehensive_person_check', cacheable=_complete)
     async def comprehensive_person_check(self, person_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Perform a comprehensive background check."""
+        """Perform a comprehensive background check.
+        
+        Sections that fail come back empty and are listed in `failed_checks`;
+        such a partial result is not cached.
+        """
         try:
-            identity_result, professional_result, public_result, risk_result = await asyncio.gather(
+            identity_result, *sections = await asyncio.gather(
                 self.verify_identity(person_data),
-                self.get_professional_background(person_data['id']),
-                self.get_public_records(person_data['id']),
-                self.get_risk_indicators(person_data['id'])
+                *(self._get_section(section, person_data['id']) for section in SECTIONS),
+                return_exceptions=True
             )
+            if isinstance(identity_result, Exception):
+                raise identity_result
+            
+            failed_checks = []
+            for section, result in zip(SECTIONS, sections):
+                if isinstance(result, Exception):
+                    logger.error(f"Error fetching {section.replace('_', ' ')}: {str(result)}")
+                    failed_checks.append(section)
+            professional_result, public_result, risk_result = [
+                {} if isinstance(result, Exception) else result for result in sections
+            ]
             
             return {
                 "identity_verification": identity_result,
                 "professional_background": professional_result,
                 "public_records": public_result,
                 "risk_assessment": risk_result,
+                "failed_checks": failed_checks,
                 "verification_timestamp": datetime.now().isoformat(),
                 "verification_status": self._determine_verification_status(
                     identity_result,
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+from monitoring.prometheus_metrics import provider_batch_size
+
+logger = logging.getLogger(__name__)
+
+SendBatch = Callable[[List[Any]], Awaitable[List[Any]]]
+
+class MicroBatcher:
+    """Collects single requests into bulk calls.
+
+    A batch is sent once it holds `max_size` requests or its first request
+    has waited `max_wait` seconds. `send_batch` returns one result per
+    request, in order; a result that is an exception is raised to that
+    request's caller only, while a failed bulk call fails the whole batch.
+    """
+
+    def __init__(self, send_batch: SendBatch, max_size: int = 100, max_wait: float = 0.05, source: str = 'batch'):
+        self.send_batch = send_batch
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.source = source
+        self.pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._sending: set = set()
+        self.stats = {'requests': 0, 'batches': 0}
+
+    async def submit(self, request: Any) -> Any:
+        """Queue one request and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((request, future))
+        self.stats['requests'] += 1
+        if len(self.pending) >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self.flush)
+        return await future
+
+    def flush(self):
+        """Send whatever is pending now"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self.pending = self.pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: List[Tuple[Any, asyncio.Future]]):
+        self.stats['batches'] += 1
+        provider_batch_size.labels(source=self.source).observe(len(batch))
+        try:
+            results = await self.send_batch([request for request, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"{self.source} bulk call returned {len(results)} results for {len(batch)} requests")
+        except Exception as e:
+            logger.error(f"{self.source} bulk call failed for {len(batch)} requests: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self):
+        """Send what is pending and wait for every bulk call in flight"""
+        self.flush()
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
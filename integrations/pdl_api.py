@@ -1,12 +1,16 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import aiohttp
 import logging
 from .base import BaseIntegration
+from cache.enrichment_cache import cached_lookup
+from .singleflight import coalesced
+from .micro_batcher import MicroBatcher
+from config.settings import ENRICHMENT_BATCH_CONFIG
 
 logger = logging.getLogger(__name__)
 
 class PeopleDataLabsAPI(BaseIntegration):
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, batching: Optional[bool] = None):
         super().__init__()
         self.api_key = api_key
         self.base_url = "https://api.peopledatalabs.com/v5"
@@ -14,12 +18,49 @@ class PeopleDataLabsAPI(BaseIntegration):
             "X-Api-Key": api_key,
             "Content-Type": "application/json"
         }
+        if batching is None:
+            batching = ENRICHMENT_BATCH_CONFIG['enabled']
+        self.batcher = MicroBatcher(
+            self._enrich_batch,
+            max_size=ENRICHMENT_BATCH_CONFIG['max_records'],
+            max_wait=ENRICHMENT_BATCH_CONFIG['max_wait_ms'] / 1000,
+            source='pdl'
+        ) if batching else None
     
+    @coalesced('pdl', 'enrich_person')
+    @cached_lookup('pdl', 'enrich_person')
     async def enrich_person(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Enrich a person's profile with additional data."""
+        if self.batcher is not None:
+            return await self.batcher.submit(params)
+        return await self._enrich_one(params)
+    
+    async def _enrich_one(self, params: Dict[str, Any]) -> Dict[str, Any]:
         endpoint = f"{self.base_url}/person/enrich"
         return await self._make_request(endpoint, params=params)
     
+    async def _enrich_batch(self, batch: List[Dict[str, Any]]) -> List[Any]:
+        """Send micro-batched enrich requests as one bulk call, a lone request on its own."""
+        if len(batch) == 1:
+            try:
+                return [await self._enrich_one(batch[0])]
+            except Exception as e:
+                return [e]
+        responses = await self.bulk_enrich(batch)
+        return [self._bulk_result(response) for response in responses]
+    
+    def _bulk_result(self, response: Dict[str, Any]) -> Any:
+        """One bulk response as `enrich_person` would have returned it."""
+        status = response.get('status', 200) if isinstance(response, dict) else 200
+        if status == 200:
+            return response
+        if status == 404:
+            # Not found, which the enrichment paths and cache treat as empty
+            return {}
+        return RuntimeError(f"People Data Labs bulk enrich failed with status {status}: {response.get('error')}")
+    
+    @coalesced('pdl', 'enrich_company')
+    @cached_lookup('pdl', 'enrich_company')
     async def enrich_company(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Enrich company data."""
         endpoint = f"{self.base_url}/company/enrich"
@@ -31,9 +72,14 @@ class PeopleDataLabsAPI(BaseIntegration):
         return await self._make_request(endpoint, data=query, method="POST")
     
     async def bulk_enrich(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Perform bulk enrichment of multiple records."""
-        endpoint = f"{self.base_url}/person/bulk_enrich"
-        return await self._make_request(endpoint, data={"records": records}, method="POST")
+        """Perform bulk enrichment of multiple records.
+
+        Each record is the params of one person enrich request; the responses
+        come back in request order, each with its own status.
+        """
+        endpoint = f"{self.base_url}/person/bulk"
+        payload = {"requests": [{"params": params} for params in records]}
+        return await self._make_request(endpoint, data=payload, method="POST")
     
     async def _make_request(
         self,
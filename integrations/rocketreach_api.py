@@ -2,6 +2,8 @@ from typing import Dict, Any, List
 import aiohttp
 import logging
 from .base import BaseIntegration
+from cache.enrichment_cache import cached_lookup
+from .singleflight import coalesced
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,8 @@ class RocketReachAPI(BaseIntegration):
             "Content-Type": "application/json"
         }
     
+    @coalesced('rocketreach', 'lookup_person')
+    @cached_lookup('rocketreach', 'lookup_person')
     async def lookup_person(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Look up a person's profile."""
         endpoint = f"{self.base_url}/person/lookup"
@@ -25,11 +29,15 @@ class RocketReachAPI(BaseIntegration):
         endpoint = f"{self.base_url}/person/search"
         return await self._make_request(endpoint, data=query)
     
+    @coalesced('rocketreach', 'lookup_company')
+    @cached_lookup('rocketreach', 'lookup_company')
     async def lookup_company(self, domain: str) -> Dict[str, Any]:
         """Look up company information."""
         endpoint = f"{self.base_url}/company/lookup"
         return await self._make_request(endpoint, data={"domain": domain})
     
+    @coalesced('rocketreach', 'get_contact_details')
+    @cached_lookup('rocketreach', 'get_contact_details')
     async def get_contact_details(self, profile_id: str) -> Dict[str, Any]:
         """Get detailed contact information for a profile."""
         endpoint = f"{self.base_url}/person/detail/{profile_id}"
@@ -0,0 +1,99 @@
+import asyncio
+import copy
+import functools
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+from cache.enrichment_cache import call_identity, lookup_key
+from config.settings import ENRICHMENT_CACHE_CONFIG
+from monitoring.prometheus_metrics import enrichment_coalesced_requests
+
+logger = logging.getLogger(__name__)
+
+MAX_RECENT = 10000
+
+class SingleFlight:
+    """Collapses concurrent identical calls into one.
+
+    The first caller for a key runs the loader; callers arriving while it
+    is in flight await the same future. With `share_for`, a finished
+    result is also handed to identical callers for that many seconds.
+    Failures are shared with the callers already waiting but never kept.
+    """
+
+    def __init__(self, source: str, share_for: float = 0.0):
+        self.source = source
+        self.share_for = share_for
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self.recent: Dict[str, Tuple[float, Any]] = {}
+        self.stats = {'calls': 0, 'coalesced': 0, 'shared': 0}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `loader` unless an identical call is in flight or just finished"""
+        while True:
+            if self.share_for:
+                recent = self.recent.get(key)
+                if recent and recent[0] > time.monotonic():
+                    self.stats['shared'] += 1
+                    enrichment_coalesced_requests.labels(source=self.source, result='shared').inc()
+                    return copy.deepcopy(recent[1])
+                self.recent.pop(key, None)
+
+            future = self.in_flight.get(key)
+            if future is None:
+                return await self._lead(key, loader)
+
+            self.stats['coalesced'] += 1
+            enrichment_coalesced_requests.labels(source=self.source, result='coalesced').inc()
+            try:
+                return copy.deepcopy(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                # The leading caller was cancelled, not us: try again
+                if not future.cancelled():
+                    raise
+
+    async def _lead(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting to retrieve a failure
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self.in_flight[key] = future
+        self.stats['calls'] += 1
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            if self.share_for:
+                now = time.monotonic()
+                if len(self.recent) >= MAX_RECENT:
+                    self.recent = {k: v for k, v in self.recent.items() if v[0] > now}
+                self.recent[key] = (now + self.share_for, result)
+            return copy.deepcopy(result)
+        finally:
+            self.in_flight.pop(key, None)
+
+_flights: Dict[str, SingleFlight] = {}
+
+def get_single_flight(source: str) -> SingleFlight:
+    """The process-wide coalescing layer for one provider"""
+    if source not in _flights:
+        _flights[source] = SingleFlight(source, ENRICHMENT_CACHE_CONFIG['coalesce_share_for'])
+    return _flights[source]
+
+def coalesced(source: str, operation: str):
+    """Share one upstream call between concurrent identical calls of a client method"""
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = lookup_key(source, operation, call_identity(signature, self, args, kwargs))
+            return await get_single_flight(source).do(key, lambda: func(self, *args, **kwargs))
+        return wrapper
+    return decorator
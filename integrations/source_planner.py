@@ -0,0 +1,273 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+from config.settings import ENRICHMENT_CACHE_CONFIG, ENRICHMENT_PLANNER_CONFIG
+from integrations.field_provenance import PROVENANCE_KEY
+from monitoring.prometheus_metrics import enrichment_planner_calls
+
+logger = logging.getLogger(__name__)
+
+Fetcher = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+@dataclass
+class SourceSpec:
+    """What one provider lookup can fill, what it needs and its prior hit rate"""
+    name: str
+    # Profile field -> response keys that fill it, in the raw provider
+    # response or the enrichment stage's wrapped form
+    fields: Dict[str, List[str]]
+    # At least one of these profile fields must be present to call the source
+    requires_any: Tuple[str, ...] = ()
+    coverage: float = 0.5
+
+    def filled(self, result: Any) -> Set[str]:
+        """Profile fields a lookup result actually provides"""
+        found = _present_keys(result, {key for keys in self.fields.values() for key in keys})
+        return {name for name, keys in self.fields.items() if found.intersection(keys)}
+
+SOURCE_CATALOG: Dict[str, SourceSpec] = {
+    'linkedin': SourceSpec('linkedin', {
+        'title': ['current_position', 'headline'],
+        'experience': ['experience'],
+        'education': ['education'],
+        'skills': ['skills']
+    }, requires_any=('linkedin_url',), coverage=0.8),
+    'hunter': SourceSpec('hunter', {
+        'email_verification': ['email_verification', 'result'],
+        'company_emails': ['company_emails', 'emails']
+    }, requires_any=('email', 'company_domain'), coverage=0.9),
+    'rocketreach': SourceSpec('rocketreach', {
+        'email': ['emails'],
+        'phone': ['phones'],
+        'title': ['current_title'],
+        'linkedin_url': ['linkedin_url']
+    }, requires_any=('first_name', 'last_name'), coverage=0.5),
+    'apollo': SourceSpec('apollo', {
+        'phone': ['phone_numbers'],
+        'title': ['title'],
+        'linkedin_url': ['linkedin_url']
+    }, requires_any=('email',), coverage=0.5),
+    'pdl': SourceSpec('pdl', {
+        'email': ['work_email', 'personal_emails'],
+        'phone': ['mobile_phone', 'phone_numbers'],
+        'title': ['job_title'],
+        'linkedin_url': ['linkedin_url'],
+        'experience': ['experience'],
+        'education': ['education'],
+        'skills': ['skills']
+    }, requires_any=('linkedin_url', 'email'), coverage=0.6),
+    'lexisnexis': SourceSpec('lexisnexis', {
+        'background_check': ['identity_verification', 'risk_assessment']
+    }, requires_any=('last_name',), coverage=0.7),
+    'clearbit': SourceSpec('clearbit', {
+        'company_info': ['metrics', 'category', 'legalName']
+    }, requires_any=('company_domain',), coverage=0.7),
+    'zoominfo': SourceSpec('zoominfo', {
+        'company_info': ['employeeCount', 'revenue', 'industries']
+    }, requires_any=('company_domain',), coverage=0.6)
+}
+
+def _present_keys(data: Any, keys: Set[str]) -> Set[str]:
+    """Which of `keys` hold a non-empty value anywhere in a nested result"""
+    found: Set[str] = set()
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in keys and value not in (None, '', [], {}):
+                    found.add(key)
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(node)
+    return found
+
+def filled_by(results: Dict[str, Any], catalog: Optional[Dict[str, SourceSpec]] = None) -> Dict[str, str]:
+    """The first source, in call order, that filled each field"""
+    catalog = catalog or SOURCE_CATALOG
+    filled: Dict[str, str] = {}
+    for name, result in results.items():
+        if name in catalog and not isinstance(result, Exception):
+            for field_name in catalog[name].filled(result):
+                filled.setdefault(field_name, name)
+    return filled
+
+def covered_by(results: Dict[str, Any], catalog: Optional[Dict[str, SourceSpec]] = None) -> Set[str]:
+    """Fields the sources that answered could have filled, whether or not they did"""
+    catalog = catalog or SOURCE_CATALOG
+    return {
+        field_name
+        for name, result in results.items() if name in catalog and not isinstance(result, Exception)
+        for field_name in catalog[name].fields
+    }
+
+def missing_fields(profile: Dict[str, Any], wanted: Iterable[str], stale: Iterable[str] = ()) -> Set[str]:
+    """Wanted fields the profile has no value for, plus any known to be stale.
+
+    Only the profile's own top-level fields count, or fields its provenance
+    says a source filled into a wrapped result; a `title` nested in
+    `experience` does not make the current title present.
+    """
+    provenance = profile.get(PROVENANCE_KEY) or {}
+    present = {
+        name for name in wanted
+        if profile.get(name) not in (None, '', [], {}) or (provenance.get(name) or {}).get('source')
+    }
+    return (set(wanted) - present) | set(stale)
+
+class SourceStats:
+    """Observed per-source fill rates and recent latencies"""
+
+    def __init__(self, window: int = 200, prior_weight: float = 10.0):
+        self.window = window
+        self.prior_weight = prior_weight
+        self.latencies: Dict[str, Deque[float]] = {}
+        self.attempts: Dict[Tuple[str, str], int] = {}
+        self.fills: Dict[Tuple[str, str], int] = {}
+
+    def record(self, source: str, attempted: Iterable[str], filled: Iterable[str], latency: float):
+        self.latencies.setdefault(source, deque(maxlen=self.window)).append(latency)
+        filled = set(filled)
+        for name in attempted:
+            self.attempts[(source, name)] = self.attempts.get((source, name), 0) + 1
+            if name in filled:
+                self.fills[(source, name)] = self.fills.get((source, name), 0) + 1
+
+    def coverage(self, spec: SourceSpec, name: str) -> float:
+        """Chance the source fills a field, the catalog prior smoothed by observations"""
+        attempts = self.attempts.get((spec.name, name), 0)
+        fills = self.fills.get((spec.name, name), 0)
+        return (fills + spec.coverage * self.prior_weight) / (attempts + self.prior_weight)
+
+    def p95(self, source: str, default: float = 1.0) -> float:
+        samples = self.latencies.get(source)
+        if not samples:
+            return default
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+class SourcePlanner:
+    """Picks the fewest, cheapest and fastest lookups likely to fill what a profile lacks.
+
+    Sources are chosen greedily by expected fields filled per unit of
+    weight, where a call weighs 1 plus its cost and p95 latency scaled by
+    the configured weights. The chosen wave runs concurrently; sources
+    not yet tried are only planned for the fields the wave left empty.
+    """
+
+    def __init__(
+        self,
+        catalog: Optional[Dict[str, SourceSpec]] = None,
+        stats: Optional[SourceStats] = None,
+        config: Optional[Dict[str, Any]] = None,
+        costs: Optional[Dict[str, float]] = None
+    ):
+        self.catalog = catalog or SOURCE_CATALOG
+        self.stats = stats or SourceStats()
+        self.config = config or ENRICHMENT_PLANNER_CONFIG
+        self.costs = costs if costs is not None else ENRICHMENT_CACHE_CONFIG['costs']
+
+    def weight(self, source: str) -> float:
+        return (
+            1.0
+            + self.costs.get(source, 0.0) * self.config['cost_weight']
+            + self.stats.p95(source) * self.config['latency_weight']
+        )
+
+    def callable_sources(self, profile: Dict[str, Any], available: Iterable[str]) -> List[str]:
+        present = _present_keys(profile, {name for spec in self.catalog.values() for name in spec.requires_any})
+        return [
+            name for name in available
+            if name in self.catalog and (
+                not self.catalog[name].requires_any or present.intersection(self.catalog[name].requires_any)
+            )
+        ]
+
+    def next_wave(self, missing: Set[str], candidates: Iterable[str]) -> List[str]:
+        """Greedy cover of the missing fields by the untried candidates"""
+        uncovered = set(missing)
+        remaining = list(candidates)
+        wave: List[str] = []
+        while uncovered and remaining:
+            def score(name: str) -> float:
+                spec = self.catalog[name]
+                gain = sum(self.stats.coverage(spec, field) for field in uncovered if field in spec.fields)
+                return gain / self.weight(name)
+
+            best = max(remaining, key=score)
+            if score(best) <= 0:
+                break
+            wave.append(best)
+            remaining.remove(best)
+            uncovered -= set(self.catalog[best].fields)
+        return wave
+
+    def plan(
+        self,
+        profile: Dict[str, Any],
+        sources: Iterable[str],
+        wanted: Optional[Iterable[str]] = None,
+        stale: Iterable[str] = ()
+    ) -> List[str]:
+        """The first wave `run` would call, without calling anything"""
+        missing = missing_fields(profile, list(wanted or self.config['fields']), stale)
+        return self.next_wave(missing, self.callable_sources(profile, sources))
+
+    async def run(
+        self,
+        profile: Dict[str, Any],
+        fetchers: Dict[str, Fetcher],
+        wanted: Optional[Iterable[str]] = None,
+        stale: Iterable[str] = ()
+    ) -> Tuple[Dict[str, Any], Set[str]]:
+        """Call sources wave by wave until the wanted fields are filled.
+
+        Returns each called source's result (an exception if it raised)
+        and the fields still missing.
+        """
+        wanted = list(wanted or self.config['fields'])
+        missing = missing_fields(profile, wanted, stale)
+        candidates = self.callable_sources(profile, fetchers)
+        results: Dict[str, Any] = {}
+
+        for _ in range(self.config['max_waves']):
+            wave = self.next_wave(missing, candidates)
+            if not wave:
+                break
+            outcomes = await asyncio.gather(*(self._timed(fetchers[name], profile) for name in wave))
+            attempted = set(missing)
+            for name, (result, elapsed) in zip(wave, outcomes):
+                spec = self.catalog[name]
+                filled = set() if isinstance(result, Exception) else spec.filled(result)
+                self.stats.record(name, attempted.intersection(spec.fields), filled, elapsed)
+                results[name] = result
+                missing -= filled
+                candidates.remove(name)
+                enrichment_planner_calls.labels(source=name, result='called').inc()
+
+        for name in fetchers:
+            if name not in results:
+                enrichment_planner_calls.labels(source=name, result='skipped').inc()
+        return results, missing
+
+    async def _timed(self, fetch: Fetcher, profile: Dict[str, Any]) -> Tuple[Any, float]:
+        start = time.monotonic()
+        try:
+            result = await fetch(profile)
+        except Exception as e:
+            logger.warning(f"Planned enrichment lookup failed: {str(e)}")
+            result = e
+        return result, time.monotonic() - start
+
+_planner: Optional[SourcePlanner] = None
+
+def get_source_planner() -> SourcePlanner:
+    """The process-wide planner, so statistics accumulate across callers"""
+    global _planner
+    if _planner is None:
+        _planner = SourcePlanner()
+    return _planner
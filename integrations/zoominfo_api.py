@@ -2,6 +2,8 @@ from typing import Dict, Any, List
 import aiohttp
 import logging
 from .base import BaseIntegration
+from cache.enrichment_cache import cached_lookup
+from .singleflight import coalesced
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,8 @@ class ZoomInfoAPI(BaseIntegration):
             logger.error(f"ZoomInfo contact search error: {str(e)}")
             raise
     
+    @coalesced('zoominfo', 'enrich_company')
+    @cached_lookup('zoominfo', 'enrich_company')
     async def enrich_company(self, domain: str) -> Dict[str, Any]:
         """Enrich company data using domain."""
         try:
@@ -62,6 +66,8 @@ class ZoomInfoAPI(BaseIntegration):
             logger.error(f"ZoomInfo company enrichment error: {str(e)}")
             raise
     
+    @coalesced('zoominfo', 'enrich_contact')
+    @cached_lookup('zoominfo', 'enrich_contact')
     async def enrich_contact(self, email: str) -> Dict[str, Any]:
         """Enrich contact data using email."""
         try:
@@ -0,0 +1,35 @@
+from typing import Dict, Any, Tuple
+from .base import LLMBackend, LLMBackendError, count_tokens
+from .ollama_backend import OllamaBackend
+from .fake_backend import FakeLLMBackend
+
+BACKENDS = {
+    'ollama': OllamaBackend,
+    'fake': FakeLLMBackend
+}
+
+_instances: Dict[Tuple, LLMBackend] = {}
+
+def get_backend(kind: str = 'ollama', **options: Any) -> LLMBackend:
+    """Get a shared backend instance, creating it on first use.
+
+    Instances are cached by kind and options so repeated calls with the same
+    settings reuse one client instead of reconnecting.
+    """
+    if kind not in BACKENDS:
+        raise LLMBackendError(f"Unknown LLM backend: {kind}")
+
+    key = (kind, tuple(sorted(options.items())))
+    if key not in _instances:
+        _instances[key] = BACKENDS[kind](**options)
+    return _instances[key]
+
+__all__ = [
+    'LLMBackend',
+    'LLMBackendError',
+    'OllamaBackend',
+    'FakeLLMBackend',
+    'BACKENDS',
+    'get_backend',
+    'count_tokens'
+]
@@ -0,0 +1,56 @@
+from typing import Dict, Any
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+def count_tokens(text: str) -> int:
+    """Approximate the token count of a text by its whitespace-separated words."""
+    return len(text.split()) if text else 0
+
+class LLMBackend(ABC):
+    """Interface for LLM backends used by the parse stage.
+
+    Backends are created once and reused across calls, so implementations
+    should hold on to their clients instead of rebuilding them per request.
+    """
+
+    name = 'base'
+
+    def __init__(self):
+        self.stats = {
+            'calls': 0,
+            'errors': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0
+        }
+
+    @abstractmethod
+    def generate(self, prompt: str) -> str:
+        """Generate a completion for a prompt."""
+        pass
+
+    async def agenerate(self, prompt: str) -> str:
+        """Generate a completion without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.generate, prompt)
+
+    def _record_call(self, prompt: str, completion: str):
+        """Record token usage for a completed call."""
+        self.stats['calls'] += 1
+        self.stats['prompt_tokens'] += count_tokens(prompt)
+        self.stats['completion_tokens'] += count_tokens(completion)
+
+    def reset_stats(self):
+        """Reset the usage counters."""
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def close(self):
+        """Release any resources held by the backend."""
+        pass
+
+class LLMBackendError(Exception):
+    """Raised when an LLM backend cannot serve a request."""
+    pass
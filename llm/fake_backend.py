@@ -0,0 +1,106 @@
+from typing import Dict, Optional
+import asyncio
+import hashlib
+import logging
+import random
+import threading
+import time
+from .base import LLMBackend, count_tokens
+
+logger = logging.getLogger(__name__)
+
+class FakeLLMBackend(LLMBackend):
+    """Deterministic LLM stand-in that simulates latency and concurrency limits.
+
+    Latency follows a simple serving model: a fixed per-request overhead, a
+    prefill cost per prompt token and a decode cost per completion token.
+    At most `max_concurrency` requests are served at once; the rest queue,
+    the same way a model server with a fixed number of slots behaves.
+    """
+
+    name = 'fake'
+
+    def __init__(
+        self,
+        base_latency_ms: float = 50.0,
+        prefill_ms_per_token: float = 0.05,
+        decode_ms_per_token: float = 2.0,
+        max_concurrency: int = 4,
+        completion_tokens: int = 20,
+        seed: int = 0
+    ):
+        super().__init__()
+        self.base_latency_ms = base_latency_ms
+        self.prefill_ms_per_token = prefill_ms_per_token
+        self.decode_ms_per_token = decode_ms_per_token
+        self.max_concurrency = max_concurrency
+        self.completion_tokens = completion_tokens
+        self.seed = seed
+        self._thread_slots = threading.BoundedSemaphore(max_concurrency)
+        self._async_slots: Dict[int, asyncio.Semaphore] = {}
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def complete(self, prompt: str) -> str:
+        """Build the deterministic completion for a prompt."""
+        words = prompt.split()
+        if not words:
+            return ""
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode()).hexdigest()
+        rng = random.Random(digest)
+        return " ".join(rng.choice(words) for _ in range(self.completion_tokens))
+
+    def latency(self, prompt: str, completion: str) -> float:
+        """Simulated service time in seconds for a prompt/completion pair."""
+        millis = (
+            self.base_latency_ms
+            + self.prefill_ms_per_token * count_tokens(prompt)
+            + self.decode_ms_per_token * count_tokens(completion)
+        )
+        return millis / 1000.0
+
+    def generate(self, prompt: str) -> str:
+        """Serve a completion, blocking the calling thread."""
+        completion = self.complete(prompt)
+        with self._thread_slots:
+            self._enter()
+            try:
+                time.sleep(self.latency(prompt, completion))
+            finally:
+                self._exit()
+        self._record_call(prompt, completion)
+        return completion
+
+    async def agenerate(self, prompt: str) -> str:
+        """Serve a completion without blocking the event loop."""
+        completion = self.complete(prompt)
+        async with self._slots():
+            self._enter()
+            try:
+                await asyncio.sleep(self.latency(prompt, completion))
+            finally:
+                self._exit()
+        self._record_call(prompt, completion)
+        return completion
+
+    def _slots(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop."""
+        loop_id = id(asyncio.get_running_loop())
+        if loop_id not in self._async_slots:
+            self._async_slots[loop_id] = asyncio.Semaphore(self.max_concurrency)
+        return self._async_slots[loop_id]
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _exit(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def reset_stats(self):
+        """Reset the usage counters and the in-flight high-water mark."""
+        super().reset_stats()
+        self.peak_in_flight = 0
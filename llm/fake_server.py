@@ -0,0 +1,62 @@
+import argparse
+import json
+import logging
+from aiohttp import web
+from .fake_backend import FakeLLMBackend
+from .base import count_tokens
+
+logger = logging.getLogger(__name__)
+
+def create_app(backend: FakeLLMBackend) -> web.Application:
+    """Create an Ollama-compatible HTTP app served by a fake backend.
+
+    Only `/api/generate` is implemented. The reply is a single NDJSON line
+    with `done` set, which both streaming and non-streaming clients accept.
+    """
+    async def generate(request: web.Request) -> web.Response:
+        payload = await request.json()
+        prompt = payload.get('prompt', '')
+        completion = await backend.agenerate(prompt)
+        body = {
+            'model': payload.get('model', 'fake'),
+            'response': completion,
+            'done': True,
+            'prompt_eval_count': count_tokens(prompt),
+            'eval_count': count_tokens(completion)
+        }
+        return web.Response(
+            text=json.dumps(body) + "\n",
+            content_type='application/x-ndjson'
+        )
+
+    async def stats(request: web.Request) -> web.Response:
+        return web.json_response({
+            **backend.stats,
+            'in_flight': backend.in_flight,
+            'peak_in_flight': backend.peak_in_flight
+        })
+
+    app = web.Application()
+    app.router.add_post('/api/generate', generate)
+    app.router.add_get('/stats', stats)
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake Ollama server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=11435)
+    parser.add_argument('--max-concurrency', type=int, default=4)
+    parser.add_argument('--base-latency-ms', type=float, default=50.0)
+    parser.add_argument('--decode-ms-per-token', type=float, default=2.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    backend = FakeLLMBackend(
+        base_latency_ms=args.base_latency_ms,
+        decode_ms_per_token=args.decode_ms_per_token,
+        max_concurrency=args.max_concurrency
+    )
+    web.run_app(create_app(backend), host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from typing import Optional
+import logging
+from .base import LLMBackend, LLMBackendError
+
+logger = logging.getLogger(__name__)
+
+class OllamaBackend(LLMBackend):
+    """LLM backend backed by a persistent `langchain_ollama.OllamaLLM` client."""
+
+    name = 'ollama'
+
+    def __init__(
+        self,
+        model_name: str = "llama2:3.2",
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        timeout: int = 30,
+        base_url: Optional[str] = None
+    ):
+        super().__init__()
+        self.model_name = model_name
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.timeout = timeout
+        self.base_url = base_url
+        self._model = None
+
+    @property
+    def model(self):
+        """Lazily create the Ollama client and keep it for later calls."""
+        if self._model is None:
+            try:
+                from langchain_ollama import OllamaLLM
+            except ImportError as e:
+                raise LLMBackendError(f"langchain_ollama is not installed: {str(e)}")
+
+            options = {
+                'model': self.model_name,
+                'temperature': self.temperature,
+                'max_tokens': self.max_tokens,
+                'timeout': self.timeout  # Add timeout to prevent hanging
+            }
+            if self.base_url:
+                options['base_url'] = self.base_url
+            self._model = OllamaLLM(**options)
+        return self._model
+
+    def generate(self, prompt: str) -> str:
+        """Generate a completion through Ollama."""
+        try:
+            completion = self.model.invoke(prompt)
+            self._record_call(prompt, completion)
+            return completion
+        except Exception:
+            self.stats['errors'] += 1
+            raise
+
+    async def agenerate(self, prompt: str) -> str:
+        """Generate a completion through Ollama's async client."""
+        try:
+            completion = await self.model.ainvoke(prompt)
+            self._record_call(prompt, completion)
+            return completion
+        except Exception:
+            self.stats['errors'] += 1
+            raise
+
+    def close(self):
+        """Drop the client so the next call reconnects."""
+        self._model = None
@@ -45,6 +45,44 @@ active_pipelines = Gauge(
     ['stage']
 )
 
+# Kafka Pipeline Flow Metrics
+consumer_lag = Gauge(
+    'pipeline_consumer_lag_messages',
+    'Messages behind the partition high watermark per consumer group',
+    ['group', 'topic', 'partition']
+)
+
+stage_backlog = Gauge(
+    'pipeline_stage_backlog_messages',
+    'Messages waiting in a stage input topic across all partitions',
+    ['stage']
+)
+
+stage_in_flight = Gauge(
+    'pipeline_stage_in_flight_messages',
+    'Messages currently being handled by a stage',
+    ['stage']
+)
+
+stage_wait_time = Histogram(
+    'pipeline_stage_wait_seconds',
+    'Time a message waited in its input topic before a stage picked it up',
+    ['stage'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600)
+)
+
+message_age = Histogram(
+    'pipeline_message_age_seconds',
+    'End-to-end age from raw HTML production to validation',
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600, 14400)
+)
+
+stage_desired_workers = Gauge(
+    'pipeline_stage_desired_workers',
+    'Workers a stage needs to keep its backlog under the per-worker lag target',
+    ['stage']
+)
+
 # Data Quality Metrics
 data_quality_score = Summary(
     'data_quality_score',
@@ -71,6 +109,68 @@ cpu_usage = Gauge(
     ['component']
 )
 
+# Enrichment Cache Metrics
+enrichment_cache_lookups = Counter(
+    'enrichment_cache_lookups_total',
+    'Enrichment cache lookups by source and result (hit, negative_hit, miss)',
+    ['source', 'result']
+)
+
+enrichment_cache_spend_avoided = Counter(
+    'enrichment_cache_spend_avoided_total',
+    'Estimated paid API spend avoided by enrichment cache hits',
+    ['source']
+)
+
+enrichment_planner_calls = Counter(
+    'enrichment_planner_calls_total',
+    'Enrichment source lookups the planner made or skipped',
+    ['source', 'result']
+)
+
+enrichment_field_refreshes = Counter(
+    'enrichment_field_refreshes_total',
+    'Profile fields re-enriched after their TTL expired',
+    ['field_class', 'result']
+)
+
+entity_resolution_results = Counter(
+    'entity_resolution_results_total',
+    'Incoming profiles resolved to a new or an existing entity',
+    ['result', 'match']
+)
+
+provider_batch_size = Histogram(
+    'provider_batch_size_records',
+    'Records sent per provider bulk call by the micro-batcher',
+    ['source'],
+    buckets=[1, 2, 5, 10, 25, 50, 100]
+)
+
+enrichment_coalesced_requests = Counter(
+    'enrichment_coalesced_requests_total',
+    'Provider lookups served by an identical call already in flight or just finished',
+    ['source', 'result']
+)
+
+concurrency_limit = Gauge(
+    'adaptive_concurrency_limit',
+    'Current limit of an adaptive concurrency limiter',
+    ['limiter']
+)
+
+concurrency_in_flight = Gauge(
+    'adaptive_concurrency_in_flight',
+    'Requests holding a slot of an adaptive concurrency limiter',
+    ['limiter']
+)
+
+concurrency_adjustments = Counter(
+    'adaptive_concurrency_adjustments_total',
+    'Limit changes of an adaptive concurrency limiter',
+    ['limiter', 'direction', 'reason']
+)
+
 def start_metrics_server(port: int = 9090):
     """Start the Prometheus metrics server."""
     try:
@@ -98,4 +198,19 @@ def record_pipeline_metrics(stage: str, duration: float, error: Exception = None
 def update_resource_metrics(component: str, memory: float, cpu: float):
     """Update resource usage metrics."""
     memory_usage.labels(component=component).set(memory)
-    cpu_usage.labels(component=component).set(cpu)
\ No newline at end of file
+    cpu_usage.labels(component=component).set(cpu)
+
+def record_consumer_lag(group: str, topic: str, partition: int, lag: int):
+    """Update the lag gauge for one consumer group partition."""
+    consumer_lag.labels(group=group, topic=topic, partition=str(partition)).set(lag)
+
+def update_stage_flow_metrics(stage: str, backlog: int, desired_workers: int):
+    """Update a stage's backlog and scaling signal."""
+    stage_backlog.labels(stage=stage).set(backlog)
+    stage_desired_workers.labels(stage=stage).set(desired_workers)
+
+def record_enrichment_cache_lookup(source: str, result: str, cost: float = 0.0):
+    """Count an enrichment cache lookup and, for hits, the spend it avoided."""
+    enrichment_cache_lookups.labels(source=source, result=result).inc()
+    if result != 'miss' and cost:
+        enrichment_cache_spend_avoided.labels(source=source).inc(cost)
@@ -1,6 +1,8 @@
-from langchain_ollama import OllamaLLM
-from langchain.prompts import ChatPromptTemplate
+from typing import List, Optional
+import asyncio
 import logging
+from llm import LLMBackend, get_backend
+from scraper.selector_templates import SelectorTemplateStore
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -14,35 +16,116 @@ template = (
     "4. **Direct Data Only:** Your output should contain only the data that is explicitly requested, with no other text."
 )
 
-def parse_with_ollama(dom_chunks, parse_description, model_name="llama2:3.2", temperature=0.7, max_tokens=500):
-    """Parse content chunks using the LLM."""
-    try:
-        prompt = ChatPromptTemplate.from_template(template)
-        model = OllamaLLM(
-            model=model_name,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            timeout=30  # Add timeout to prevent hanging
-        )
-        chain = prompt | model
-
-        parsed_results = []
-        total_chunks = len(dom_chunks)
-
-        for i, chunk in enumerate(dom_chunks, start=1):
+def build_prompt(dom_content: str, parse_description: str) -> str:
+    """Render the extraction prompt for one unit of content."""
+    return template.format(dom_content=dom_content, parse_description=parse_description)
+
+def pack_chunks(dom_chunks: List[str], pack_size: int = 1) -> List[str]:
+    """Group consecutive chunks so each LLM call covers `pack_size` of them."""
+    pack_size = max(1, pack_size)
+    return [
+        "\n\n".join(dom_chunks[i:i + pack_size])
+        for i in range(0, len(dom_chunks), pack_size)
+    ]
+
+def parse_with_backend(
+    dom_chunks: List[str],
+    parse_description: str,
+    backend: LLMBackend
+) -> str:
+    """Parse content chunks sequentially with the given backend."""
+    parsed_results = []
+    total_chunks = len(dom_chunks)
+
+    for i, chunk in enumerate(dom_chunks, start=1):
+        try:
+            logger.info(f"Parsing chunk {i} of {total_chunks}")
+            response = backend.generate(build_prompt(chunk, parse_description))
+            parsed_results.append(response)
+            logger.info(f"Successfully parsed chunk {i}")
+        except Exception as e:
+            logger.error(f"Error parsing chunk {i}: {str(e)}")
+            parsed_results.append("")
+
+    return "\n".join(filter(None, parsed_results))
+
+async def aparse_chunks(
+    dom_chunks: List[str],
+    parse_description: str,
+    backend: LLMBackend,
+    concurrency: int = 1,
+    pack_size: int = 1
+) -> str:
+    """Parse content chunks concurrently, keeping the output in chunk order.
+
+    At most `concurrency` requests are in flight, and every request carries
+    `pack_size` chunks.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    packs = pack_chunks(dom_chunks, pack_size)
+
+    async def parse_pack(i: int, pack: str) -> str:
+        async with semaphore:
             try:
-                logger.info(f"Parsing chunk {i} of {total_chunks}")
-                response = chain.invoke({
-                    "dom_content": chunk,
-                    "parse_description": parse_description
-                })
-                parsed_results.append(response)
-                logger.info(f"Successfully parsed chunk {i}")
+                return await backend.agenerate(build_prompt(pack, parse_description))
             except Exception as e:
-                logger.error(f"Error parsing chunk {i}: {str(e)}")
-                parsed_results.append("")
+                logger.error(f"Error parsing chunk pack {i}: {str(e)}")
+                return ""
 
-        return "\n".join(filter(None, parsed_results))
+    parsed_results = await asyncio.gather(
+        *(parse_pack(i, pack) for i, pack in enumerate(packs, start=1))
+    )
+    return "\n".join(filter(None, parsed_results))
+
+def parse_page(
+    url: str,
+    html: str,
+    parse_description: str,
+    backend: LLMBackend,
+    template_store: Optional[SelectorTemplateStore] = None,
+    chunk_size: int = 1000
+) -> str:
+    """Parse a page, using a learned selector template when one is confident.
+
+    Pages from domains without a confident template go through the LLM, and
+    the result is fed back to the store to induce or validate a template.
+    """
+    if template_store is not None:
+        templated = template_store.extract(url, html, parse_description)
+        if templated is not None:
+            logger.info(f"Parsed {url} with selector template")
+            return templated
+
+    from scrape import extract_body_content, clean_body_content, split_dom_content
+
+    dom_chunks = split_dom_content(
+        clean_body_content(extract_body_content(html)),
+        chunk_size=chunk_size
+    )
+    result = parse_with_backend(dom_chunks, parse_description, backend)
+
+    if template_store is not None and result:
+        template_store.observe(url, html, parse_description, result)
+    return result
+
+def parse_with_ollama(
+    dom_chunks,
+    parse_description,
+    model_name="llama2:3.2",
+    temperature=0.7,
+    max_tokens=500,
+    backend: Optional[LLMBackend] = None
+):
+    """Parse content chunks using the LLM."""
+    try:
+        if backend is None:
+            backend = get_backend(
+                'ollama',
+                model_name=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        return parse_with_backend(dom_chunks, parse_description, backend)
     except Exception as e:
         logger.error(f"Fatal error in parse_with_ollama: {str(e)}")
-        raise Exception(f"Failed to initialize parsing: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Failed to initialize parsing: {str(e)}")
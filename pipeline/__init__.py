@@ -1,6 +1,15 @@
 from .kafka_config import KafkaConfig
 from .kafka_manager import KafkaPipelineManager
 from .kafka_producer import DataProducer
+from .async_producer import AsyncProducer
+from .async_consumer import AsyncBatchConsumer
 from .kafka_processor import DataProcessor
 
-__all__ = ['KafkaConfig', 'KafkaPipelineManager', 'DataProducer', 'DataProcessor']
\ No newline at end of file
+__all__ = [
+    'KafkaConfig',
+    'KafkaPipelineManager',
+    'DataProducer',
+    'AsyncProducer',
+    'AsyncBatchConsumer',
+    'DataProcessor'
+]
\ No newline at end of file
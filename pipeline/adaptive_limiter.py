@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+from config.settings import COLLECTION_CONCURRENCY_CONFIG
+from monitoring.prometheus_metrics import concurrency_adjustments, concurrency_in_flight, concurrency_limit
+
+logger = logging.getLogger(__name__)
+
+OVERLOAD_STATUSES = {429, 503}
+
+def is_overload(error: Optional[BaseException]) -> bool:
+    """Whether a failure means the downstream is saturated: a timeout, 429 or 503"""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    status = getattr(error, 'status', None) or getattr(getattr(error, 'response', None), 'status_code', None)
+    return status in OVERLOAD_STATUSES
+
+@dataclass
+class Slot:
+    """One admitted request; `overload()` reports saturation the request recovered from"""
+    epoch: int
+    overloaded: bool = False
+
+    def overload(self):
+        self.overloaded = True
+
+class AdaptiveLimiter:
+    """Concurrency limit tuned by additive increase, multiplicative decrease.
+
+    Each request completed while at least half the limit is in use
+    raises it by 1/limit, so it grows by about one per round of
+    requests. A timeout, 429 or 503, or a window p95 above the healthy
+    baseline by `latency_tolerance`, multiplies it by `backoff`. Requests admitted
+    before a decrease cannot trigger another one, so a burst of failures
+    from the same overload backs off once.
+    """
+
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.config = {**COLLECTION_CONCURRENCY_CONFIG, **(config or {})}
+        self.limit = float(self.config['initial'])
+        self.in_flight = 0
+        self.epoch = 0
+        self.baseline: Optional[float] = None
+        self._latencies: List[float] = []
+        self._changed = asyncio.Condition()
+        concurrency_limit.labels(limiter=name).set(int(self.limit))
+
+    @property
+    def max_in_flight(self) -> int:
+        return int(self.limit)
+
+    async def acquire(self) -> Slot:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.in_flight < self.max_in_flight)
+            self.in_flight += 1
+        concurrency_in_flight.labels(limiter=self.name).set(self.in_flight)
+        return Slot(self.epoch)
+
+    async def release(self, slot: Slot, latency: float, error: Optional[BaseException] = None):
+        # At least half the limit in use, as in Netflix's concurrency-limits
+        saturated = self.in_flight * 2 >= self.max_in_flight
+        self.in_flight -= 1
+        concurrency_in_flight.labels(limiter=self.name).set(self.in_flight)
+        if slot.overloaded or is_overload(error):
+            self._decrease(slot, 'overload')
+        elif error is None and slot.epoch == self.epoch:
+            self._observe(slot, latency, saturated)
+        async with self._changed:
+            self._changed.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[Slot]:
+        """Hold a slot for the duration of one downstream request"""
+        slot = await self.acquire()
+        start = time.monotonic()
+        error: Optional[BaseException] = None
+        try:
+            yield slot
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            await self.release(slot, time.monotonic() - start, error)
+
+    def _observe(self, slot: Slot, latency: float, saturated: bool):
+        self._latencies.append(latency)
+        if len(self._latencies) >= self.config['window']:
+            ordered = sorted(self._latencies)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            self._latencies = []
+            rising = self.baseline is not None and p95 > self.baseline * self.config['latency_tolerance']
+            # Follow a lower p95 at once and a higher one slowly
+            self.baseline = p95 if self.baseline is None else min(p95, 0.9 * self.baseline + 0.1 * p95)
+            if rising:
+                self._decrease(slot, 'latency')
+                return
+        # Only grow a limit that is actually being used
+        if saturated and self.limit < self.config['max']:
+            before = self.max_in_flight
+            self.limit = min(self.config['max'], self.limit + 1 / self.limit)
+            if self.max_in_flight > before:
+                concurrency_limit.labels(limiter=self.name).set(self.max_in_flight)
+                concurrency_adjustments.labels(limiter=self.name, direction='up', reason='healthy').inc()
+
+    def _decrease(self, slot: Slot, reason: str):
+        if slot.epoch < self.epoch:
+            return
+        self.epoch += 1
+        self._latencies = []
+        before = self.max_in_flight
+        self.limit = max(self.config['min'], self.limit * self.config['backoff'])
+        concurrency_limit.labels(limiter=self.name).set(self.max_in_flight)
+        concurrency_adjustments.labels(limiter=self.name, direction='down', reason=reason).inc()
+        logger.info(f"Concurrency limit for {self.name} lowered from {before} to {self.max_in_flight} ({reason})")
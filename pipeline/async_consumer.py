@@ -0,0 +1,245 @@
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from confluent_kafka import Consumer, Message, TopicPartition
+from monitoring.prometheus_metrics import stage_in_flight, record_pipeline_metrics
+from .async_producer import AsyncProducer
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[Message], Awaitable[None]]
+FailureHandler = Callable[[Message, Exception], Awaitable[None]]
+
+class AsyncBatchConsumer:
+    """asyncio adapter that consumes Kafka messages in batches off the event loop.
+
+    All calls into the underlying `Consumer` run on one dedicated thread,
+    because the client is not safe for concurrent use. Each batch is handled
+    concurrently up to `max_concurrency`, and its offsets are committed
+    asynchronously once every message in the batch has been handled.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        batch_size: int = 100,
+        batch_timeout: float = 1.0,
+        max_concurrency: int = 10,
+        consumer: Optional[Any] = None,
+        stage: Optional[str] = None
+    ):
+        self.consumer = consumer if consumer is not None else Consumer(config)
+        # Pipeline stage label for in-flight and handling-time metrics
+        self.stage = stage
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._running = False
+
+    async def _call(self, fn: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: fn(*args, **kwargs))
+
+    async def subscribe(self, topics: List[str]):
+        """Subscribe to topics"""
+        await self._call(self.consumer.subscribe, topics)
+
+    async def consume_batch(self) -> List[Message]:
+        """Fetch up to `batch_size` messages without blocking the event loop."""
+        messages = await self._call(self.consumer.consume, self.batch_size, self.batch_timeout)
+        batch = []
+        for msg in messages:
+            if msg.error():
+                logger.error(f"Consumer error: {msg.error()}")
+                continue
+            batch.append(msg)
+        return batch
+
+    async def process_batch(
+        self,
+        batch: List[Message],
+        handler: MessageHandler,
+        on_error: Optional[FailureHandler] = None
+    ) -> int:
+        """Run the handler over a batch with bounded concurrency.
+
+        Messages sharing a key are handled one after another in offset order,
+        so per-entity ordering holds while different keys run concurrently.
+        A message whose handler raises is passed to `on_error`, if given.
+        Returns the number of messages that failed and were not recovered.
+        """
+        return len(await self._process(batch, handler, on_error))
+
+    async def _process(
+        self,
+        batch: List[Message],
+        handler: MessageHandler,
+        on_error: Optional[FailureHandler] = None
+    ) -> List[Message]:
+        """`process_batch`, returning the messages that failed and were not recovered"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        by_key: Dict[Any, List[Message]] = {}
+        for msg in batch:
+            # Keyless messages have no entity to order against
+            key = msg.key() if msg.key() is not None else (msg.partition(), msg.offset())
+            by_key.setdefault(key, []).append(msg)
+
+        async def handle(messages: List[Message]) -> List[Message]:
+            async with semaphore:
+                return [msg for msg in messages if not await self._handle(msg, handler, on_error)]
+
+        failed = await asyncio.gather(*(handle(msgs) for msgs in by_key.values()))
+        return [msg for msgs in failed for msg in msgs]
+
+    async def _handle(self, msg: Message, handler: MessageHandler, on_error: Optional[FailureHandler] = None) -> bool:
+        start_time = time.perf_counter()
+        error = None
+        if self.stage:
+            stage_in_flight.labels(stage=self.stage).inc()
+        try:
+            await handler(msg)
+        except Exception as e:
+            error = e
+            logger.error(f"Unhandled message processing error: {str(e)}")
+        finally:
+            if self.stage:
+                stage_in_flight.labels(stage=self.stage).dec()
+                record_pipeline_metrics(self.stage, time.perf_counter() - start_time, error)
+        if error is None:
+            return True
+        if on_error is None:
+            return False
+        try:
+            await on_error(msg, error)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to route message failure: {str(e)}")
+            return False
+
+    async def commit_batch(self, batch: List[Message]):
+        """Asynchronously commit the next offset of every partition in the batch."""
+        if not batch:
+            return
+        await self.commit_offsets(self.batch_offsets(batch))
+
+    async def commit_offsets(self, offsets: List[TopicPartition], asynchronous: bool = True):
+        """Commit explicit next offsets, e.g. when only part of a batch is done."""
+        if not offsets:
+            return
+        await self._call(
+            self.consumer.commit,
+            offsets=offsets,
+            asynchronous=asynchronous
+        )
+
+    @staticmethod
+    def committable_offsets(batch: List[Message], failed: List[Message]) -> List[TopicPartition]:
+        """Next offsets per partition, stopping at the first failed message of each"""
+        first_failed: Dict[tuple, int] = {}
+        for msg in failed:
+            key = (msg.topic(), msg.partition())
+            first_failed[key] = min(first_failed.get(key, msg.offset()), msg.offset())
+        return [
+            TopicPartition(tp.topic, tp.partition, first_failed.get((tp.topic, tp.partition), tp.offset))
+            for tp in AsyncBatchConsumer.batch_offsets(batch)
+        ]
+
+    @staticmethod
+    def batch_offsets(batch: List[Message]) -> List[TopicPartition]:
+        """Highest offset + 1 per topic partition in a batch."""
+        next_offsets: Dict[tuple, int] = {}
+        for msg in batch:
+            key = (msg.topic(), msg.partition())
+            next_offsets[key] = max(next_offsets.get(key, -1), msg.offset() + 1)
+        return [
+            TopicPartition(topic, partition, offset)
+            for (topic, partition), offset in next_offsets.items()
+        ]
+
+    async def process_transaction(
+        self,
+        batch: List[Message],
+        handler: MessageHandler,
+        producer: AsyncProducer,
+        on_error: Optional[FailureHandler] = None
+    ) -> bool:
+        """Process a batch inside one producer transaction that also commits its offsets.
+
+        Either every output of the batch and its offsets become visible
+        together, or none do and the consumer is rewound to redo the batch.
+        A failed message is handed to `on_error` inside the transaction, so
+        one bad record does not redo the whole batch; the transaction only
+        aborts when that fails too.
+        """
+        producer.begin_transaction()
+        try:
+            failures = await self.process_batch(batch, handler, on_error)
+            if failures:
+                raise RuntimeError(f"{failures} messages failed in transactional batch")
+            group_metadata = await self._call(self.consumer.consumer_group_metadata)
+            await producer.send_offsets_to_transaction(self.batch_offsets(batch), group_metadata)
+            await producer.commit_transaction()
+            return True
+        except Exception as e:
+            logger.error(f"Aborting batch transaction: {str(e)}")
+            await producer.abort_transaction()
+            await self.rewind(batch)
+            return False
+
+    async def rewind(self, batch: List[Message]):
+        """Seek every partition in the batch back to its first message"""
+        first_offsets: Dict[tuple, int] = {}
+        for msg in batch:
+            key = (msg.topic(), msg.partition())
+            first_offsets[key] = min(first_offsets.get(key, msg.offset()), msg.offset())
+        for (topic, partition), offset in first_offsets.items():
+            await self._call(self.consumer.seek, TopicPartition(topic, partition, offset))
+
+    async def run(
+        self,
+        topics: List[str],
+        handler: MessageHandler,
+        transactional_producer: Optional[AsyncProducer] = None,
+        on_error: Optional[FailureHandler] = None
+    ):
+        """Consume, process and commit batches until stopped.
+
+        With a transactional producer each batch runs in its own transaction
+        and offsets are committed through it rather than by the consumer.
+        Otherwise a message that neither the handler nor `on_error` could
+        handle is not committed: its partition is committed up to it and
+        rewound so it is consumed again.
+        """
+        await self.subscribe(topics)
+        if transactional_producer is not None:
+            await transactional_producer.init_transactions()
+        self._running = True
+        while self._running:
+            batch = await self.consume_batch()
+            if not batch:
+                continue
+            if transactional_producer is not None:
+                await self.process_transaction(batch, handler, transactional_producer, on_error)
+                continue
+            failed = await self._process(batch, handler, on_error)
+            if not failed:
+                await self.commit_batch(batch)
+                continue
+            # Keep unrecovered messages: commit up to the first one per
+            # partition and redeliver from there
+            logger.error(f"{len(failed)} messages failed and could not be routed; redelivering them")
+            await self.commit_offsets(self.committable_offsets(batch, failed))
+            await self.rewind(failed)
+
+    def stop(self):
+        """Stop after the batch in progress"""
+        self._running = False
+
+    async def close(self):
+        """Leave the consumer group and release the polling thread"""
+        self.stop()
+        await self._call(self.consumer.close)
+        self._executor.shutdown(wait=False)
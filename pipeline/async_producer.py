@@ -0,0 +1,138 @@
+from typing import Dict, Any, List, Optional, Union
+import asyncio
+import logging
+from confluent_kafka import Producer, KafkaException, TopicPartition
+
+logger = logging.getLogger(__name__)
+
+class AsyncProducer:
+    """asyncio wrapper around `confluent_kafka.Producer` built on delivery callbacks.
+
+    `produce` only enqueues into librdkafka's buffer and returns a future
+    that resolves when the broker acknowledges the message. A background
+    task polls for delivery reports off the event loop, so batching via
+    `linger.ms`/`batch.size` works as configured and the only full flush
+    happens on `close`.
+    """
+
+    def __init__(self, config: Dict[str, Any], poll_interval: float = 0.1, producer: Optional[Any] = None):
+        self.producer = producer if producer is not None else Producer(config)
+        self.poll_interval = poll_interval
+        self.pending = 0
+        self._poll_task: Optional[asyncio.Task] = None
+        self._running = False
+        self._transactions_ready = False
+
+    async def start(self):
+        """Start the background delivery-report poll loop."""
+        if self._running:
+            return
+        self._running = True
+        self._poll_task = asyncio.create_task(self._poll_loop())
+
+    async def _poll_loop(self):
+        loop = asyncio.get_running_loop()
+        while self._running:
+            try:
+                await loop.run_in_executor(None, self.producer.poll, self.poll_interval)
+            except Exception as e:
+                logger.error(f"Producer poll error: {str(e)}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def produce(
+        self,
+        topic: str,
+        value: Union[str, bytes],
+        key: Optional[Union[str, bytes]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        wait: bool = False
+    ):
+        """Enqueue a message; await its delivery only when `wait` is set.
+
+        Returns the delivered message when waiting, otherwise the delivery
+        future, which callers may await later.
+        """
+        if not self._running:
+            await self.start()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def on_delivery(err, msg):
+            loop.call_soon_threadsafe(self._resolve, future, err, msg)
+
+        while True:
+            try:
+                self.producer.produce(
+                    topic,
+                    value=value,
+                    key=key,
+                    headers=headers,
+                    on_delivery=on_delivery
+                )
+                break
+            except BufferError:
+                # Local queue is full; give the poll loop a chance to drain it
+                await asyncio.sleep(self.poll_interval)
+
+        self.pending += 1
+        if wait:
+            return await future
+
+        future.add_done_callback(self._log_delivery_failure)
+        return future
+
+    def _resolve(self, future: asyncio.Future, err, msg):
+        self.pending -= 1
+        if future.done():
+            return
+        if err is not None:
+            future.set_exception(KafkaException(err))
+        else:
+            future.set_result(msg)
+
+    def _log_delivery_failure(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Message delivery failed: {str(future.exception())}")
+
+    async def init_transactions(self, timeout: float = 30.0):
+        """Register the producer's `transactional.id`, fencing older instances of it"""
+        if self._transactions_ready:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.producer.init_transactions, timeout)
+        self._transactions_ready = True
+
+    def begin_transaction(self):
+        self.producer.begin_transaction()
+
+    async def send_offsets_to_transaction(self, offsets: List[TopicPartition], group_metadata, timeout: float = 30.0):
+        """Commit consumer offsets as part of the open transaction"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self.producer.send_offsets_to_transaction, offsets, group_metadata, timeout
+        )
+
+    async def commit_transaction(self, timeout: float = 30.0):
+        """Flush and commit the open transaction"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.producer.commit_transaction, timeout)
+
+    async def abort_transaction(self, timeout: float = 30.0):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.producer.abort_transaction, timeout)
+
+    async def flush(self, timeout: float = 30.0) -> int:
+        """Wait for outstanding messages without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.producer.flush, timeout)
+
+    async def close(self, timeout: float = 30.0):
+        """Stop polling and flush everything still buffered."""
+        self._running = False
+        if self._poll_task:
+            await self._poll_task
+            self._poll_task = None
+        remaining = await self.flush(timeout)
+        if remaining:
+            logger.warning(f"{remaining} messages were not delivered before shutdown")
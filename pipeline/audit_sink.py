@@ -0,0 +1,196 @@
+from typing import Dict, Any, List, Optional
+import asyncio
+import glob
+import json
+import logging
+import os
+from collections import deque
+from .async_producer import AsyncProducer
+from .envelope import EnvelopeCodec
+
+logger = logging.getLogger(__name__)
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+class AuditSink:
+    """Buffered, best-effort channel for audit events.
+
+    `record` only appends to a bounded in-memory buffer, so callers on the
+    data path never wait on the broker. A background task sends the buffer
+    in batches on its own producer. Batches that are not acknowledged within
+    `delivery_timeout`, and events arriving while the buffer is full, are
+    appended to a JSON-lines spool file, which is replayed once deliveries
+    succeed again. Spool files are read and written on a worker thread, and
+    a replayed file is only deleted once all of it is acknowledged or
+    spooled again. Delivery is at-least-once: a batch that times out may
+    still arrive and later be replayed from the spool as well.
+    """
+
+    def __init__(
+        self,
+        producer: AsyncProducer,
+        topic: str,
+        spool_dir: str,
+        codec: Optional[EnvelopeCodec] = None,
+        max_buffer: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        delivery_timeout: float = 5.0
+    ):
+        self.producer = producer
+        self.topic = topic
+        self.spool_dir = spool_dir
+        self.codec = codec or EnvelopeCodec()
+        self.max_buffer = max_buffer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.delivery_timeout = delivery_timeout
+        self.buffer: deque = deque()
+        # Events that found the buffer full, spooled by the next flush
+        self.overflow: List[Dict[str, Any]] = []
+        self.stats = {'recorded': 0, 'delivered': 0, 'spooled': 0, 'replayed': 0}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._running = False
+        os.makedirs(spool_dir, exist_ok=True)
+
+    @property
+    def spool_path(self) -> str:
+        return os.path.join(self.spool_dir, f"spool-{os.getpid()}.jsonl")
+
+    async def start(self):
+        """Start the background flush loop"""
+        if self._running:
+            return
+        self._running = True
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        await self.producer.start()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def record(self, event: Dict[str, Any]):
+        """Queue an audit event without waiting for the broker"""
+        self.stats['recorded'] += 1
+        if len(self.buffer) >= self.max_buffer:
+            self.overflow.append(event)
+            if self._wakeup:
+                self._wakeup.set()
+            return
+        self.buffer.append(event)
+        if len(self.buffer) >= self.batch_size and self._wakeup:
+            self._wakeup.set()
+
+    async def _flush_loop(self):
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Audit flush error: {str(e)}")
+
+    async def flush(self):
+        """Send everything buffered, spooling what the broker does not take in time"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            if self.overflow:
+                overflow, self.overflow = self.overflow, []
+                await self._spool(overflow)
+            while self.buffer:
+                batch = [self.buffer.popleft() for _ in range(min(self.batch_size, len(self.buffer)))]
+                if not await self._deliver(batch):
+                    # Broker is slow or down: park the backlog on disk and stop trying for now
+                    await self._spool(batch + list(self.buffer))
+                    self.buffer.clear()
+                    return
+                self.stats['delivered'] += len(batch)
+            await self._replay_spool()
+
+    async def _deliver(self, batch: List[Dict[str, Any]]) -> bool:
+        async def send():
+            futures = [
+                await self.producer.produce(self.topic, value=self.codec.encode('audit_log', event))
+                for event in batch
+            ]
+            await asyncio.gather(*futures)
+
+        try:
+            await asyncio.wait_for(send(), self.delivery_timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Audit batch of {len(batch)} not delivered, spooling: {str(e)}")
+            return False
+
+    async def _spool(self, events: List[Dict[str, Any]]) -> bool:
+        try:
+            await asyncio.to_thread(self._write_spool, events)
+            self.stats['spooled'] += len(events)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to spool {len(events)} audit events: {str(e)}")
+            return False
+
+    def _write_spool(self, events: List[Dict[str, Any]]):
+        with open(self.spool_path, 'a') as f:
+            for event in events:
+                f.write(json.dumps(event, default=str) + '\n')
+
+    @staticmethod
+    def _read_spool(path: str) -> List[Dict[str, Any]]:
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _replayable(self) -> List[str]:
+        """Spool files, and files claimed by a replay whose process died"""
+        paths = glob.glob(os.path.join(self.spool_dir, 'spool-*.jsonl'))
+        for path in glob.glob(os.path.join(self.spool_dir, 'spool-*.jsonl.replaying-*')):
+            pid = int(path.rsplit('-', 1)[1])
+            # Replays run under the flush lock, so one claimed by this process is left over too
+            if pid == os.getpid() or not _process_alive(pid):
+                paths.append(path)
+        return paths
+
+    async def _replay_spool(self):
+        """Send spooled events from this and earlier processes back to the broker"""
+        for path in await asyncio.to_thread(self._replayable):
+            # Renaming claims the file, so concurrent processes never replay it twice
+            claimed = f"{path.split('.replaying-')[0]}.replaying-{os.getpid()}"
+            try:
+                if path != claimed:
+                    await asyncio.to_thread(os.rename, path, claimed)
+            except OSError:
+                continue
+
+            events = await asyncio.to_thread(self._read_spool, claimed)
+            for start in range(0, len(events), self.batch_size):
+                batch = events[start:start + self.batch_size]
+                if not await self._deliver(batch):
+                    # The rest stays in the claimed file unless it is spooled again
+                    if await self._spool(events[start:]):
+                        await asyncio.to_thread(os.remove, claimed)
+                    return
+                self.stats['replayed'] += len(batch)
+            # Only now is every event in the file acknowledged
+            await asyncio.to_thread(os.remove, claimed)
+
+    async def close(self):
+        """Stop the flush loop, send or spool what is left and close the producer"""
+        self._running = False
+        if self._flush_task:
+            self._wakeup.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+        await self.producer.close()
@@ -1,7 +1,9 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+import asyncio
 import logging
 from datetime import datetime
-from ..integrations import (
+from config.settings import PIPELINE_CONFIG
+from integrations import (
     HunterAPI,
     RocketReachAPI,
     PeopleDataLabsAPI,
@@ -10,30 +12,74 @@ from ..integrations import (
 
 logger = logging.getLogger(__name__)
 
+Backfill = Callable[[Dict[str, Any]], Awaitable[None]]
+
 class DataEnricher:
-    def __init__(self, config: Dict[str, str]):
+    def __init__(
+        self,
+        config: Dict[str, str],
+        deadline: Optional[float] = None,
+        backfill: Optional[Backfill] = None
+    ):
         self.hunter_api = HunterAPI(config['hunter_api_key'])
         self.rocketreach_api = RocketReachAPI(config['rocketreach_api_key'])
         self.pdl_api = PeopleDataLabsAPI(config['pdl_api_key'])
         self.lexisnexis_api = LexisNexisAPI(config['lexisnexis_api_key'])
+        self.deadline = deadline if deadline is not None else PIPELINE_CONFIG['enrichment_deadline']
+        self.backfill = backfill
+        self._backfills: set = set()
+        self.sources = {
+            'hunter.io': self._get_hunter_data,
+            'rocketreach': self._get_rocketreach_data,
+            'peopledatalabs': self._get_pdl_data,
+            'lexisnexis': self._get_lexisnexis_data
+        }
     
-    async def enrich_profile(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Enrich profile data using multiple data sources."""
+    async def enrich_profile(
+        self,
+        profile_data: Dict[str, Any],
+        deadline: Optional[float] = None,
+        backfill: Optional[Backfill] = None
+    ) -> Dict[str, Any]:
+        """Enrich profile data using multiple data sources.
+        
+        All sources are queried at once and the result is returned when the
+        deadline runs out, so latency is that of the slowest source within
+        budget. Sources still running are listed under `enrichment.late`;
+        with a backfill callback they keep running and the callback gets
+        the complete profile once they finish, otherwise they are cancelled.
+        """
         try:
-            # Gather enrichment data from all sources
-            hunter_data = await self._get_hunter_data(profile_data)
-            rocketreach_data = await self._get_rocketreach_data(profile_data)
-            pdl_data = await self._get_pdl_data(profile_data)
-            lexisnexis_data = await self._get_lexisnexis_data(profile_data)
+            deadline = self.deadline if deadline is None else deadline
+            backfill = backfill or self.backfill
+            tasks = {
+                name: asyncio.create_task(fetch(profile_data))
+                for name, fetch in self.sources.items()
+            }
+            try:
+                done, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+            except asyncio.CancelledError:
+                for task in tasks.values():
+                    task.cancel()
+                raise
             
             # Combine and validate enriched data
             enriched_data = self._combine_enriched_data(
                 profile_data,
-                hunter_data,
-                rocketreach_data,
-                pdl_data,
-                lexisnexis_data
+                *(task.result() for task in tasks.values() if task in done)
             )
+            late = [name for name, task in tasks.items() if task in pending]
+            enriched_data['enrichment']['late'] = late
+            
+            if late:
+                logger.warning(f"Enrichment sources missed the {deadline}s deadline: {', '.join(late)}")
+                if backfill:
+                    job = asyncio.create_task(self._backfill(profile_data, tasks, late, backfill))
+                    self._backfills.add(job)
+                    job.add_done_callback(self._backfills.discard)
+                else:
+                    for task in pending:
+                        task.cancel()
             
             return enriched_data
             
@@ -41,6 +87,31 @@ class DataEnricher:
             logger.error(f"Profile enrichment error: {str(e)}")
             raise
     
+    async def _backfill(
+        self,
+        profile_data: Dict[str, Any],
+        tasks: Dict[str, asyncio.Task],
+        late: List[str],
+        backfill: Backfill
+    ):
+        """Wait for the late sources and hand over the profile with every source combined."""
+        try:
+            await asyncio.gather(*(tasks[name] for name in late))
+            enriched_data = self._combine_enriched_data(
+                profile_data,
+                *(task.result() for task in tasks.values())
+            )
+            enriched_data['enrichment']['late'] = []
+            enriched_data['enrichment']['backfilled'] = late
+            await backfill(enriched_data)
+        except Exception as e:
+            logger.error(f"Enrichment backfill error: {str(e)}")
+    
+    async def wait_for_backfills(self):
+        """Wait until every pending backfill has been delivered."""
+        if self._backfills:
+            await asyncio.gather(*self._backfills, return_exceptions=True)
+    
     async def _get_hunter_data(self, profile: Dict[str, Any]) -> Dict[str, Any]:
         """Get data from Hunter.io."""
         try:
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, AsyncIterable, AsyncIterator, Optional
 import logging
 import asyncio
 from datetime import datetime
@@ -8,9 +8,22 @@ from .stages import (
     DataValidator,
     DataEnricher
 )
+from .streaming import StreamStage, stream_stages
+from .entity_resolver import Duplicate, EntityIndex, identity_record
+from config.settings import ENTITY_RESOLUTION_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Workers per stage for process_stream; collection and enrichment wait on
+# external APIs, processing and validation are CPU-bound
+DEFAULT_STREAM_CONCURRENCY = {
+    'collect': 10,
+    'process': 2,
+    'validate': 2,
+    'resolve': 1,
+    'enrich': 10
+}
+
 class DataPipeline:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -18,6 +31,8 @@ class DataPipeline:
         self.processor = DataProcessor()
         self.validator = DataValidator()
         self.enricher = DataEnricher()
+        # Merges duplicate profiles before they cost enrichment calls
+        self.resolver = EntityIndex() if config.get('resolve_entities', ENTITY_RESOLUTION_CONFIG['enabled']) else None
 
     async def process_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Process data through all pipeline stages."""
@@ -32,8 +47,13 @@ class DataPipeline:
             if not await self.validator.validate(processed_data):
                 raise ValueError("Data validation failed")
             
-            # Stage 4: Enrichment
-            enriched_data = await self.enricher.enrich(processed_data)
+            # Stage 4: Entity resolution
+            resolved = await self._resolve(processed_data, params)
+            if isinstance(resolved, Duplicate):
+                return self._duplicate_result(resolved, params)
+            
+            # Stage 5: Enrichment
+            enriched_data = await self.enricher.enrich(resolved)
             
             return {
                 'data': enriched_data,
@@ -53,4 +73,77 @@ class DataPipeline:
                     'status': 'error',
                     'params': params
                 }
-            }
\ No newline at end of file
+            }
+    
+    async def _validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not await self.validator.validate(data):
+            raise ValueError("Data validation failed")
+        return data
+    
+    async def _resolve(self, data: Dict[str, Any], params: Dict[str, Any]) -> Any:
+        # Index only the identifiers, not the collected content
+        identity = identity_record(data, params)
+        if self.resolver is None or not identity:
+            return data
+        resolved = self.resolver.resolve_record(identity)
+        if isinstance(resolved, Duplicate):
+            # A duplicate keeps its own processed record but skips enrichment
+            return Duplicate(resolved.entity_id, {**data, 'entity_id': resolved.entity_id})
+        return {**data, 'entity_id': resolved['entity_id']}
+    
+    async def _enrich(self, data: Any) -> Any:
+        if isinstance(data, Duplicate):
+            return data
+        return await self.enricher.enrich(data)
+    
+    def _duplicate_result(self, duplicate: Duplicate, params: Any) -> Dict[str, Any]:
+        return {
+            'data': duplicate.record,
+            'metadata': {
+                'timestamp': datetime.now().isoformat(),
+                'status': 'duplicate',
+                'entity_id': duplicate.entity_id,
+                'params': params
+            }
+        }
+    
+    async def process_stream(
+        self,
+        params_stream: AsyncIterable[Dict[str, Any]],
+        concurrency: Optional[Dict[str, int]] = None,
+        queue_size: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Process a stream of params dicts, yielding results as they finish.
+        
+        Stages run concurrently with their own worker counts and are joined
+        by queues holding at most `queue_size` records, so collecting one
+        record overlaps with enriching another and memory stays bounded
+        however long the stream is. Results have the same shape as
+        `process_data` but arrive in completion order.
+        """
+        workers = {
+            **DEFAULT_STREAM_CONCURRENCY,
+            **self.config.get('stream_concurrency', {}),
+            **(concurrency or {})
+        }
+        stages = [
+            StreamStage('collect', self.collector.collect, workers['collect'], queue_size),
+            StreamStage('process', self.processor.process, workers['process'], queue_size),
+            StreamStage('validate', self._validate, workers['validate'], queue_size),
+            StreamStage('resolve', self._resolve, workers['resolve'], queue_size, with_source=True),
+            StreamStage('enrich', self._enrich, workers['enrich'], queue_size)
+        ]
+        
+        async for item in stream_stages(params_stream, stages, output_size=queue_size):
+            if isinstance(item.value, Duplicate) and not item.error:
+                yield self._duplicate_result(item.value, item.source)
+                continue
+            metadata = {
+                'timestamp': datetime.now().isoformat(),
+                'status': 'error' if item.error else 'success',
+                'params': item.source
+            }
+            if item.error:
+                yield {'error': str(item.error), 'stage': item.failed_stage, 'metadata': metadata}
+            else:
+                yield {'data': item.value, 'metadata': metadata}
\ No newline at end of file
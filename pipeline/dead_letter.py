@@ -0,0 +1,242 @@
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+import uuid
+from dataclasses import dataclass, replace
+from datetime import datetime
+from confluent_kafka import Message, TopicPartition
+from .kafka_config import KafkaConfig
+from .kafka_producer import DataProducer
+from .async_consumer import AsyncBatchConsumer
+from .kafka_clients import create_consumer
+from .partitioning import profile_key
+
+logger = logging.getLogger(__name__)
+
+# Failed stage -> (topic the stage consumes, schema its records use)
+REPLAY_TARGETS = {
+    'extraction': ('raw_html', 'raw_html'),
+    'enrichment': ('extracted_data', 'profile'),
+    'validation': ('enriched_data', 'profile')
+}
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+@dataclass
+class ReplayFilter:
+    """Which dead-letter records to replay"""
+    stages: Optional[List[str]] = None
+    error_types: Optional[List[str]] = None
+    error_pattern: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+
+    def matches(self, failure: Dict[str, Any]) -> bool:
+        if self.stages and failure.get('stage') not in self.stages:
+            return False
+        if self.error_types and failure.get('error_type') not in self.error_types:
+            return False
+        if self.error_pattern and not re.search(self.error_pattern, failure.get('error') or ''):
+            return False
+        if self.since or self.until:
+            try:
+                failed_at = datetime.fromisoformat(failure['timestamp'])
+            except (KeyError, TypeError, ValueError):
+                return False
+            if self.since and failed_at < self.since:
+                return False
+            if self.until and failed_at >= self.until:
+                return False
+        return True
+
+    def digest(self) -> str:
+        """Short stable id of the filter, the same across runs and processes"""
+        encoded = json.dumps({
+            'stages': sorted(self.stages or []),
+            'error_types': sorted(self.error_types or []),
+            'error_pattern': self.error_pattern,
+            'since': self.since.isoformat() if self.since else None,
+            'until': self.until.isoformat() if self.until else None
+        }, sort_keys=True)
+        return hashlib.sha256(encoded.encode()).hexdigest()[:12]
+
+def replayed_offsets(handled: List[Message], held: Dict[Tuple[str, int], int]) -> List[TopicPartition]:
+    """Next offset to commit per partition: past every handled record, but not past a held one"""
+    offsets: Dict[Tuple[str, int], int] = {}
+    for msg in handled:
+        key = (msg.topic(), msg.partition())
+        offsets[key] = max(offsets.get(key, -1), msg.offset() + 1)
+    return [
+        TopicPartition(topic, partition, min(offset, held.get((topic, partition), offset)))
+        for (topic, partition), offset in offsets.items()
+    ]
+
+class DeadLetterReplayer:
+    """Re-injects failed records from the dead-letter topic into their stage topics.
+
+    Progress is committed under a consumer group derived from the filter, so
+    rerunning the same filter only replays failures it has not handled yet,
+    while a different filter starts from the beginning of the topic and still
+    sees records earlier runs filtered out. A failed replay holds its
+    partition's commit back so the next run retries it; dry runs use a
+    throwaway group and commit nothing. A run stops once the topic has been
+    idle for `idle_timeout` seconds. Replays are paced by a token bucket and
+    capped at `concurrency` in flight so recovery does not flood the
+    enrichment APIs behind the stages.
+    """
+
+    def __init__(
+        self,
+        kafka_config: KafkaConfig,
+        producer: Optional[DataProducer] = None,
+        rate: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        idle_timeout: float = 5.0
+    ):
+        self.config = kafka_config
+        self.producer = producer or DataProducer(kafka_config)
+        self.bucket = TokenBucket(rate or kafka_config.REPLAY_RATE)
+        self.concurrency = concurrency or kafka_config.REPLAY_CONCURRENCY
+        self.idle_timeout = idle_timeout
+
+    def _create_consumer(self, group_id: str) -> AsyncBatchConsumer:
+        settings = {
+            'bootstrap.servers': self.config.BOOTSTRAP_SERVERS,
+            'group.id': group_id,
+            'auto.offset.reset': 'earliest',
+            'enable.auto.commit': False
+        }
+        return AsyncBatchConsumer(
+            settings,
+            batch_size=self.config.CONSUMER_BATCH_SIZE,
+            batch_timeout=self.idle_timeout,
+            consumer=create_consumer(self.config, settings)
+        )
+
+    def target_for(self, failure: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Topic and schema to replay a failure into, or None if it cannot be replayed"""
+        target = REPLAY_TARGETS.get(failure.get('stage'))
+        data = failure.get('data')
+        if target is None or not isinstance(data, dict):
+            return None
+        # Extraction needs the page itself; fused-mode failures only carry the URL
+        if target[1] == 'raw_html' and not ('html_content' in data or 'html_content_ref' in data):
+            return None
+        return self.config.TOPICS[target[0]], target[1]
+
+    async def replay(
+        self,
+        replay_filter: Optional[ReplayFilter] = None,
+        limit: Optional[int] = None,
+        dry_run: bool = False
+    ) -> Dict[str, int]:
+        """Replay matching dead-letter records and return counts by outcome"""
+        replay_filter = replay_filter or ReplayFilter()
+        if dry_run:
+            group_id = f"{self.config.REPLAY_GROUP}-dry-{uuid.uuid4().hex[:8]}"
+        else:
+            group_id = f"{self.config.REPLAY_GROUP}-{replay_filter.digest()}"
+        # Records that fail again during this run land after its start; leave them for the next run
+        started = datetime.utcnow()
+        requested = replay_filter
+        if replay_filter.until is None or replay_filter.until > started:
+            replay_filter = replace(replay_filter, until=started)
+        stats = {'scanned': 0, 'matched': 0, 'replayed': 0, 'unreplayable': 0, 'failed': 0}
+        semaphore = asyncio.Semaphore(self.concurrency)
+        consumer = self._create_consumer(group_id)
+        # Lowest offset per partition the next run must see again: failed
+        # replays, and failures newer than this run
+        held: Dict[Tuple[str, int], int] = {}
+
+        def hold(msg: Message):
+            key = (msg.topic(), msg.partition())
+            held[key] = min(held.get(key, msg.offset()), msg.offset())
+
+        async def replay_one(msg: Message, failure: Dict[str, Any], topic: str, schema: str):
+            async with semaphore:
+                await self.bucket.acquire()
+                try:
+                    data = failure['data']
+                    await self.producer.produce(
+                        topic,
+                        key=profile_key(data, default=data.get('url')),
+                        value=self.producer.codec.encode(schema, data),
+                        headers={'replayed-from': f"{msg.topic()}:{msg.partition()}:{msg.offset()}"},
+                        wait=True
+                    )
+                    stats['replayed'] += 1
+                except Exception as e:
+                    logger.error(f"Failed to replay {failure.get('stage')} record: {str(e)}")
+                    stats['failed'] += 1
+                    hold(msg)
+
+        try:
+            await consumer.subscribe([self.config.TOPICS['failed_processing']])
+            while limit is None or stats['matched'] < limit:
+                batch = await consumer.consume_batch()
+                if not batch:
+                    break
+
+                tasks = []
+                handled = []
+                for msg in batch:
+                    try:
+                        failure = self.producer.codec.decode(msg.value())
+                    except Exception as e:
+                        logger.error(f"Undecodable dead-letter record: {str(e)}")
+                        stats['scanned'] += 1
+                        stats['unreplayable'] += 1
+                        handled.append(msg)
+                        continue
+                    matches = replay_filter.matches(failure)
+                    if matches and limit is not None and stats['matched'] >= limit:
+                        break
+                    stats['scanned'] += 1
+                    handled.append(msg)
+                    if not matches:
+                        if requested.matches(failure):
+                            hold(msg)
+                        continue
+                    stats['matched'] += 1
+
+                    target = self.target_for(failure)
+                    if target is None:
+                        stats['unreplayable'] += 1
+                        continue
+                    if not dry_run:
+                        tasks.append(replay_one(msg, failure, *target))
+                await asyncio.gather(*tasks)
+                if not dry_run:
+                    await consumer.commit_offsets(replayed_offsets(handled, held), asynchronous=False)
+
+            logger.info(f"Dead-letter replay finished: {stats}")
+            return stats
+
+        except Exception as e:
+            logger.error(f"Dead-letter replay error: {str(e)}")
+            raise
+        finally:
+            await consumer.close()
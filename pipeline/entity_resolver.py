@@ -0,0 +1,279 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+import re
+import unicodedata
+import uuid
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+import numpy as np
+from config.settings import ENTITY_RESOLUTION_CONFIG
+from monitoring.prometheus_metrics import entity_resolution_results
+from .partitioning import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime modulus for the MinHash permutations
+_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_NON_ALNUM = re.compile(r'[^a-z0-9 ]+')
+
+def normalize_name(record: Dict[str, Any]) -> str:
+    """Lowercase ASCII name with punctuation and extra spaces removed"""
+    name = record.get('name') or f"{record.get('first_name') or ''} {record.get('last_name') or ''}"
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    return ' '.join(_NON_ALNUM.sub(' ', ascii_name.lower()).split())
+
+def normalize_email(email: Optional[str], free_domains: Set[str]) -> Optional[str]:
+    """Canonical mailbox: lowercase, no +tag, and no dots for free-mail providers"""
+    if not email or '@' not in email:
+        return None
+    local, _, domain = email.strip().lower().rpartition('@')
+    local = local.split('+', 1)[0]
+    if domain in free_domains:
+        local = local.replace('.', '')
+    return f"{local}@{domain}"
+
+@dataclass
+class Identity:
+    """The normalized identifiers of one record"""
+    name: str
+    email: Optional[str]
+    domain: Optional[str]
+    linkedin: Optional[str]
+
+    def keys(self) -> List[str]:
+        """Exact blocking keys; any shared key makes two records the same person"""
+        keys = []
+        if self.email:
+            keys.append(f"email:{self.email}")
+        if self.linkedin:
+            keys.append(f"linkedin:{self.linkedin}")
+        if self.name and self.domain:
+            keys.append(f"name_domain:{self.name}|{self.domain}")
+        return keys
+
+    def shingles(self) -> Set[str]:
+        """Identifier tokens plus the name, with surname trigrams for typo tolerance.
+
+        Given names are kept as whole tokens and an initial, so a common
+        first name adds two shingles rather than a run of shared trigrams.
+        """
+        shingles: Set[str] = set()
+        tokens = self.name.split()
+        if tokens:
+            padded = f" {tokens[-1]} "
+            shingles.update(padded[i:i + 3] for i in range(len(padded) - 2))
+            for token in tokens[:-1]:
+                shingles.add(f"i:{token[0]}")
+                if len(token) > 1:
+                    shingles.add(f"n:{token}")
+        if self.email:
+            shingles.add(f"e:{self.email.split('@')[0]}")
+        if self.domain:
+            shingles.add(f"d:{self.domain}")
+        if self.linkedin:
+            shingles.add(f"l:{self.linkedin}")
+        return shingles
+
+    def conflicts(self, other: 'Identity') -> bool:
+        """Whether identifiers both records have rule out a match"""
+        if self.linkedin and other.linkedin and self.linkedin != other.linkedin:
+            return True
+        if self.domain and other.domain and self.domain != other.domain:
+            return True
+        # One work mailbox per person at a company
+        return bool(
+            self.email and other.email and self.email != other.email
+            and self.domain and self.email.endswith(f"@{self.domain}")
+            and other.email.endswith(f"@{self.domain}")
+        )
+
+    def corroborates(self, other: 'Identity') -> bool:
+        """Whether the records share an identifier besides the name.
+
+        Similar names alone are not enough, however common the name.
+        """
+        return bool(
+            (self.domain and self.domain == other.domain)
+            or (self.email and other.email and self.email.split('@')[0] == other.email.split('@')[0])
+            or (self.linkedin and self.linkedin == other.linkedin)
+        )
+
+@dataclass
+class Duplicate:
+    """A record resolved to an entity already seen, carrying the merged entity"""
+    entity_id: str
+    record: Dict[str, Any]
+
+def merge_records(canonical: Dict[str, Any], incoming: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill the canonical record's empty fields from a duplicate"""
+    merged = dict(canonical)
+    for key, value in incoming.items():
+        if merged.get(key) in (None, '', [], {}) and value not in (None, '', [], {}):
+            merged[key] = value
+    return merged
+
+IDENTITY_FIELDS = ('name', 'first_name', 'last_name', 'email', 'company_domain', 'linkedin_url')
+
+def identity_record(data: Dict[str, Any], params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """The identifying fields of a processed record, taken from its collection params.
+
+    Processed records only hold `combined_data`, so identifiers come from the
+    params, with gaps filled from the API result when the search returned
+    exactly one person. Fields that are empty everywhere are left out.
+    """
+    params = params or {}
+    record = {field: params.get(field) for field in IDENTITY_FIELDS}
+    if not record['linkedin_url'] and 'linkedin.com' in str(params.get('profile_url') or ''):
+        record['linkedin_url'] = params['profile_url']
+    rows = (data.get('combined_data') or {}).get('api_results')
+    if isinstance(rows, list) and len(rows) == 1 and isinstance(rows[0], dict):
+        record = merge_records(record, {field: rows[0].get(field) for field in IDENTITY_FIELDS})
+    return {field: value for field, value in record.items() if value not in (None, '')}
+
+class EntityIndex:
+    """In-memory entity resolution index over name, email, domain and LinkedIn URL.
+
+    A record matches an entity on a shared exact key (email, LinkedIn URL,
+    or name at a company domain), or when MinHash/LSH finds an entity whose
+    estimated Jaccard similarity over name trigrams and identifiers reaches
+    the threshold and which shares an identifier besides the name. Either
+    way, a different LinkedIn URL, company domain or work mailbox at the
+    same company rules the match out. Matching a record touches
+    only its own buckets, so lookups stay constant-time as the index grows.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, seed: int = 1):
+        self.config = config or ENTITY_RESOLUTION_CONFIG
+        self.num_perm = self.config['num_perm']
+        self.bands = self.config['bands']
+        self.rows = self.num_perm // self.bands
+        self.free_domains = set(self.config['free_email_domains'])
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_PRIME), self.num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(_PRIME), self.num_perm, dtype=np.uint64)
+        self.entities: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._identities: Dict[str, Identity] = {}
+        self._keys: Dict[str, List[Any]] = {}
+        self.buckets: Dict[Any, Set[str]] = {}
+
+    def identity(self, record: Dict[str, Any]) -> Identity:
+        email = normalize_email(record.get('email'), self.free_domains)
+        domain = record.get('company_domain') or (email.split('@')[1] if email else None)
+        if domain:
+            domain = normalize_url(domain).split('/')[0]
+            if domain in self.free_domains:
+                domain = None
+        linkedin = normalize_url(record['linkedin_url']) if record.get('linkedin_url') else None
+        return Identity(normalize_name(record), email, domain, linkedin)
+
+    def signature(self, identity: Identity) -> np.ndarray:
+        shingles = identity.shingles()
+        if not shingles:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+        # a * x wraps at 64 bits; like datasketch, the wrap is part of the permutation
+        return (((np.outer(self._a, hashes) + self._b[:, None]) % _PRIME) & _MAX_HASH).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[Any]:
+        return [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes()) for band in range(self.bands)]
+
+    def match(self, record: Dict[str, Any]) -> Tuple[Optional[str], str]:
+        """The entity a record belongs to and how it matched, or (None, 'none')"""
+        entity_id, match, _ = self._match(self.identity(record))
+        return entity_id, match
+
+    def _match(self, identity: Identity) -> Tuple[Optional[str], str, Optional[np.ndarray]]:
+        for key in identity.keys():
+            for entity_id in self.buckets.get(key, ()):
+                if not identity.conflicts(self._identities[entity_id]):
+                    return entity_id, key.split(':', 1)[0], None
+
+        signature = self.signature(identity)
+        candidates: Set[str] = set()
+        for key in self._band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+        candidates = [
+            entity_id for entity_id in candidates
+            if identity.corroborates(self._identities[entity_id]) and not identity.conflicts(self._identities[entity_id])
+        ]
+        if not candidates:
+            return None, 'none', signature
+        scores = (np.stack([self._signatures[entity_id] for entity_id in candidates]) == signature).mean(axis=1)
+        best = int(scores.argmax())
+        if scores[best] < self.config['threshold']:
+            return None, 'none', signature
+        return candidates[best], 'minhash', signature
+
+    def add(self, record: Dict[str, Any], entity_id: Optional[str] = None) -> str:
+        """Index a record as an entity, replacing any entry with the same id"""
+        identity = self.identity(record)
+        return self._add(entity_id or uuid.uuid4().hex, record, identity, self.signature(identity))
+
+    def _add(
+        self,
+        entity_id: str,
+        record: Dict[str, Any],
+        identity: Identity,
+        signature: np.ndarray,
+        extra_keys: Iterable[str] = ()
+    ) -> str:
+        self.remove(entity_id)
+        keys = list(dict.fromkeys([*identity.keys(), *extra_keys]))
+        for band_key in self._band_keys(signature):
+            # A full band bucket only holds records sharing common tokens, so
+            # it stops growing and lookup cost stays bounded
+            if len(self.buckets.get(band_key, ())) < self.config['max_bucket']:
+                keys.append(band_key)
+        for key in keys:
+            self.buckets.setdefault(key, set()).add(entity_id)
+        self.entities[entity_id] = record
+        self._identities[entity_id] = identity
+        self._signatures[entity_id] = signature
+        self._keys[entity_id] = keys
+        while len(self.entities) > self.config['max_entities']:
+            self.remove(next(iter(self.entities)))
+        return entity_id
+
+    def remove(self, entity_id: str):
+        for key in self._keys.pop(entity_id, ()):
+            bucket = self.buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entity_id)
+                if not bucket:
+                    del self.buckets[key]
+        self.entities.pop(entity_id, None)
+        self._identities.pop(entity_id, None)
+        self._signatures.pop(entity_id, None)
+
+    def resolve(self, record: Dict[str, Any]) -> Tuple[str, bool]:
+        """Match a record, merging it into its entity or adding a new one.
+
+        Returns the entity id and whether the record was a duplicate.
+        """
+        identity = self.identity(record)
+        entity_id, match, signature = self._match(identity)
+        entity_resolution_results.labels(result='duplicate' if entity_id else 'new', match=match).inc()
+        if entity_id is None:
+            return self._add(uuid.uuid4().hex, record, identity, signature), False
+
+        merged = merge_records(self.entities[entity_id], record)
+        merged_identity = self.identity(merged)
+        # Keep finding the entity by every email and URL its duplicates had
+        exact_keys = [key for key in self._keys[entity_id] if isinstance(key, str)] + identity.keys()
+        if merged_identity == self._identities[entity_id] and set(identity.keys()) <= set(self._keys[entity_id]):
+            # Nothing to re-index, only keep the entity among the newest
+            self.entities[entity_id] = merged
+            self.entities.move_to_end(entity_id)
+        else:
+            self._add(entity_id, merged, merged_identity, self.signature(merged_identity), exact_keys)
+        return entity_id, True
+
+    def resolve_record(self, record: Dict[str, Any]) -> Any:
+        """The record tagged with its new entity id, or a Duplicate of the merged entity"""
+        entity_id, duplicate = self.resolve(record)
+        if duplicate:
+            return Duplicate(entity_id, self.entities[entity_id])
+        return {**record, 'entity_id': entity_id}
@@ -0,0 +1,114 @@
+from typing import Dict, Any, List, Optional, Tuple
+import json
+import logging
+import os
+import struct
+from dataclasses import dataclass, field
+import msgpack
+
+logger = logging.getLogger(__name__)
+
+MAGIC_BYTE = 0
+HEADER = struct.Struct('>BH')  # magic byte, schema id
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.dirname(__file__), 'schemas.json')
+
+class SchemaError(Exception):
+    """Raised for unknown, malformed or incompatible schemas"""
+    pass
+
+@dataclass
+class Schema:
+    """One version of a pipeline record schema"""
+    id: int
+    name: str
+    version: int
+    fields: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def required_fields(self) -> List[str]:
+        return [name for name, spec in self.fields.items() if spec.get('required')]
+
+def check_compatibility(old: Schema, new: Schema) -> List[str]:
+    """List the reasons `new` cannot replace `old` in both read directions.
+
+    Readers on the new version must be able to read old records (every field
+    the new version requires existed and was required before, or has a
+    default), and readers on the old version must be able to read new
+    records (every field the old version requires is still required).
+    """
+    problems = []
+    for name in new.required_fields:
+        if name not in old.required_fields and 'default' not in new.fields[name]:
+            problems.append(f"{new.name} v{new.version}: new required field '{name}' has no default")
+    for name in old.required_fields:
+        if name not in new.required_fields:
+            problems.append(f"{new.name} v{new.version}: required field '{name}' was dropped or made optional")
+    return problems
+
+class SchemaRegistry:
+    """Local schema registry backed by a JSON file"""
+
+    def __init__(self, schemas: List[Schema]):
+        self.by_id: Dict[int, Schema] = {}
+        self.latest: Dict[str, Schema] = {}
+        for schema in sorted(schemas, key=lambda s: (s.name, s.version)):
+            self.register(schema)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_REGISTRY_PATH) -> 'SchemaRegistry':
+        with open(path) as f:
+            return cls([Schema(**item) for item in json.load(f)['schemas']])
+
+    def register(self, schema: Schema):
+        """Add a schema version, refusing ones incompatible with the current latest"""
+        if schema.id in self.by_id:
+            raise SchemaError(f"Duplicate schema id {schema.id}")
+        if current := self.latest.get(schema.name):
+            if schema.version <= current.version:
+                raise SchemaError(f"{schema.name} v{schema.version} is not newer than v{current.version}")
+            if problems := check_compatibility(current, schema):
+                raise SchemaError("; ".join(problems))
+        self.by_id[schema.id] = schema
+        self.latest[schema.name] = schema
+
+class EnvelopeCodec:
+    """Encodes pipeline records as versioned msgpack envelopes.
+
+    Wire format: a zero magic byte, the big-endian 16-bit schema id, then the
+    msgpack body. JSON records written before envelopes were introduced are
+    still decoded so topics can be migrated in place.
+    """
+
+    def __init__(self, registry: Optional[SchemaRegistry] = None):
+        self.registry = registry or SchemaRegistry.load()
+
+    def encode(self, schema_name: str, record: Dict[str, Any]) -> bytes:
+        schema = self.registry.latest.get(schema_name)
+        if schema is None:
+            raise SchemaError(f"Unknown schema: {schema_name}")
+        missing = [name for name in schema.required_fields if name not in record]
+        if missing:
+            raise SchemaError(f"{schema_name} record missing required fields: {missing}")
+        return HEADER.pack(MAGIC_BYTE, schema.id) + msgpack.packb(record, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        return self.decode_with_schema(data)[0]
+
+    def decode_with_schema(self, data: bytes) -> Tuple[Dict[str, Any], Optional[Schema]]:
+        """Decode a record along with the schema it was written with"""
+        if not data:
+            raise SchemaError("Empty message")
+        if data[0] != MAGIC_BYTE:
+            return json.loads(data), None
+
+        _, schema_id = HEADER.unpack_from(data)
+        schema = self.registry.by_id.get(schema_id)
+        if schema is None:
+            raise SchemaError(f"Unknown schema id: {schema_id}")
+
+        record = msgpack.unpackb(data[HEADER.size:], raw=False)
+        # Fill fields the current version added since the record was written
+        for name, spec in self.registry.latest[schema.name].fields.items():
+            if name not in record and 'default' in spec:
+                record[name] = spec['default']
+        return record, schema
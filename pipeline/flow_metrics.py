@@ -0,0 +1,127 @@
+from typing import Dict, Any, Optional
+import asyncio
+import logging
+import math
+import time
+from confluent_kafka import Message, TopicPartition
+from monitoring.prometheus_metrics import (
+    stage_wait_time, message_age, record_consumer_lag, update_stage_flow_metrics
+)
+from .kafka_config import KafkaConfig
+from .kafka_clients import create_consumer
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds since the epoch when the raw page entered the pipeline;
+# every stage copies it onto the message it produces
+ORIGIN_HEADER = 'pipeline-origin-ms'
+
+def header_value(msg: Message, name: str) -> Optional[bytes]:
+    """A header's value from a consumed message, or None"""
+    for key, value in msg.headers() or []:
+        if key == name:
+            return value
+    return None
+
+def origin_headers(msg: Message) -> Optional[Dict[str, bytes]]:
+    """Headers that carry a message's pipeline origin onto the next stage"""
+    origin = header_value(msg, ORIGIN_HEADER)
+    return {ORIGIN_HEADER: origin} if origin is not None else None
+
+def new_origin_headers() -> Dict[str, str]:
+    """Origin headers for a message entering the pipeline now"""
+    return {ORIGIN_HEADER: str(int(time.time() * 1000))}
+
+def observe_stage_wait(stage: str, msg: Message):
+    """Record how long a message sat in the stage's input topic"""
+    timestamp_type, timestamp = msg.timestamp()
+    if timestamp_type and timestamp > 0:
+        stage_wait_time.labels(stage=stage).observe(max(0.0, time.time() - timestamp / 1000))
+
+def observe_message_age(msg: Message):
+    """Record the end-to-end age of a message leaving the last stage"""
+    origin = header_value(msg, ORIGIN_HEADER)
+    if origin is not None:
+        message_age.observe(max(0.0, time.time() - int(origin) / 1000))
+
+def desired_workers(backlog: int, lag_target: int, max_workers: int) -> int:
+    """Workers needed to keep each one's share of the backlog under `lag_target`.
+
+    Capped by the input topic's partition count, since extra group members
+    would sit idle.
+    """
+    return max(1, min(max_workers, math.ceil(backlog / lag_target)))
+
+class ConsumerLagMonitor:
+    """Polls committed offsets and high watermarks for every stage group.
+
+    Partitions come from the broker's topic metadata, so lag follows
+    partitions added after deployment. Exports per-partition lag, the
+    total backlog per stage and the worker count that backlog calls for,
+    which an HPA can scale on through an external-metrics adapter.
+    """
+
+    def __init__(self, kafka_config: KafkaConfig, interval: Optional[float] = None):
+        self.config = kafka_config
+        self.interval = interval or kafka_config.LAG_POLL_INTERVAL
+        self.clients: Dict[str, Any] = {}
+        self._running = False
+
+    def _client(self, stage: str):
+        if stage not in self.clients:
+            self.clients[stage] = create_consumer(self.config, {
+                'bootstrap.servers': self.config.BOOTSTRAP_SERVERS,
+                'group.id': self.config.CONSUMER_GROUPS[stage],
+                'enable.auto.commit': False
+            })
+        return self.clients[stage]
+
+    def collect(self) -> Dict[str, Dict[str, int]]:
+        """Update the lag metrics and return backlog and desired workers per stage"""
+        signals = {}
+        for stage, topic_name in self.config.STAGE_INPUT_TOPICS.items():
+            group = self.config.CONSUMER_GROUPS[stage]
+            topic = self.config.TOPICS[topic_name]
+            client = self._client(stage)
+            try:
+                metadata = client.list_topics(topic, timeout=10).topics.get(topic)
+                if metadata is None or metadata.error is not None:
+                    raise ValueError(f"no metadata for topic {topic}")
+                partitions = len(metadata.partitions)
+                committed = client.committed(
+                    [TopicPartition(topic, p) for p in metadata.partitions],
+                    timeout=10
+                )
+                backlog = 0
+                for tp in committed:
+                    low, high = client.get_watermark_offsets(TopicPartition(topic, tp.partition), timeout=10)
+                    # Nothing committed yet: the group starts from the earliest offset
+                    lag = max(0, high - (tp.offset if tp.offset >= 0 else low))
+                    record_consumer_lag(group, topic, tp.partition, lag)
+                    backlog += lag
+            except Exception as e:
+                logger.error(f"Failed to collect lag for {group}: {str(e)}")
+                continue
+
+            workers = desired_workers(backlog, self.config.LAG_TARGET_PER_WORKER, partitions)
+            update_stage_flow_metrics(stage, backlog, workers)
+            signals[stage] = {'backlog': backlog, 'desired_workers': workers}
+        return signals
+
+    async def run(self):
+        """Collect every `interval` seconds until stopped"""
+        loop = asyncio.get_running_loop()
+        self._running = True
+        while self._running:
+            await loop.run_in_executor(None, self.collect)
+            await asyncio.sleep(self.interval)
+
+    def stop(self):
+        self._running = False
+
+    def close(self):
+        """Stop polling and release the offset clients"""
+        self.stop()
+        for client in self.clients.values():
+            client.close()
+        self.clients = {}
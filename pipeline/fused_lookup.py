@@ -0,0 +1,34 @@
+from typing import Dict, Any, Optional
+import logging
+from .kafka_config import KafkaConfig
+from .kafka_processor import DataProcessor
+from .stages.data_enricher import DataEnricher
+from .stages.data_validator import DataValidator
+
+logger = logging.getLogger(__name__)
+
+async def lookup_profile(
+    url: str,
+    html_content: str,
+    kafka_config: Optional[KafkaConfig] = None,
+    enricher: Optional[Any] = None,
+    validator: Optional[Any] = None,
+    publish: bool = True,
+    record_failures: bool = True
+) -> Dict[str, Any]:
+    """Profile for one fetched page, built in memory for an interactive request.
+
+    Runs the fused extraction, enrichment and validation path instead of the
+    three Kafka hops; bulk traffic keeps going through the stage workers.
+    Raises if a stage fails.
+    """
+    processor = DataProcessor(
+        kafka_config or KafkaConfig(),
+        stages=[],
+        enricher=enricher or DataEnricher(),
+        validator=validator or DataValidator()
+    )
+    try:
+        return await processor.process_fused(url, html_content, publish=publish, record_failures=record_failures)
+    finally:
+        await processor.close()
@@ -0,0 +1,59 @@
+from typing import Dict, Any, List
+import json
+import logging
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+def _json_ld_people(soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    """schema.org Person objects embedded as JSON-LD"""
+    people = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            data = data.get('@graph', [data])
+        # Valid JSON-LD may also be a bare string or number
+        items = data if isinstance(data, list) else []
+        people.extend(item for item in items if isinstance(item, dict) and item.get('@type') == 'Person')
+    return people
+
+def extract_profile_fields(html_content: str) -> Dict[str, Any]:
+    """Extract profile fields from a page's HTML.
+
+    JSON-LD Person markup is used when present; contact links fill in the
+    email and LinkedIn URL otherwise.
+    """
+    soup = BeautifulSoup(html_content, 'lxml')
+    profile: Dict[str, Any] = {
+        'page_title': soup.title.string.strip() if soup.title and soup.title.string else None
+    }
+
+    for person in _json_ld_people(soup)[:1]:
+        profile['full_name'] = person.get('name')
+        profile['first_name'] = person.get('givenName')
+        profile['last_name'] = person.get('familyName')
+        email = person.get('email')
+        profile['email'] = (email.replace('mailto:', '') or None) if isinstance(email, str) else None
+        profile['title'] = person.get('jobTitle')
+        works_for = person.get('worksFor')
+        if isinstance(works_for, dict):
+            profile['company'] = works_for.get('name')
+        address = person.get('address')
+        if isinstance(address, dict):
+            profile['location'] = address.get('addressLocality')
+        same_as = person.get('sameAs') or []
+        for link in same_as if isinstance(same_as, list) else [same_as]:
+            if isinstance(link, str) and 'linkedin.com/in/' in link:
+                profile['linkedin_url'] = link
+
+    links = [a['href'] for a in soup.find_all('a', href=True)]
+    if not profile.get('email'):
+        profile['email'] = next((l[len('mailto:'):] for l in links if l.startswith('mailto:')), None)
+    if not profile.get('linkedin_url'):
+        profile['linkedin_url'] = next((l for l in links if 'linkedin.com/in/' in l), None)
+
+    profile['links'] = [l for l in links if l.startswith('http')]
+    return {k: v for k, v in profile.items() if v}
@@ -0,0 +1,27 @@
+from typing import Dict, Any
+from .kafka_config import KafkaConfig
+
+def create_producer(kafka_config: KafkaConfig, settings: Dict[str, Any]):
+    """Producer client for the configured backend"""
+    if kafka_config.BACKEND == 'memory':
+        from .memory_broker import MemoryProducer
+        return MemoryProducer(settings)
+    from confluent_kafka import Producer
+    return Producer(settings)
+
+def create_consumer(kafka_config: KafkaConfig, settings: Dict[str, Any]):
+    """Consumer client for the configured backend"""
+    if kafka_config.BACKEND == 'memory':
+        from .memory_broker import MemoryConsumer
+        return MemoryConsumer(settings)
+    from confluent_kafka import Consumer
+    return Consumer(settings)
+
+def create_admin_client(kafka_config: KafkaConfig):
+    """Admin client for the configured backend"""
+    settings = {'bootstrap.servers': kafka_config.BOOTSTRAP_SERVERS}
+    if kafka_config.BACKEND == 'memory':
+        from .memory_broker import MemoryAdminClient
+        return MemoryAdminClient(settings)
+    from confluent_kafka.admin import AdminClient
+    return AdminClient(settings)
@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 
 @dataclass
@@ -5,6 +6,9 @@ class KafkaConfig:
     """Kafka configuration for the data pipeline"""
     BOOTSTRAP_SERVERS = 'localhost:9092'
     
+    # 'confluent' for a real broker, 'memory' for the in-process stand-in
+    BACKEND = os.getenv('KAFKA_BACKEND', 'confluent')
+    
     # Topic definitions
     TOPICS = {
         'raw_html': 'raw-html-data',
@@ -20,4 +24,66 @@ class KafkaConfig:
         'extraction': 'profile-extraction-group',
         'enrichment': 'data-enrichment-group',
         'validation': 'data-validation-group'
-    }
\ No newline at end of file
+    }
+    
+    # Topic each stage consumes
+    STAGE_INPUT_TOPICS = {
+        'extraction': 'raw_html',
+        'enrichment': 'extracted_data',
+        'validation': 'enriched_data'
+    }
+    
+    # Batch consumption settings for the stage consumers
+    CONSUMER_BATCH_SIZE = 100
+    CONSUMER_BATCH_TIMEOUT = 1.0  # seconds
+    STAGE_CONCURRENCY = 10
+    
+    # Payload handling for the raw HTML topic: bodies above the threshold are
+    # offloaded to the blob store, the rest travel inline and compressed
+    CLAIM_CHECK_THRESHOLD = 64 * 1024  # bytes
+    BLOB_STORE_PATH = os.getenv('PIPELINE_BLOB_STORE_PATH', '/tmp/grayghost-blobs')
+    # Offloaded bodies must outlive the raw HTML topic's retention and any
+    # dead-letter replay of extraction failures
+    BLOB_RETENTION = float(os.getenv('PIPELINE_BLOB_RETENTION', str(7 * 86400)))  # seconds
+    BLOB_PURGE_INTERVAL = float(os.getenv('PIPELINE_BLOB_PURGE_INTERVAL', '3600'))  # seconds
+    COMPRESSION_TYPE = os.getenv('KAFKA_COMPRESSION_TYPE', 'zstd')  # or 'lz4'
+    
+    # Partition counts per topic; stage parallelism is capped by these
+    TOPIC_PARTITIONS = {
+        'raw_html': int(os.getenv('KAFKA_RAW_HTML_PARTITIONS', '12')),
+        'extracted_data': int(os.getenv('KAFKA_EXTRACTED_PARTITIONS', '12')),
+        'enriched_data': int(os.getenv('KAFKA_ENRICHED_PARTITIONS', '12')),
+        'validated_data': int(os.getenv('KAFKA_VALIDATED_PARTITIONS', '12')),
+        'failed_processing': 3,
+        'audit_logs': 3
+    }
+    
+    # Consumer workers per stage, all joining the stage's consumer group
+    STAGE_WORKERS = {
+        'extraction': int(os.getenv('EXTRACTION_WORKERS', '2')),
+        'enrichment': int(os.getenv('ENRICHMENT_WORKERS', '4')),
+        'validation': int(os.getenv('VALIDATION_WORKERS', '2'))
+    }
+    
+    # Dead-letter replay: re-injected records per second and in flight
+    REPLAY_RATE = float(os.getenv('DLQ_REPLAY_RATE', '20'))
+    REPLAY_CONCURRENCY = int(os.getenv('DLQ_REPLAY_CONCURRENCY', '5'))
+    REPLAY_GROUP = 'dead-letter-replay-group'
+    
+    # Lag monitoring and the per-stage scaling signal derived from it
+    LAG_POLL_INTERVAL = float(os.getenv('PIPELINE_LAG_POLL_INTERVAL', '15'))
+    LAG_TARGET_PER_WORKER = int(os.getenv('PIPELINE_LAG_TARGET_PER_WORKER', '1000'))
+    
+    # Audit channel: buffered in memory, sent in batches, spooled to disk
+    # when the broker does not acknowledge a batch in time
+    AUDIT_BUFFER_SIZE = 10000
+    AUDIT_BATCH_SIZE = 500
+    AUDIT_FLUSH_INTERVAL = 1.0  # seconds
+    AUDIT_DELIVERY_TIMEOUT = 5.0  # seconds
+    AUDIT_SPOOL_DIR = os.getenv('PIPELINE_AUDIT_SPOOL_DIR', '/tmp/grayghost-audit-spool')
+    
+    # Exactly-once stages: idempotent transactional producers, read_committed
+    # consumers, and offsets committed inside each batch's transaction
+    EXACTLY_ONCE = os.getenv('PIPELINE_EXACTLY_ONCE', 'false').lower() == 'true'
+    TRANSACTIONAL_ID_PREFIX = os.getenv('PIPELINE_TRANSACTIONAL_ID_PREFIX', 'grayghost-pipeline')
+    TRANSACTION_TIMEOUT_MS = 60000
\ No newline at end of file
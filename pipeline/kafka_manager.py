@@ -1,7 +1,8 @@
 from typing import Dict
 import logging
-from confluent_kafka.admin import NewTopic, AdminClient
+from confluent_kafka.admin import NewTopic
 from .kafka_config import KafkaConfig
+from .kafka_clients import create_admin_client
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +11,7 @@ class KafkaPipelineManager:
     
     def __init__(self, kafka_config: KafkaConfig):
         self.config = kafka_config
-        self.admin_client = AdminClient({'bootstrap.servers': kafka_config.BOOTSTRAP_SERVERS})
+        self.admin_client = create_admin_client(kafka_config)
     
     async def setup_pipeline(self):
         """Initialize Kafka topics and configure pipeline"""
@@ -47,7 +48,7 @@ class KafkaPipelineManager:
             new_topics = [
                 NewTopic(
                     topic,
-                    num_partitions=3,
+                    num_partitions=self.config.TOPIC_PARTITIONS.get(name, 3),
                     replication_factor=1,
                     config=topic_configs[name]
                 )
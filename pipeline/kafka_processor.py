@@ -1,83 +1,115 @@
-from typing import Dict
-import json
+from typing import Dict, Any, List, Optional
 import logging
+import time
+import uuid
 from datetime import datetime
-from confluent_kafka import Consumer
+from confluent_kafka import Message
 from .kafka_config import KafkaConfig
 from .kafka_producer import DataProducer
+from .async_consumer import AsyncBatchConsumer
+from .kafka_clients import create_consumer
+from .partitioning import profile_key
+from .flow_metrics import origin_headers, observe_stage_wait, observe_message_age
+from .html_extractor import extract_profile_fields
 
 logger = logging.getLogger(__name__)
 
 class DataProcessor:
     """Processes data through the pipeline stages"""
     
-    def __init__(self, kafka_config: KafkaConfig):
+    def __init__(
+        self,
+        kafka_config: KafkaConfig,
+        stages: Optional[List[str]] = None,
+        producer: Optional[DataProducer] = None,
+        enricher: Optional[Any] = None,
+        validator: Optional[Any] = None,
+        exactly_once: Optional[bool] = None
+    ):
         self.config = kafka_config
-        self.producer = DataProducer(kafka_config)
+        if stages is None:
+            stages = list(kafka_config.CONSUMER_GROUPS)
         
-        # Initialize consumers for different stages
-        self.extraction_consumer = Consumer({
-            'bootstrap.servers': kafka_config.BOOTSTRAP_SERVERS,
-            'group.id': kafka_config.CONSUMER_GROUPS['extraction'],
-            'auto.offset.reset': 'earliest',
-            'enable.auto.commit': False
-        })
+        # Exactly-once mode runs each batch in a producer transaction, and a
+        # transactional producer can only serve one consume loop at a time
+        self.exactly_once = kafka_config.EXACTLY_ONCE if exactly_once is None else exactly_once
+        if self.exactly_once and len(stages) != 1:
+            # All-stage and fused processors keep the plain producer
+            if stages:
+                logger.warning(f"Exactly-once needs one stage per processor; running {stages} without transactions")
+            self.exactly_once = False
+        if self.exactly_once:
+            if producer is not None and not producer.transactional_id:
+                raise ValueError("An exactly-once processor needs a transactional producer")
+            producer = producer or DataProducer(
+                kafka_config,
+                transactional_id=f"{kafka_config.TRANSACTIONAL_ID_PREFIX}-{stages[0]}-{uuid.uuid4().hex}"
+            )
+        self.producer = producer or DataProducer(kafka_config)
         
-        self.enrichment_consumer = Consumer({
-            'bootstrap.servers': kafka_config.BOOTSTRAP_SERVERS,
-            'group.id': kafka_config.CONSUMER_GROUPS['enrichment'],
-            'auto.offset.reset': 'earliest',
-            'enable.auto.commit': False
-        })
+        # Stage collaborators with the pipeline.stages interfaces:
+        # enricher.enrich(data) -> dict, validator.validate(data) -> bool
+        self.enricher = enricher
+        self.validator = validator
         
-        self.validation_consumer = Consumer({
-            'bootstrap.servers': kafka_config.BOOTSTRAP_SERVERS,
-            'group.id': kafka_config.CONSUMER_GROUPS['validation'],
+        # Initialize consumers only for the stages this processor runs
+        self.consumers = {stage: self._create_consumer(stage) for stage in stages}
+    
+    def _create_consumer(self, stage: str) -> AsyncBatchConsumer:
+        """Create a batch consumer for a pipeline stage"""
+        settings = {
+            'bootstrap.servers': self.config.BOOTSTRAP_SERVERS,
+            'group.id': self.config.CONSUMER_GROUPS[stage],
             'auto.offset.reset': 'earliest',
             'enable.auto.commit': False
-        })
+        }
+        if self.exactly_once:
+            # Skip outputs of aborted upstream transactions
+            settings['isolation.level'] = 'read_committed'
+        return AsyncBatchConsumer(
+            settings,
+            batch_size=self.config.CONSUMER_BATCH_SIZE,
+            batch_timeout=self.config.CONSUMER_BATCH_TIMEOUT,
+            max_concurrency=self.config.STAGE_CONCURRENCY,
+            consumer=create_consumer(self.config, settings),
+            stage=stage
+        )
+    
+    async def run_stage(self, stage: str):
+        """Run one pipeline stage's consume loop"""
+        stage_runners = {
+            'extraction': self.process_raw_html,
+            'enrichment': self.enrich_profile_data,
+            'validation': self.validate_profile_data
+        }
+        await stage_runners[stage]()
+    
+    def _transactional_producer(self):
+        return self.producer.producer if self.exactly_once else None
+    
+    def _failure_router(self, stage: str):
+        """Send messages whose handler raised to the failed topic.
+
+        In exactly-once mode this runs inside the batch transaction, so a
+        bad record is dead-lettered instead of aborting and redoing its batch.
+        """
+        async def route(msg: Message, error: Exception):
+            try:
+                data = self.producer.codec.decode(msg.value())
+            except Exception:
+                data = None
+            await self.handle_processing_failure(stage, data, str(error), type(error).__name__)
+        return route
     
     async def process_raw_html(self):
         """Process raw HTML data"""
         try:
-            self.extraction_consumer.subscribe([self.config.TOPICS['raw_html']])
-            
-            while True:
-                msg = self.extraction_consumer.poll(1.0)
-                
-                if msg is None:
-                    continue
-                
-                if msg.error():
-                    logger.error(f"Consumer error: {msg.error()}")
-                    continue
-                
-                try:
-                    # Parse message
-                    data = json.loads(msg.value())
-                    
-                    # Extract data from HTML
-                    extracted_data = await self.extract_profile_data(
-                        data['html_content']
-                    )
-                    
-                    # Produce extracted data
-                    await self.producer.produce(
-                        self.config.TOPICS['extracted_data'],
-                        key=data['url'],
-                        value=json.dumps(extracted_data)
-                    )
-                    
-                    self.extraction_consumer.commit()
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process HTML: {str(e)}")
-                    await self.handle_processing_failure(
-                        'extraction',
-                        data,
-                        str(e)
-                    )
-                    
+            await self.consumers['extraction'].run(
+                [self.config.TOPICS['raw_html']],
+                self._handle_raw_html,
+                self._transactional_producer(),
+                self._failure_router('extraction')
+            )
         except Exception as e:
             logger.error(f"Raw HTML processing error: {str(e)}")
             raise
@@ -85,42 +117,12 @@ class DataProcessor:
     async def enrich_profile_data(self):
         """Enrich extracted profile data"""
         try:
-            self.enrichment_consumer.subscribe([self.config.TOPICS['extracted_data']])
-            
-            while True:
-                msg = self.enrichment_consumer.poll(1.0)
-                
-                if msg is None:
-                    continue
-                
-                if msg.error():
-                    logger.error(f"Consumer error: {msg.error()}")
-                    continue
-                
-                try:
-                    # Parse message
-                    data = json.loads(msg.value())
-                    
-                    # Enrich data with additional information
-                    enriched_data = await self.enrich_data(data)
-                    
-                    # Produce enriched data
-                    await self.producer.produce(
-                        self.config.TOPICS['enriched_data'],
-                        key=msg.key(),
-                        value=json.dumps(enriched_data)
-                    )
-                    
-                    self.enrichment_consumer.commit()
-                    
-                except Exception as e:
-                    logger.error(f"Failed to enrich data: {str(e)}")
-                    await self.handle_processing_failure(
-                        'enrichment',
-                        data,
-                        str(e)
-                    )
-                    
+            await self.consumers['enrichment'].run(
+                [self.config.TOPICS['extracted_data']],
+                self._handle_extracted_data,
+                self._transactional_producer(),
+                self._failure_router('enrichment')
+            )
         except Exception as e:
             logger.error(f"Data enrichment error: {str(e)}")
             raise
@@ -128,51 +130,180 @@ class DataProcessor:
     async def validate_profile_data(self):
         """Validate enriched profile data"""
         try:
-            self.validation_consumer.subscribe([self.config.TOPICS['enriched_data']])
-            
-            while True:
-                msg = self.validation_consumer.poll(1.0)
-                
-                if msg is None:
-                    continue
-                
-                if msg.error():
-                    logger.error(f"Consumer error: {msg.error()}")
-                    continue
-                
-                try:
-                    # Parse message
-                    data = json.loads(msg.value())
-                    
-                    # Validate data
-                    validated_data = await self.validate_data(data)
-                    
-                    # Produce validated data
-                    await self.producer.produce(
-                        self.config.TOPICS['validated_data'],
-                        key=msg.key(),
-                        value=json.dumps(validated_data)
-                    )
-                    
-                    self.validation_consumer.commit()
-                    
-                except Exception as e:
-                    logger.error(f"Failed to validate data: {str(e)}")
-                    await self.handle_processing_failure(
-                        'validation',
-                        data,
-                        str(e)
-                    )
-                    
+            await self.consumers['validation'].run(
+                [self.config.TOPICS['enriched_data']],
+                self._handle_enriched_data,
+                self._transactional_producer(),
+                self._failure_router('validation')
+            )
         except Exception as e:
             logger.error(f"Data validation error: {str(e)}")
             raise
     
+    async def _handle_raw_html(self, msg: Message):
+        """Extract profile data from one raw HTML message"""
+        observe_stage_wait('extraction', msg)
+        data = None
+        try:
+            # Parse message
+            data = self.producer.codec.decode(msg.value())
+            
+            # Extract data from HTML, loading offloaded bodies from the blob store
+            html_content = await self.producer.claim_check.aresolve(data, 'html_content')
+            extracted_data = await self.extract_profile_data(html_content)
+            
+            # Produce extracted data
+            await self.producer.produce(
+                self.config.TOPICS['extracted_data'],
+                key=profile_key(extracted_data, default=data['url']),
+                value=self.producer.codec.encode('profile', extracted_data),
+                headers=origin_headers(msg),
+                wait=True
+            )
+        
+        except Exception as e:
+            logger.error(f"Failed to process HTML: {str(e)}")
+            await self.handle_processing_failure(
+                'extraction',
+                data,
+                str(e),
+                type(e).__name__
+            )
+    
+    async def _handle_extracted_data(self, msg: Message):
+        """Enrich one extracted profile message"""
+        observe_stage_wait('enrichment', msg)
+        data = None
+        try:
+            # Parse message
+            data = self.producer.codec.decode(msg.value())
+            
+            # Enrich data with additional information
+            enriched_data = await self.enrich_data(data)
+            
+            # Produce enriched data
+            await self.producer.produce(
+                self.config.TOPICS['enriched_data'],
+                key=msg.key(),
+                value=self.producer.codec.encode('profile', enriched_data),
+                headers=origin_headers(msg),
+                wait=True
+            )
+        
+        except Exception as e:
+            logger.error(f"Failed to enrich data: {str(e)}")
+            await self.handle_processing_failure(
+                'enrichment',
+                data,
+                str(e),
+                type(e).__name__
+            )
+    
+    async def _handle_enriched_data(self, msg: Message):
+        """Validate one enriched profile message"""
+        observe_stage_wait('validation', msg)
+        data = None
+        try:
+            # Parse message
+            data = self.producer.codec.decode(msg.value())
+            
+            # Validate data
+            validated_data = await self.validate_data(data)
+            
+            # Produce validated data
+            await self.producer.produce(
+                self.config.TOPICS['validated_data'],
+                key=msg.key(),
+                value=self.producer.codec.encode('profile', validated_data),
+                headers=origin_headers(msg),
+                wait=True
+            )
+            observe_message_age(msg)
+        
+        except Exception as e:
+            logger.error(f"Failed to validate data: {str(e)}")
+            await self.handle_processing_failure(
+                'validation',
+                data,
+                str(e),
+                type(e).__name__
+            )
+    
+    async def extract_profile_data(self, html_content: str) -> Dict[str, Any]:
+        """Extraction stage: profile fields from raw HTML"""
+        return extract_profile_fields(html_content)
+    
+    async def enrich_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Enrichment stage"""
+        if self.enricher is None:
+            return data
+        return await self.enricher.enrich(data)
+    
+    async def validate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validation stage: raises if the profile fails validation"""
+        if self.validator is not None and not await self.validator.validate(data):
+            raise ValueError("Data validation failed")
+        return {
+            **data,
+            'validation': {
+                'status': 'valid',
+                'timestamp': datetime.utcnow().isoformat()
+            }
+        }
+    
+    async def process_fused(
+        self,
+        url: str,
+        html_content: str,
+        publish: bool = True,
+        record_failures: bool = True
+    ) -> Dict[str, Any]:
+        """Run extraction, enrichment and validation in memory for one request
+        
+        Interactive lookups use this to skip the Kafka hops between stages; it
+        runs the same stage methods as the streaming path. With `publish` the
+        result is also written to the validated topic for downstream sinks.
+        """
+        start_time = time.perf_counter()
+        stage = 'extraction'
+        data: Dict[str, Any] = {'url': url}
+        try:
+            data = await self.extract_profile_data(html_content)
+            stage = 'enrichment'
+            data = await self.enrich_data(data)
+            stage = 'validation'
+            data = await self.validate_data(data)
+        except Exception as e:
+            logger.error(f"Fused {stage} failed for {url}: {str(e)}")
+            if record_failures:
+                await self.handle_processing_failure(stage, data, str(e), type(e).__name__)
+            raise
+        
+        data['pipeline'] = {
+            'mode': 'fused',
+            'duration_ms': (time.perf_counter() - start_time) * 1000
+        }
+        if publish:
+            await self.producer.produce(
+                self.config.TOPICS['validated_data'],
+                key=profile_key(data, default=url),
+                value=self.producer.codec.encode('profile', data)
+            )
+        return data
+    
+    async def close(self, close_producer: bool = True):
+        """Stop the stage consumers and flush the producer"""
+        for consumer in self.consumers.values():
+            await consumer.close()
+        if close_producer:
+            await self.producer.close()
+    
     async def handle_processing_failure(
         self,
         stage: str,
         data: Dict,
-        error: str
+        error: str,
+        error_type: Optional[str] = None
     ):
         """Handle processing failures"""
         try:
@@ -180,19 +311,20 @@ class DataProcessor:
                 'stage': stage,
                 'data': data,
                 'error': error,
+                'error_type': error_type,
                 'timestamp': datetime.utcnow().isoformat()
             }
             
             await self.producer.produce(
                 self.config.TOPICS['failed_processing'],
-                value=json.dumps(failure_record)
+                value=self.producer.codec.encode('processing_failure', failure_record)
             )
             
             await self.producer.produce_audit_log(
                 f'{stage}_failure',
                 failure_record
             )
-            
+        
         except Exception as e:
             logger.error(f"Failed to handle processing failure: {str(e)}")
             raise
\ No newline at end of file
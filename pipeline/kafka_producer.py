@@ -1,40 +1,103 @@
-from typing import Dict
-import json
+from typing import Dict, Optional, Union
 import logging
 from datetime import datetime
-from confluent_kafka import Producer
 from .kafka_config import KafkaConfig
+from .async_producer import AsyncProducer
+from .kafka_clients import create_producer
+from .blob_store import LocalBlobStore, ClaimCheck
+from .envelope import EnvelopeCodec
+from .audit_sink import AuditSink
+from .partitioning import profile_key
+from .flow_metrics import new_origin_headers
 
 logger = logging.getLogger(__name__)
 
 class DataProducer:
     """Handles data production to Kafka topics"""
     
-    def __init__(self, kafka_config: KafkaConfig):
+    def __init__(self, kafka_config: KafkaConfig, transactional_id: Optional[str] = None):
         self.config = kafka_config
-        self.producer = Producer({
+        settings = {
             'bootstrap.servers': kafka_config.BOOTSTRAP_SERVERS,
             'queue.buffering.max.messages': 100000,
             'queue.buffering.max.ms': 1000,
             'batch.size': 65536,
-            'linger.ms': 50
-        })
+            'linger.ms': 50,
+            'compression.type': kafka_config.COMPRESSION_TYPE
+        }
+        self.transactional_id = transactional_id
+        if transactional_id:
+            settings.update({
+                'enable.idempotence': True,
+                'acks': 'all',
+                'transactional.id': transactional_id,
+                'transaction.timeout.ms': kafka_config.TRANSACTION_TIMEOUT_MS
+            })
+        self.producer = AsyncProducer(
+            settings,
+            producer=create_producer(kafka_config, settings)
+        )
+        self.claim_check = ClaimCheck(
+            LocalBlobStore(kafka_config.BLOB_STORE_PATH),
+            kafka_config.CLAIM_CHECK_THRESHOLD
+        )
+        self.codec = EnvelopeCodec()
+        
+        # Audit events go through their own producer with longer batching, so
+        # they never queue ahead of pipeline data or wait on the broker inline
+        audit_settings = {
+            **{k: v for k, v in settings.items() if not k.startswith(('transaction', 'enable.idempotence'))},
+            'linger.ms': 500,
+            'acks': 1
+        }
+        self.audit = AuditSink(
+            AsyncProducer(audit_settings, producer=create_producer(kafka_config, audit_settings)),
+            kafka_config.TOPICS['audit_logs'],
+            kafka_config.AUDIT_SPOOL_DIR,
+            codec=self.codec,
+            max_buffer=kafka_config.AUDIT_BUFFER_SIZE,
+            batch_size=kafka_config.AUDIT_BATCH_SIZE,
+            flush_interval=kafka_config.AUDIT_FLUSH_INTERVAL,
+            delivery_timeout=kafka_config.AUDIT_DELIVERY_TIMEOUT
+        )
     
-    async def produce_raw_html(self, url: str, html_content: str):
+    async def start(self):
+        """Start background delivery handling"""
+        await self.producer.start()
+        await self.audit.start()
+    
+    async def close(self):
+        """Flush outstanding messages and stop the producer"""
+        await self.audit.close()
+        await self.producer.close()
+    
+    async def produce(
+        self,
+        topic: str,
+        value: Union[str, bytes],
+        key: Optional[Union[str, bytes]] = None,
+        wait: bool = False,
+        headers: Optional[Dict[str, Union[str, bytes]]] = None
+    ):
+        """Produce a message, optionally waiting for broker acknowledgement"""
+        return await self.producer.produce(topic, value=value, key=key, headers=headers, wait=wait)
+    
+    async def produce_raw_html(self, url: str, html_content: str, wait: bool = False):
         """Produce raw HTML content to Kafka"""
         try:
             message = {
                 'url': url,
-                'html_content': html_content,
+                **await self.claim_check.apack('html_content', html_content),
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            self.producer.produce(
+            await self.produce(
                 self.config.TOPICS['raw_html'],
-                key=url,
-                value=json.dumps(message)
+                key=profile_key({'url': url}),
+                value=self.codec.encode('raw_html', message),
+                headers=new_origin_headers(),
+                wait=wait
             )
-            self.producer.flush()
             
             await self.produce_audit_log(
                 'raw_html_produced',
@@ -50,7 +113,7 @@ class DataProducer:
             raise
     
     async def produce_audit_log(self, event_type: str, event_data: Dict):
-        """Produce audit log messages"""
+        """Queue an audit log message on the batched audit channel"""
         try:
             audit_message = {
                 'event_type': event_type,
@@ -58,11 +121,8 @@ class DataProducer:
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            self.producer.produce(
-                self.config.TOPICS['audit_logs'],
-                value=json.dumps(audit_message)
-            )
-            self.producer.flush()
+            await self.audit.start()
+            self.audit.record(audit_message)
             
         except Exception as e:
             logger.error(f"Failed to produce audit log: {str(e)}")
@@ -0,0 +1,367 @@
+"""In-process stand-in for the subset of confluent_kafka the pipeline uses.
+
+Topics are partitioned in-memory logs; consumer groups split partitions
+between their members and track committed offsets, so pipeline code can run
+end to end on a laptop without a broker. Producers, consumers and admin
+clients created with the same `bootstrap.servers` share one broker.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+import threading
+import time
+import zlib
+from confluent_kafka import TopicPartition, KafkaException
+from confluent_kafka.admin import ClusterMetadata, TopicMetadata, PartitionMetadata
+
+OFFSET_INVALID = -1001
+TIMESTAMP_CREATE_TIME = 1
+
+class MemoryMessage:
+    """Message with the confluent_kafka.Message accessor API"""
+
+    __slots__ = ('_topic', '_partition', '_offset', '_key', '_value', '_headers', '_timestamp')
+
+    def __init__(self, topic, partition, offset, key, value, headers, timestamp):
+        self._topic = topic
+        self._partition = partition
+        self._offset = offset
+        self._key = key
+        self._value = value
+        # Delivered headers are (key, bytes) pairs, as confluent_kafka returns them
+        self._headers = [
+            (k, v.encode('utf-8') if isinstance(v, str) else v)
+            for k, v in (headers.items() if isinstance(headers, dict) else headers)
+        ] if headers else None
+        self._timestamp = timestamp
+
+    def topic(self):
+        return self._topic
+
+    def partition(self):
+        return self._partition
+
+    def offset(self):
+        return self._offset
+
+    def key(self):
+        return self._key
+
+    def value(self):
+        return self._value
+
+    def headers(self):
+        return self._headers
+
+    def timestamp(self) -> Tuple[int, int]:
+        return TIMESTAMP_CREATE_TIME, self._timestamp
+
+    def error(self):
+        return None
+
+    def __len__(self):
+        return len(self._value) if self._value else 0
+
+class MemoryBroker:
+    """Partitioned topic logs, consumer group membership and committed offsets"""
+
+    _brokers: Dict[str, 'MemoryBroker'] = {}
+    _brokers_lock = threading.Lock()
+
+    def __init__(self, default_partitions: int = 3):
+        self.default_partitions = default_partitions
+        self.topics: Dict[str, List[List[MemoryMessage]]] = {}
+        self.committed: Dict[Tuple[str, str, int], int] = {}
+        self.groups: Dict[str, List['MemoryConsumer']] = {}
+        self.generation = 0
+        self.condition = threading.Condition()
+
+    @classmethod
+    def for_servers(cls, bootstrap_servers: str) -> 'MemoryBroker':
+        """Shared broker for a `bootstrap.servers` value"""
+        with cls._brokers_lock:
+            if bootstrap_servers not in cls._brokers:
+                cls._brokers[bootstrap_servers] = cls()
+            return cls._brokers[bootstrap_servers]
+
+    @classmethod
+    def reset(cls, bootstrap_servers: Optional[str] = None):
+        """Drop one shared broker, or all of them"""
+        with cls._brokers_lock:
+            if bootstrap_servers is None:
+                cls._brokers.clear()
+            else:
+                cls._brokers.pop(bootstrap_servers, None)
+
+    def create_topic(self, topic: str, num_partitions: Optional[int] = None):
+        with self.condition:
+            if topic not in self.topics:
+                self.topics[topic] = [[] for _ in range(num_partitions or self.default_partitions)]
+
+    def partitions(self, topic: str) -> List[List[MemoryMessage]]:
+        if topic not in self.topics:
+            self.create_topic(topic)
+        return self.topics[topic]
+
+    def append(self, topic: str, partition: int, key, value, headers) -> MemoryMessage:
+        with self.condition:
+            log = self.partitions(topic)[partition]
+            msg = MemoryMessage(topic, partition, len(log), key, value, headers, int(time.time() * 1000))
+            log.append(msg)
+            self.condition.notify_all()
+            return msg
+
+    def join(self, consumer: 'MemoryConsumer'):
+        with self.condition:
+            members = self.groups.setdefault(consumer.group_id, [])
+            if consumer not in members:
+                members.append(consumer)
+                self.generation += 1
+
+    def leave(self, consumer: 'MemoryConsumer'):
+        with self.condition:
+            members = self.groups.get(consumer.group_id, [])
+            if consumer in members:
+                members.remove(consumer)
+                self.generation += 1
+
+    def assignment(self, consumer: 'MemoryConsumer') -> List[Tuple[str, int]]:
+        """Partitions of the consumer's topics it owns, spread round-robin over the group"""
+        assigned = []
+        for topic in consumer.topics:
+            members = [m for m in self.groups.get(consumer.group_id, []) if topic in m.topics]
+            if consumer not in members:
+                continue
+            index = members.index(consumer)
+            for partition in range(len(self.partitions(topic))):
+                if partition % len(members) == index:
+                    assigned.append((topic, partition))
+        return assigned
+
+    def metadata(self, topic: Optional[str] = None) -> ClusterMetadata:
+        """Cluster metadata for one existing topic, or all of them"""
+        metadata = ClusterMetadata()
+        with self.condition:
+            for name in [topic] if topic is not None else list(self.topics):
+                if name not in self.topics:
+                    continue
+                topic_metadata = TopicMetadata()
+                topic_metadata.topic = name
+                for partition in range(len(self.topics[name])):
+                    partition_metadata = PartitionMetadata()
+                    partition_metadata.id = partition
+                    topic_metadata.partitions[partition] = partition_metadata
+                metadata.topics[name] = topic_metadata
+        return metadata
+
+    def high_watermark(self, topic: str, partition: int) -> int:
+        return len(self.partitions(topic)[partition])
+
+    def group_lag(self, group_id: str, topic: str) -> Dict[int, int]:
+        """Uncommitted messages per partition for a consumer group"""
+        lag = {}
+        for partition in range(len(self.partitions(topic))):
+            committed = self.committed.get((group_id, topic, partition), 0)
+            lag[partition] = self.high_watermark(topic, partition) - committed
+        return lag
+
+def _partition_for(key, partitions: int, counter: int) -> int:
+    if key is None:
+        return counter % partitions
+    data = key.encode('utf-8') if isinstance(key, str) else key
+    return zlib.crc32(data) % partitions
+
+class MemoryProducer:
+    """Producer with the confluent_kafka.Producer API used by the pipeline"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.broker = MemoryBroker.for_servers(config.get('bootstrap.servers', 'memory'))
+        self._pending: List[Tuple[Any, MemoryMessage]] = []
+        self._ready = threading.Condition()
+        self._counter = 0
+        # Open transaction: messages and group offsets held back until commit
+        self._transaction: Optional[List[Tuple[str, int, Any, Any, Any]]] = None
+        self._transaction_offsets: Dict[Tuple[str, str, int], int] = {}
+
+    def produce(self, topic, value=None, key=None, partition=-1, on_delivery=None, headers=None, **kwargs):
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        partitions = len(self.broker.partitions(topic))
+        if partition < 0:
+            self._counter += 1
+            partition = _partition_for(key, partitions, self._counter)
+        if self._transaction is not None:
+            # Only committed messages become visible, as for read_committed consumers
+            self._transaction.append((topic, partition, key, value, headers))
+            msg = MemoryMessage(topic, partition, -1, key, value, headers, int(time.time() * 1000))
+        else:
+            msg = self.broker.append(topic, partition, key, value, headers)
+        with self._ready:
+            self._pending.append((on_delivery or kwargs.get('callback'), msg))
+            self._ready.notify()
+
+    def poll(self, timeout: float = 0) -> int:
+        """Fire delivery callbacks, waiting up to `timeout` for a message"""
+        with self._ready:
+            if not self._pending and timeout:
+                self._ready.wait(timeout)
+            pending, self._pending = self._pending, []
+        for callback, msg in pending:
+            if callback:
+                callback(None, msg)
+        return len(pending)
+
+    def flush(self, timeout: float = None) -> int:
+        self.poll(0)
+        return 0
+
+    def init_transactions(self, timeout: float = None):
+        if not self.config.get('transactional.id'):
+            raise KafkaException("transactional.id is not configured")
+
+    def begin_transaction(self):
+        if self._transaction is not None:
+            raise KafkaException("A transaction is already in progress")
+        self._transaction = []
+        self._transaction_offsets = {}
+
+    def send_offsets_to_transaction(self, positions: List[TopicPartition], group_metadata, timeout: float = None):
+        for tp in positions:
+            self._transaction_offsets[(group_metadata, tp.topic, tp.partition)] = tp.offset
+
+    def commit_transaction(self, timeout: float = None):
+        self.flush()
+        with self.broker.condition:
+            for topic, partition, key, value, headers in self._transaction or []:
+                self.broker.append(topic, partition, key, value, headers)
+            self.broker.committed.update(self._transaction_offsets)
+        self._transaction = None
+        self._transaction_offsets = {}
+
+    def abort_transaction(self, timeout: float = None):
+        self._transaction = None
+        self._transaction_offsets = {}
+
+    def __len__(self):
+        return len(self._pending)
+
+class MemoryConsumer:
+    """Consumer with the confluent_kafka.Consumer API used by the pipeline"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.broker = MemoryBroker.for_servers(config.get('bootstrap.servers', 'memory'))
+        self.group_id = config.get('group.id', 'default')
+        self.reset_earliest = config.get('auto.offset.reset', 'latest') in ('earliest', 'smallest', 'beginning')
+        self.topics: List[str] = []
+        self.positions: Dict[Tuple[str, int], int] = {}
+        self._generation = -1
+        self._next = 0
+
+    def subscribe(self, topics: List[str], **kwargs):
+        self.topics = list(topics)
+        for topic in self.topics:
+            self.broker.partitions(topic)
+        self.broker.join(self)
+
+    def _refresh_assignment(self):
+        if self._generation == self.broker.generation:
+            return
+        self._generation = self.broker.generation
+        assigned = self.broker.assignment(self)
+        positions = {}
+        for tp in assigned:
+            committed = self.broker.committed.get((self.group_id, *tp))
+            if committed is None:
+                committed = 0 if self.reset_earliest else self.broker.high_watermark(*tp)
+            positions[tp] = self.positions.get(tp, committed)
+        self.positions = positions
+
+    def assignment(self) -> List[TopicPartition]:
+        with self.broker.condition:
+            self._refresh_assignment()
+            return [TopicPartition(t, p) for t, p in self.positions]
+
+    def _take(self, limit: int) -> List[MemoryMessage]:
+        self._refresh_assignment()
+        taken = []
+        partitions = list(self.positions)
+        for i in range(len(partitions)):
+            tp = partitions[(self._next + i) % len(partitions)]
+            log = self.broker.topics[tp[0]][tp[1]]
+            position = self.positions[tp]
+            chunk = log[position:position + limit - len(taken)]
+            taken.extend(chunk)
+            self.positions[tp] = position + len(chunk)
+            if len(taken) >= limit:
+                break
+        self._next += 1
+        return taken
+
+    def consume(self, num_messages: int = 1, timeout: float = -1) -> List[MemoryMessage]:
+        deadline = time.monotonic() + (timeout if timeout >= 0 else 3600)
+        with self.broker.condition:
+            while True:
+                messages = self._take(num_messages)
+                remaining = deadline - time.monotonic()
+                if messages or remaining <= 0:
+                    return messages
+                self.broker.condition.wait(remaining)
+
+    def poll(self, timeout: float = -1) -> Optional[MemoryMessage]:
+        messages = self.consume(1, timeout)
+        return messages[0] if messages else None
+
+    def commit(self, message=None, offsets=None, asynchronous: bool = True):
+        with self.broker.condition:
+            if message is not None:
+                commits = [(message.topic(), message.partition(), message.offset() + 1)]
+            elif offsets is not None:
+                commits = [(tp.topic, tp.partition, tp.offset) for tp in offsets]
+            else:
+                commits = [(t, p, offset) for (t, p), offset in self.positions.items()]
+            for topic, partition, offset in commits:
+                self.broker.committed[(self.group_id, topic, partition)] = offset
+        return None if asynchronous else [TopicPartition(t, p, o) for t, p, o in commits]
+
+    def committed(self, partitions: List[TopicPartition], timeout: float = None) -> List[TopicPartition]:
+        return [
+            TopicPartition(
+                tp.topic,
+                tp.partition,
+                self.broker.committed.get((self.group_id, tp.topic, tp.partition), OFFSET_INVALID)
+            )
+            for tp in partitions
+        ]
+
+    def consumer_group_metadata(self) -> str:
+        return self.group_id
+
+    def seek(self, partition: TopicPartition):
+        with self.broker.condition:
+            self.positions[(partition.topic, partition.partition)] = partition.offset
+
+    def get_watermark_offsets(self, partition: TopicPartition, timeout: float = None, cached: bool = False) -> Tuple[int, int]:
+        return 0, self.broker.high_watermark(partition.topic, partition.partition)
+
+    def list_topics(self, topic: Optional[str] = None, timeout: float = -1) -> ClusterMetadata:
+        return self.broker.metadata(topic)
+
+    def close(self):
+        self.broker.leave(self)
+        self.positions = {}
+
+class MemoryAdminClient:
+    """Admin client supporting topic creation"""
+
+    def __init__(self, config: Dict[str, Any]):
+        self.broker = MemoryBroker.for_servers(config.get('bootstrap.servers', 'memory'))
+
+    def create_topics(self, new_topics, **kwargs) -> Dict[str, Any]:
+        for new_topic in new_topics:
+            self.broker.create_topic(new_topic.topic, new_topic.num_partitions)
+        return {new_topic.topic: None for new_topic in new_topics}
+
+    def list_topics(self, topic: Optional[str] = None, timeout: float = -1) -> ClusterMetadata:
+        return self.broker.metadata(topic)
@@ -1,10 +1,10 @@
-```python
 import asyncio
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from prometheus_client import Histogram, Counter
 from .stages.data_collector import DataCollector
+from .adaptive_limiter import AdaptiveLimiter, Slot, is_overload
 from cache.redis_manager import RedisManager
 
 logger = logging.getLogger(__name__)
@@ -27,17 +27,21 @@ class ParallelCollector:
         self.collector = DataCollector()
         self.redis = redis_manager
         self.batch_size = 50
-        self.max_concurrent = 5
+        # Shared by every batch, so the limit learned from one carries over
+        self.limiter = AdaptiveLimiter('parallel_collector')
+
+    @property
+    def max_concurrent(self) -> int:
+        return self.limiter.max_in_flight
 
     async def collect_batch(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Collect data for multiple profiles in parallel."""
         try:
-            semaphore = asyncio.Semaphore(self.max_concurrent)
             tasks = []
 
             # Create collection tasks
             for profile in profiles:
-                task = self._collect_with_semaphore(semaphore, profile)
+                task = self._collect_with_limit(profile)
                 tasks.append(task)
 
             # Execute tasks in parallel
@@ -58,38 +62,34 @@ class ParallelCollector:
             logger.error(f"Batch collection error: {str(e)}")
             raise
 
-    async def _collect_with_semaphore(
-        self,
-        semaphore: asyncio.Semaphore,
-        profile: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Collect data with semaphore for concurrency control."""
-        async with semaphore:
-            start_time = datetime.now()
-            try:
-                # Check cache first
-                cache_key = f"profile_data:{profile['id']}"
-                cached_data = await self.redis.get(cache_key)
-                if cached_data:
-                    return cached_data
-
-                # Collect data from sources
-                collected_data = await self._collect_from_sources(profile)
-
-                # Cache the results
-                await self.redis.set(
-                    cache_key,
-                    collected_data,
-                    expiry=3600  # 1 hour cache
-                )
-
-                return collected_data
-
-            finally:
-                duration = (datetime.now() - start_time).total_seconds()
-                collection_duration.labels(source='parallel').observe(duration)
-
-    async def _collect_from_sources(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+    async def _collect_with_limit(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect data under the adaptive concurrency limit."""
+        start_time = datetime.now()
+        try:
+            # Check cache first; hits never reach the sources, so they take no slot
+            cache_key = f"profile_data:{profile['id']}"
+            cached_data = await self.redis.get(cache_key)
+            if cached_data:
+                return cached_data
+
+            # Collect data from sources
+            async with self.limiter.slot() as slot:
+                collected_data = await self._collect_from_sources(profile, slot)
+
+            # Cache the results
+            await self.redis.set(
+                cache_key,
+                collected_data,
+                expiry=3600  # 1 hour cache
+            )
+
+            return collected_data
+
+        finally:
+            duration = (datetime.now() - start_time).total_seconds()
+            collection_duration.labels(source='parallel').observe(duration)
+
+    async def _collect_from_sources(self, profile: Dict[str, Any], slot: Optional[Slot] = None) -> Dict[str, Any]:
         """Collect data from multiple sources in parallel."""
         tasks = [
             self._collect_linkedin_data(profile),
@@ -106,10 +106,16 @@ class ParallelCollector:
         }
 
         for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Source collection error: {str(result)}")
+            # DataCollector reports its API and web failures in `errors`
+            # rather than raising them
+            errors = [result] if isinstance(result, Exception) else result.get('errors', [])
+            for error in errors:
+                logger.error(f"Source collection error: {str(error)}")
                 collection_errors.labels(source='individual').inc()
-            else:
+                # A saturated source is still a signal to back off
+                if slot is not None and is_overload(error):
+                    slot.overload()
+            if not isinstance(result, Exception):
                 combined_data.update(result.get('data', {}))
                 combined_data['sources'].extend(result.get('sources', []))
 
@@ -147,4 +153,3 @@ class ParallelCollector:
         except Exception as e:
             collection_errors.labels(source='contact').inc()
             raise
-```
\ No newline at end of file
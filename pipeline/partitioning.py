@@ -0,0 +1,26 @@
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL for keying: no scheme, no www, no trailing slash, lowercase"""
+    parsed = urlparse(url.strip().lower())
+    host = parsed.netloc or parsed.path.split('/')[0]
+    path = parsed.path if parsed.netloc else parsed.path[len(host):]
+    if host.startswith('www.'):
+        host = host[4:]
+    return f"{host}{path}".rstrip('/')
+
+def profile_key(record: Dict[str, Any], default: Optional[str] = None) -> Optional[str]:
+    """Stable partition key for a profile record.
+
+    The strongest identity available wins, so every stage keys the same
+    person the same way and Kafka keeps that person's records in order on
+    one partition.
+    """
+    if linkedin_url := record.get('linkedin_url'):
+        return f"linkedin:{normalize_url(linkedin_url)}"
+    if email := record.get('email'):
+        return f"email:{email.strip().lower()}"
+    if url := record.get('url') or default:
+        return f"url:{normalize_url(url)}"
+    return None
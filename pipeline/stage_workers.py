@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import multiprocessing
+from .kafka_config import KafkaConfig
+from .kafka_producer import DataProducer
+from .kafka_processor import DataProcessor
+from .blob_store import LocalBlobStore
+from .stages.data_enricher import DataEnricher
+from .stages.data_validator import DataValidator
+
+logger = logging.getLogger(__name__)
+
+class StageWorkerPool:
+    """Runs several consumers per pipeline stage in the stage's consumer group.
+
+    Kafka spreads each topic's partitions across the workers of a group, so
+    a stage can use as many workers as its input topic has partitions.
+    Workers in one process share a producer, except in exactly-once mode
+    where each needs its own transactional producer; `run_processes` starts
+    several such pools to use more CPU cores. Pools running extraction
+    also purge offloaded HTML bodies past `BLOB_RETENTION`. Enrichment
+    and validation workers share one `DataEnricher` and `DataValidator`.
+    """
+
+    def __init__(
+        self,
+        kafka_config: KafkaConfig,
+        stage_workers: Optional[Dict[str, int]] = None,
+        enricher: Optional[Any] = None,
+        validator: Optional[Any] = None
+    ):
+        self.config = kafka_config
+        self.stage_workers = stage_workers or dict(kafka_config.STAGE_WORKERS)
+        self.enricher = enricher
+        self.validator = validator
+        self.producer: Optional[DataProducer] = None
+        self.processors: List[DataProcessor] = []
+
+    def _check_partitions(self):
+        for stage, workers in self.stage_workers.items():
+            partitions = self.config.TOPIC_PARTITIONS.get(self.config.STAGE_INPUT_TOPICS[stage], 3)
+            if workers > partitions:
+                logger.warning(
+                    f"{stage} has {workers} workers but only {partitions} partitions; "
+                    f"{workers - partitions} will sit idle"
+                )
+
+    async def run(self):
+        """Start every worker and run until cancelled"""
+        self._check_partitions()
+        if not self.config.EXACTLY_ONCE:
+            self.producer = DataProducer(self.config)
+            await self.producer.start()
+        if self.stage_workers.get('enrichment') and self.enricher is None:
+            self.enricher = DataEnricher()
+        if self.stage_workers.get('validation') and self.validator is None:
+            self.validator = DataValidator()
+
+        tasks = []
+        for stage, workers in self.stage_workers.items():
+            for _ in range(workers):
+                processor = DataProcessor(
+                    self.config,
+                    stages=[stage],
+                    producer=self.producer,
+                    enricher=self.enricher,
+                    validator=self.validator
+                )
+                self.processors.append(processor)
+                tasks.append(processor.run_stage(stage))
+        if self.stage_workers.get('extraction'):
+            # Extraction is the last reader of offloaded HTML bodies
+            blob_store = LocalBlobStore(self.config.BLOB_STORE_PATH)
+            tasks.append(blob_store.run_purge(self.config.BLOB_RETENTION, self.config.BLOB_PURGE_INTERVAL))
+
+        logger.info(f"Started stage workers: {self.stage_workers}")
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Close every worker's consumers, then flush the shared producer"""
+        for processor in self.processors:
+            await processor.close(close_producer=processor.producer is not self.producer)
+        self.processors = []
+        if self.producer:
+            await self.producer.close()
+            self.producer = None
+
+def _run_pool_process(stage_workers: Dict[str, int]):
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(StageWorkerPool(KafkaConfig(), stage_workers).run())
+
+def run_processes(processes: int, stage_workers: Optional[Dict[str, int]] = None):
+    """Run `processes` worker pools in separate processes and wait for them"""
+    stage_workers = stage_workers or dict(KafkaConfig.STAGE_WORKERS)
+    children = [
+        multiprocessing.Process(target=_run_pool_process, args=(stage_workers,), daemon=False)
+        for _ in range(processes)
+    ]
+    for child in children:
+        child.start()
+    for child in children:
+        child.join()
@@ -0,0 +1,11 @@
+from .data_collector import DataCollector
+from .data_processor import DataProcessor
+from .data_validator import DataValidator
+from .data_enricher import DataEnricher
+
+__all__ = [
+    'DataCollector',
+    'DataProcessor',
+    'DataValidator',
+    'DataEnricher'
+]
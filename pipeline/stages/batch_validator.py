@@ -0,0 +1,179 @@
+from typing import Dict, Any, List, Optional, Set, Union
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from config.settings import PIPELINE_CONFIG
+from pipeline.stages.compiled_validator import (
+    EMAIL_PATTERN, PHONE_PATTERN, URL_PATTERN, DATE_FIELDS, NUMERIC_FIELDS, flatten_record
+)
+
+logger = logging.getLogger(__name__)
+
+PATTERN_CHECKS = [
+    ('quality.email', 'email', EMAIL_PATTERN),
+    ('quality.phone', 'phone', PHONE_PATTERN),
+    ('quality.url', 'linkedin_url', URL_PATTERN)
+]
+
+@dataclass
+class BatchValidationResult:
+    """Outcome of a batch: `valid[i]` for record i, and one boolean failure column per rule"""
+    valid: np.ndarray
+    failures: pd.DataFrame
+
+    @property
+    def invalid_count(self) -> int:
+        return int((~self.valid).sum())
+
+def batch_fields(validation_rules: Dict[str, Any]) -> List[str]:
+    """Every field a batch validation reads"""
+    fields = list(validation_rules.get('required_fields', []))
+    for name in [
+        'email', 'phone', 'linkedin_url', 'full_name', 'first_name', 'last_name',
+        *DATE_FIELDS, *NUMERIC_FIELDS
+    ]:
+        if name not in fields:
+            fields.append(name)
+    return fields
+
+def _needs_walk(record: Any, fields: Set[str]) -> bool:
+    """Whether some field may sit below the top level of a record.
+
+    Only dicts, and lists holding dicts or lists, can hide a field, so a
+    record of scalars and scalar lists is read as it is.
+    """
+    if not isinstance(record, dict):
+        return True
+    if fields <= record.keys():
+        return False
+    # One pass over the value types rather than a check per value
+    kinds = set(map(type, record.values()))
+    if any(issubclass(kind, dict) for kind in kinds):
+        return True
+    return any(issubclass(kind, list) for kind in kinds) and any(
+        isinstance(item, (dict, list))
+        for value in record.values() if isinstance(value, list)
+        for item in value
+    )
+
+def to_columns(records: Union[pd.DataFrame, List[Dict[str, Any]]], fields: List[str]) -> pd.DataFrame:
+    """Load the fields of many records into one column each.
+
+    Records holding every field at the top level, or nothing nested, are
+    read column by column as they are. Only the others are resolved with
+    `flatten_record`, so a field is found wherever DataValidator would
+    find it. A DataFrame is taken to hold flat rows already and is only
+    reindexed.
+    """
+    if isinstance(records, pd.DataFrame):
+        return records.reindex(columns=fields)
+    wanted = set(fields)
+    return pd.DataFrame.from_records(
+        [flatten_record(record, wanted) if _needs_walk(record, wanted) else record for record in records],
+        columns=fields,
+        index=range(len(records))
+    )
+
+def _objects(column: pd.Series) -> pd.Series:
+    return column if column.dtype == object else column.astype(object)
+
+def _is_str(column: pd.Series) -> pd.Series:
+    return _objects(column).map(type).eq(str)
+
+def _truthy(column: pd.Series) -> pd.Series:
+    """Element-wise `bool(value)`, with missing values false"""
+    return column.notna() & _objects(column).astype(bool)
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+def _dates(column: pd.Series) -> pd.Series:
+    """Dates parsed as DataValidator parses them, None where a value does not parse.
+
+    `datetime.fromisoformat` rather than `pd.to_datetime`, which accepts
+    other strings and cannot hold dates outside 1677-2262.
+    """
+    return _objects(column).map(_parse_date, na_action='ignore')
+
+def _after(start: Optional[datetime], end: Optional[datetime]) -> bool:
+    """Whether a start date is after its end date; a naive and an aware date cannot be ordered"""
+    if start is None or end is None or pd.isna(start) or pd.isna(end):
+        return False
+    try:
+        return start > end
+    except TypeError:
+        return True
+
+def validate_batch(
+    records: Union[pd.DataFrame, List[Dict[str, Any]]],
+    validation_rules: Optional[Dict[str, Any]] = None
+) -> BatchValidationResult:
+    """Validate many records at once with column-wise checks.
+
+    Applies DataValidator's rules (required fields, email, phone and URL
+    formats, `min_confidence_score`, date order, name consistency, date and
+    numeric formats) and reports which rule each record failed. Resolving
+    fields in nested records is still a Python walk per record and
+    dominates the cost, so this is about as fast as validating one record
+    at a time; it exists for one verdict per record plus per-rule failure
+    columns over a whole batch.
+    """
+    try:
+        rules = validation_rules or PIPELINE_CONFIG['validation_rules']
+        columns = to_columns(records, batch_fields(rules))
+        failures: Dict[str, pd.Series] = {}
+
+        for name in rules.get('required_fields', []):
+            column = columns[name]
+            empty = _objects(column).map(
+                lambda value: isinstance(value, (str, list, dict)) and not value,
+                na_action='ignore'
+            )
+            failures[f'required.{name}'] = column.isna() | empty.fillna(False).astype(bool)
+
+        for rule, name, pattern in PATTERN_CHECKS:
+            column = _objects(columns[name])
+            strings = _is_str(column)
+            matched = column.where(strings, '').str.match(pattern)
+            failures[rule] = _truthy(column) & ~(strings & matched)
+
+        dates = {name: _dates(columns[name]) for name in DATE_FIELDS}
+        for name in DATE_FIELDS:
+            failures[f'format.date.{name}'] = _truthy(columns[name]) & dates[name].isna()
+
+        failures['consistency.dates'] = pd.Series(
+            [_after(start, end) for start, end in zip(dates['start_date'], dates['end_date'])],
+            index=columns.index,
+            dtype=bool
+        )
+
+        names = {name: _objects(columns[name]) for name in ('full_name', 'first_name', 'last_name')}
+        named = _truthy(names['full_name']) & _truthy(names['first_name']) & _truthy(names['last_name'])
+        joined = names['first_name'].astype(str) + ' ' + names['last_name'].astype(str)
+        failures['consistency.name'] = named & (names['full_name'].astype(str) != joined)
+
+        for name in NUMERIC_FIELDS:
+            column = columns[name]
+            if pd.api.types.is_numeric_dtype(column):
+                failures[f'format.numeric.{name}'] = pd.Series(False, index=columns.index)
+            else:
+                numeric = column.map(lambda value: isinstance(value, (int, float)))
+                failures[f'format.numeric.{name}'] = _truthy(column) & ~numeric
+
+        if 'min_confidence_score' in rules:
+            # Only numbers are compared; other values fail the numeric format check
+            scores = _objects(columns['confidence_score'])
+            numbers = scores.map(lambda value: isinstance(value, (int, float)))
+            failures['quality.min_score'] = numbers & (scores.where(numbers, np.inf) < rules['min_confidence_score'])
+
+        frame = pd.DataFrame(failures, index=columns.index).astype(bool)
+        return BatchValidationResult(valid=~frame.any(axis=1).to_numpy(), failures=frame)
+
+    except Exception as e:
+        logger.error(f"Batch validation error: {str(e)}")
+        raise
@@ -3,7 +3,7 @@ import asyncio
 from typing import Dict, Any, List
 import logging
 from bs4 import BeautifulSoup
-from ...config.settings import API_CONFIG
+from config.settings import API_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,8 @@ class DataCollector:
         
         return {
             'api_data': results[0] if not isinstance(results[0], Exception) else None,
-            'web_data': results[1] if not isinstance(results[1], Exception) else None
+            'web_data': results[1] if not isinstance(results[1], Exception) else None,
+            'errors': [r for r in results if isinstance(r, Exception)]
         }
         
     async def _collect_api_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,75 +1,106 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional
 import logging
 from datetime import datetime
 import asyncio
-from ...integrations import (
+from integrations import (
     LinkedInLeadSync,
     LexisNexisAPI,
     HunterAPI,
     RocketReachAPI,
     PeopleDataLabsAPI
 )
-from ...config.settings import API_CONFIG
+from integrations.field_provenance import stamp
+from integrations.source_planner import SOURCE_CATALOG, covered_by, filled_by, get_source_planner, missing_fields
+from config.settings import API_CONFIG, ENRICHMENT_PLANNER_CONFIG
 
 logger = logging.getLogger(__name__)
 
 class DataEnricher:
+    SOURCES = ['linkedin', 'lexisnexis', 'hunter', 'rocketreach', 'pdl']
+    
     def __init__(self):
         self.api_config = API_CONFIG
         self.apis = self._initialize_apis()
+        # Sources whose client could not be set up are never called
+        self.fetchers = {
+            source: getattr(self, f'_enrich_from_{source}') for source in self.SOURCES if source in self.apis
+        }
     
     def _initialize_apis(self) -> Dict[str, Any]:
-        """Initialize API clients."""
-        return {
-            'linkedin': LinkedInLeadSync(
-                self.api_config['linkedin']['access_token'],
-                self.api_config['linkedin']['organization_id']
-            ),
-            'lexisnexis': LexisNexisAPI(
-                self.api_config['lexisnexis']['api_key']
-            ),
-            'hunter': HunterAPI(
-                self.api_config['hunter']['api_key']
-            ),
-            'rocketreach': RocketReachAPI(
-                self.api_config['rocketreach']['api_key']
-            ),
-            'pdl': PeopleDataLabsAPI(
-                self.api_config['pdl']['api_key']
-            )
+        """Initialize API clients, skipping any that cannot be built."""
+        factories = {
+            'linkedin': lambda config: LinkedInLeadSync(config['access_token'], config['organization_id']),
+            'lexisnexis': lambda config: LexisNexisAPI(config['api_key']),
+            'hunter': lambda config: HunterAPI(config['api_key']),
+            'rocketreach': lambda config: RocketReachAPI(config['api_key']),
+            'pdl': lambda config: PeopleDataLabsAPI(config['api_key'])
         }
+        apis = {}
+        for source, factory in factories.items():
+            try:
+                apis[source] = factory(self.api_config[source])
+            except Exception as e:
+                logger.error(f"{source} client unavailable, skipping it: {str(e)}")
+        return apis
     
-    async def enrich(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Enrich data from multiple sources."""
+    def sources_for(self, fields: Optional[Iterable[str]] = None) -> List[str]:
+        """Sources `enrich` calls without the planner.
+        
+        With `fields`, only the sources that can fill one of them.
+        """
+        if fields is None:
+            return list(self.fetchers)
+        fields = set(fields)
+        return [
+            source for source in self.fetchers
+            if source in SOURCE_CATALOG and fields.intersection(SOURCE_CATALOG[source].fields)
+        ]
+    
+    async def enrich(self, data: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Enrich data from multiple sources.
+        
+        With `fields`, only those fields are (re-)fetched, even if present.
+        """
         try:
             enriched_data = data.copy()
+            fetchers = self.fetchers
+            wanted = list(ENRICHMENT_PLANNER_CONFIG['fields'] if fields is None else fields)
+            stale = () if fields is None else wanted
+            attempted = missing_fields(data, wanted, stale)
             
-            # Gather enrichment tasks
-            tasks = [
-                self._enrich_from_linkedin(data),
-                self._enrich_from_lexisnexis(data),
-                self._enrich_from_hunter(data),
-                self._enrich_from_rocketreach(data),
-                self._enrich_from_pdl(data)
-            ]
-            
-            # Execute enrichment tasks concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if ENRICHMENT_PLANNER_CONFIG['enabled']:
+                # Only call the sources likely to fill what the record lacks
+                results, unfilled = await get_source_planner().run(data, fetchers, wanted, stale)
+            else:
+                called = self.sources_for(None if fields is None else wanted)
+                outcomes = await asyncio.gather(
+                    *(fetchers[source](data) for source in called),
+                    return_exceptions=True
+                )
+                results = dict(zip(called, outcomes))
+                unfilled = attempted - set(filled_by(results))
             
             # Process results
-            for result in results:
+            for result in results.values():
                 if isinstance(result, Exception):
                     logger.error(f"Enrichment error: {str(result)}")
                     continue
                 if result:
                     enriched_data.update(result)
             
+            # Record where each attempted field came from, for partial re-enrichment;
+            # fields no answering source covers stay due
+            now = datetime.utcnow()
+            stamp(enriched_data, filled_by(results), attempted & covered_by(results), now)
+            
             # Add enrichment metadata
             enriched_data['enrichment_metadata'] = {
-                'timestamp': datetime.utcnow().isoformat(),
-                'sources': [source for source, result in zip(self.apis.keys(), results)
+                'timestamp': now.isoformat(),
+                'sources': [source for source, result in results.items()
                           if not isinstance(result, Exception) and result],
-                'success_rate': len([r for r in results if not isinstance(r, Exception)]) / len(results)
+                'skipped': [source for source in fetchers if source not in results],
+                'unfilled': sorted(unfilled),
+                'success_rate': len([r for r in results.values() if not isinstance(r, Exception)]) / max(len(results), 1)
             }
             
             return enriched_data
@@ -1,9 +1,30 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import math
 import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _is_missing(value: Any) -> bool:
+    """What `DataFrame.fillna` would fill"""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+def _result_rows(api_data: Any) -> Optional[List[Dict[str, Any]]]:
+    """The API results when they are plain dict rows, None when pandas has to handle them"""
+    if not isinstance(api_data, dict):
+        return None
+    results = api_data.get('results', [])
+    if isinstance(results, list) and all(isinstance(row, dict) for row in results):
+        return results
+    return None
+
+def _columns(rows: List[Dict[str, Any]]) -> List[str]:
+    """Union of the row keys in first-seen order, as DataFrame columns would be"""
+    columns: Dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    return list(columns)
+
 class DataProcessor:
     async def process(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process raw data into standardized format."""
@@ -19,11 +40,67 @@ class DataProcessor:
             logger.error(f"Data processing error: {str(e)}")
             raise
             
+    async def process_batch(self, raw_batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Process many raw records at once; results match `process` for each record."""
+        try:
+            return [
+                self._merge_data_sources({
+                    'api_data': self._process_api_data(raw_data.get('api_data')),
+                    'web_data': self._process_web_data(raw_data.get('web_data'))
+                })
+                for raw_data in raw_batch
+            ]
+            
+        except Exception as e:
+            logger.error(f"Batch data processing error: {str(e)}")
+            raise
+            
+    def process_api_frame(self, raw_batch: List[Dict[str, Any]]) -> pd.DataFrame:
+        """One DataFrame of every API result row in a batch, indexed by record position.
+
+        Built once per batch and filled like `process` fills each record,
+        for consumers that work on columns, such as `validate_batch`.
+        Results that are not plain rows are left out.
+        """
+        try:
+            rows: List[Dict[str, Any]] = []
+            positions: List[int] = []
+            for position, raw_data in enumerate(raw_batch):
+                record_rows = _result_rows(raw_data.get('api_data'))
+                if record_rows:
+                    rows.extend(record_rows)
+                    positions.extend([position] * len(record_rows))
+            frame = pd.DataFrame(rows, index=positions, dtype=object).fillna('')
+            return frame
+            
+        except Exception as e:
+            logger.error(f"API frame processing error: {str(e)}")
+            raise
+            
     def _process_api_data(self, api_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process API data."""
         if not api_data:
             return {}
             
+        try:
+            rows = _result_rows(api_data)
+            if rows is None:
+                return self._process_api_frame(api_data)
+            # Same output as the DataFrame round trip without building one per record
+            columns = _columns(rows)
+            if not columns:
+                return {}
+            return [
+                {column: '' if _is_missing(row.get(column)) else row[column] for column in columns}
+                for row in rows
+            ]
+            
+        except Exception as e:
+            logger.error(f"API data processing error: {str(e)}")
+            return {}
+            
+    def _process_api_frame(self, api_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Process API results that are not plain rows through pandas."""
         try:
             df = pd.DataFrame(api_data.get('results', []))
             if not df.empty:
@@ -2,7 +2,9 @@ from typing import Dict, Any, List
 import logging
 from datetime import datetime
 import re
-from ...config.settings import PIPELINE_CONFIG
+from config.settings import PIPELINE_CONFIG
+from pipeline.stages.batch_validator import validate_batch
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,10 @@ class DataValidator:
             logger.error(f"Validation error: {str(e)}")
             return False
     
+    def validate_batch(self, records: List[Dict[str, Any]]) -> np.ndarray:
+        """Validate many records at once with the same rules as `validate`; returns one boolean per record."""
+        return validate_batch(records, self.validation_rules).valid
+    
     async def _validate_required_fields(self, data: Dict[str, Any]) -> bool:
         """Validate presence and non-emptiness of required fields."""
         try:
@@ -66,6 +72,13 @@ class DataValidator:
                     logger.warning(f"Invalid URL format: {url}")
                     return False
             
+            # Validate minimum confidence score
+            score = self._get_field_value(data, 'confidence_score')
+            min_score = self.validation_rules.get('min_confidence_score')
+            if min_score is not None and isinstance(score, (int, float)) and score < min_score:
+                logger.warning(f"Confidence score below {min_score}: {score}")
+                return False
+            
             return True
             
         except Exception as e:
@@ -0,0 +1,100 @@
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, List, Optional
+import asyncio
+import logging
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+@dataclass
+class StreamStage:
+    """One step of a streaming pipeline with its own worker count and input queue"""
+    name: str
+    func: Callable[[Any], Awaitable[Any]]
+    concurrency: int = 1
+    queue_size: int = 100
+    # Also pass the item's source, for stages that need the original input
+    with_source: bool = False
+
+@dataclass
+class StreamItem:
+    """An input as it moves through the stages; `error` stops further processing"""
+    index: int
+    source: Any
+    value: Any
+    error: Optional[Exception] = None
+    failed_stage: Optional[str] = None
+
+async def stream_stages(
+    source: AsyncIterable[Any],
+    stages: List[StreamStage],
+    output_size: int = 100
+) -> AsyncIterator[StreamItem]:
+    """Run every item of `source` through `stages`, yielding items as they finish.
+
+    Stages are connected by bounded queues, so a slow stage makes the ones
+    before it wait instead of buffering without limit, and at most the sum of
+    queue sizes and workers is held in memory. Results arrive in completion
+    order. A stage error is recorded on the item, which then skips the
+    remaining stages and is still yielded. Closing the generator early
+    cancels all stage workers.
+    """
+    queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in stages]
+    output: asyncio.Queue = asyncio.Queue(maxsize=output_size)
+    downstream = queues[1:] + [output]
+    workers_after = [stage.concurrency for stage in stages[1:]] + [1]
+
+    async def finish(queue: asyncio.Queue, readers: int):
+        for _ in range(readers):
+            await queue.put(_DONE)
+
+    async def feed():
+        index = 0
+        try:
+            async for value in source:
+                await queues[0].put(StreamItem(index, value, value))
+                index += 1
+        except Exception:
+            # Let what was already read drain before the error is raised
+            await finish(queues[0], stages[0].concurrency)
+            raise
+        await finish(queues[0], stages[0].concurrency)
+
+    async def work(stage: StreamStage, inbox: asyncio.Queue, outbox: asyncio.Queue):
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+            if item.error is None:
+                try:
+                    if stage.with_source:
+                        item.value = await stage.func(item.value, item.source)
+                    else:
+                        item.value = await stage.func(item.value)
+                except Exception as e:
+                    logger.error(f"Stream stage {stage.name} failed for item {item.index}: {str(e)}")
+                    item.error = e
+                    item.failed_stage = stage.name
+            await outbox.put(item)
+
+    async def run_stage(i: int, stage: StreamStage):
+        await asyncio.gather(*(
+            work(stage, queues[i], downstream[i]) for _ in range(stage.concurrency)
+        ))
+        await finish(downstream[i], workers_after[i])
+
+    feeder = asyncio.create_task(feed())
+    tasks = [feeder] + [asyncio.create_task(run_stage(i, stage)) for i, stage in enumerate(stages)]
+    try:
+        while True:
+            item = await output.get()
+            if item is _DONE:
+                break
+            yield item
+        # Surface a failing source once everything it produced has drained
+        await feeder
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
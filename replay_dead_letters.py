@@ -0,0 +1,48 @@
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+from pipeline import KafkaConfig
+from pipeline.dead_letter import DeadLetterReplayer, ReplayFilter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Replay failed records from the dead-letter topic")
+    parser.add_argument('--stage', action='append', choices=['extraction', 'enrichment', 'validation'],
+                        help="Only replay failures from this stage (repeatable)")
+    parser.add_argument('--error-type', action='append',
+                        help="Only replay this exception class, e.g. TimeoutError (repeatable)")
+    parser.add_argument('--error-pattern', help="Regex the error message must match")
+    parser.add_argument('--since', type=datetime.fromisoformat, help="Failed at or after (UTC ISO time)")
+    parser.add_argument('--until', type=datetime.fromisoformat, help="Failed before (UTC ISO time)")
+    parser.add_argument('--rate', type=float, help="Records per second (default: KafkaConfig.REPLAY_RATE)")
+    parser.add_argument('--concurrency', type=int,
+                        help="Records in flight (default: KafkaConfig.REPLAY_CONCURRENCY)")
+    parser.add_argument('--limit', type=int, help="Stop after this many matching records")
+    parser.add_argument('--dry-run', action='store_true', help="Count matches without replaying")
+    return parser.parse_args()
+
+async def main(args):
+    """Run one replay pass over the dead-letter topic"""
+    replayer = DeadLetterReplayer(KafkaConfig(), rate=args.rate, concurrency=args.concurrency)
+    try:
+        stats = await replayer.replay(
+            ReplayFilter(
+                stages=args.stage,
+                error_types=args.error_type,
+                error_pattern=args.error_pattern,
+                since=args.since,
+                until=args.until
+            ),
+            limit=args.limit,
+            dry_run=args.dry_run
+        )
+        print(stats)
+    finally:
+        await replayer.producer.close()
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -1,32 +1,65 @@
+import argparse
 import asyncio
 import logging
-from pipeline import KafkaConfig, KafkaPipelineManager, DataProcessor
+from pipeline import KafkaConfig, KafkaPipelineManager
+from pipeline.stage_workers import StageWorkerPool, run_processes
+from pipeline.flow_metrics import ConsumerLagMonitor
+from monitoring.prometheus_metrics import start_metrics_server
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def main():
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the Kafka data pipeline")
+    parser.add_argument('--stage', choices=['extraction', 'enrichment', 'validation'],
+                        help="Run only this stage (default: all stages)")
+    parser.add_argument('--workers', type=int,
+                        help="Workers per stage (default: KafkaConfig.STAGE_WORKERS)")
+    parser.add_argument('--processes', type=int, default=1,
+                        help="Worker processes, each running its own set of stage workers")
+    parser.add_argument('--metrics-port', type=int, default=9090,
+                        help="Port for Prometheus metrics and consumer lag (0 disables)")
+    return parser.parse_args()
+
+def stage_workers_from_args(args) -> dict:
+    stage_workers = dict(KafkaConfig.STAGE_WORKERS)
+    if args.stage:
+        stage_workers = {args.stage: stage_workers[args.stage]}
+    if args.workers:
+        stage_workers = {stage: args.workers for stage in stage_workers}
+    return stage_workers
+
+async def main(stage_workers: dict, metrics_port: int = 0):
     """Main function to run the pipeline"""
+    lag_monitor = None
     try:
         # Initialize pipeline
         kafka_config = KafkaConfig()
         pipeline_manager = KafkaPipelineManager(kafka_config)
         await pipeline_manager.setup_pipeline()
-        
-        # Initialize processor
-        processor = DataProcessor(kafka_config)
-        
-        # Run processing tasks
-        await asyncio.gather(
-            processor.process_raw_html(),
-            processor.enrich_profile_data(),
-            processor.validate_profile_data()
-        )
-        
+
+        # Export stage metrics and poll consumer lag for the scaling signal
+        if metrics_port:
+            start_metrics_server(metrics_port)
+            lag_monitor = ConsumerLagMonitor(kafka_config)
+            asyncio.create_task(lag_monitor.run())
+
+        # Run stage workers until interrupted
+        await StageWorkerPool(kafka_config, stage_workers).run()
+
     except Exception as e:
         logger.error(f"Pipeline execution error: {str(e)}")
         raise
+    finally:
+        if lag_monitor:
+            lag_monitor.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    args = parse_args()
+    stage_workers = stage_workers_from_args(args)
+    if args.processes > 1:
+        asyncio.run(KafkaPipelineManager(KafkaConfig()).setup_pipeline())
+        run_processes(args.processes, stage_workers)
+    else:
+        asyncio.run(main(stage_workers, args.metrics_port))
@@ -135,7 +135,8 @@ class AdvancedScraper:
             'url': url,
             'title': soup.title.string if soup.title else None,
             'content': soup.get_text(strip=True),
-            'links': [a.get('href') for a in soup.find_all('a', href=True)]
+            'links': [a.get('href') for a in soup.find_all('a', href=True)],
+            'html': html
         }
 
     def _save_to_file(self, data: Dict[str, Any], filename: str):
@@ -0,0 +1,228 @@
+from typing import Dict, Optional, Tuple, Union
+import json
+import logging
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, Tag
+
+logger = logging.getLogger(__name__)
+
+Extraction = Union[str, Dict[str, str]]
+
+def _normalize(text: Optional[str]) -> str:
+    """Collapse whitespace so LLM output and element text compare equal."""
+    return " ".join(text.split()) if text else ""
+
+def _domain(url: str) -> str:
+    return urlparse(url).netloc.lower() or url.lower()
+
+def _to_fields(extraction: Extraction) -> Dict[str, str]:
+    """Turn an LLM extraction into named field values.
+
+    Free-text results from the parse stage become one field per line.
+    """
+    if isinstance(extraction, dict):
+        return {k: _normalize(str(v)) for k, v in extraction.items() if v}
+    lines = [_normalize(line) for line in extraction.splitlines()]
+    return {f"value_{i}": line for i, line in enumerate(filter(None, lines))}
+
+@dataclass
+class SelectorTemplate:
+    """Selectors that reproduce one domain's extraction for one description."""
+    domain: str
+    description: str
+    fields: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    structured: bool = False
+    hits: int = 0
+    misses: int = 0
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    @property
+    def samples(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def confidence(self) -> float:
+        return self.hits / self.samples if self.samples else 0.0
+
+class SelectorInducer:
+    """Induces CSS and XPath selectors for elements whose text matches known values."""
+
+    def induce(self, soup: BeautifulSoup, values: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+        """Find a selector pair for every value that appears verbatim on the page."""
+        fields = {}
+        for name, value in values.items():
+            element = self._find_element(soup, value)
+            if element is None:
+                continue
+            css = self.css_path(element)
+            found = soup.select_one(css)
+            if found is None or _normalize(found.get_text(" ")) != value:
+                continue
+            fields[name] = {'css': css, 'xpath': self.xpath(element)}
+        return fields
+
+    def _find_element(self, soup: BeautifulSoup, value: str) -> Optional[Tag]:
+        """Find the deepest element whose text equals the value."""
+        best = None
+        for element in soup.find_all(True):
+            if _normalize(element.get_text(" ")) == value:
+                best = element  # find_all is document order, so later matches are deeper
+            elif best is not None and not self._is_descendant(element, best):
+                break
+        return best
+
+    def _is_descendant(self, element: Tag, ancestor: Tag) -> bool:
+        return any(parent is ancestor for parent in element.parents)
+
+    def css_path(self, element: Tag) -> str:
+        """Build a CSS selector anchored at the nearest element with an id."""
+        steps = []
+        node = element
+        while isinstance(node, Tag) and node.name not in ('html', '[document]'):
+            if node.get('id'):
+                steps.append(f"{node.name}#{node['id']}")
+                break
+            step = node.name
+            classes = [c for c in node.get('class', []) if c.replace('-', '').replace('_', '').isalnum()]
+            if classes:
+                step += "." + ".".join(classes)
+            same_tag = [s for s in node.parent.find_all(node.name, recursive=False)] if node.parent else []
+            if len(same_tag) > 1:
+                step += f":nth-of-type({same_tag.index(node) + 1})"
+            steps.append(step)
+            node = node.parent
+        return " > ".join(reversed(steps))
+
+    def xpath(self, element: Tag) -> str:
+        """Build an absolute positional XPath for an element."""
+        steps = []
+        node = element
+        while isinstance(node, Tag) and node.name != '[document]':
+            siblings = node.parent.find_all(node.name, recursive=False) if node.parent else [node]
+            steps.append(f"{node.name}[{siblings.index(node) + 1}]")
+            node = node.parent
+        return "/" + "/".join(reversed(steps))
+
+class SelectorTemplateStore:
+    """Learns per-domain selector templates from LLM extractions.
+
+    Every successful LLM extraction is fed to `observe`. The first one
+    induces a template; later ones validate it. Once a template has been
+    confirmed `min_samples` times at `min_confidence` or better, `extract`
+    serves the page without an LLM call. A confident template that stops
+    matching is demoted so the caller falls back to the LLM, whose next
+    result re-induces the template.
+    """
+
+    def __init__(self, min_samples: int = 3, min_confidence: float = 0.9, path: Optional[str] = None):
+        self.min_samples = min_samples
+        self.min_confidence = min_confidence
+        self.path = path
+        self.inducer = SelectorInducer()
+        self.templates: Dict[Tuple[str, str], SelectorTemplate] = {}
+        self.stats = {'template_hits': 0, 'fallbacks': 0, 'inductions': 0}
+        if path:
+            self.load(path)
+
+    def is_confident(self, template: SelectorTemplate) -> bool:
+        return template.samples >= self.min_samples and template.confidence >= self.min_confidence
+
+    def extract(self, url: str, html: str, description: str) -> Optional[Extraction]:
+        """Extract with a confident template, or return None to fall back to the LLM."""
+        template = self.templates.get((_domain(url), description))
+        if template is None or not self.is_confident(template):
+            return None
+
+        values = self._apply(template, BeautifulSoup(html, 'lxml'))
+        if values is None:
+            logger.info(f"Selector template for {template.domain} stopped matching, falling back")
+            template.misses += 1
+            template.hits = 0
+            self.stats['fallbacks'] += 1
+            return None
+
+        self.stats['template_hits'] += 1
+        if template.structured:
+            return values
+        return "\n".join(values.values())
+
+    def observe(self, url: str, html: str, description: str, extraction: Extraction) -> Optional[SelectorTemplate]:
+        """Feed an LLM extraction to induce or validate the domain's template."""
+        values = _to_fields(extraction)
+        if not values:
+            return None
+
+        key = (_domain(url), description)
+        soup = BeautifulSoup(html, 'lxml')
+        template = self.templates.get(key)
+
+        if template is not None:
+            if self._apply(template, soup) == values:
+                template.hits += 1
+                return template
+            template.misses += 1
+            if template.confidence >= self.min_confidence:
+                # A single disagreement does not discard a well-established template
+                return template
+
+        fields = self.inducer.induce(soup, values)
+        if len(fields) != len(values):
+            # Only keep templates that reproduce the whole extraction
+            return template
+
+        template = SelectorTemplate(
+            domain=key[0],
+            description=description,
+            fields=fields,
+            structured=isinstance(extraction, dict),
+            hits=1
+        )
+        self.templates[key] = template
+        self.stats['inductions'] += 1
+        return template
+
+    def _apply(self, template: SelectorTemplate, soup: BeautifulSoup) -> Optional[Dict[str, str]]:
+        """Apply a template; None if any field fails to match."""
+        values = {}
+        for name, selectors in template.fields.items():
+            element = soup.select_one(selectors['css'])
+            text = _normalize(element.get_text(" ")) if element is not None else ""
+            if not text:
+                text = self._apply_xpath(soup, selectors.get('xpath'))
+            if not text:
+                return None
+            values[name] = text
+        return values
+
+    def _apply_xpath(self, soup: BeautifulSoup, xpath: Optional[str]) -> str:
+        if not xpath:
+            return ""
+        try:
+            from lxml import html as lxml_html
+            matches = lxml_html.fromstring(str(soup)).getroottree().xpath(xpath)
+            return _normalize(matches[0].text_content()) if matches else ""
+        except Exception as e:
+            logger.debug(f"XPath fallback failed for {xpath}: {str(e)}")
+            return ""
+
+    def save(self, path: Optional[str] = None):
+        """Persist templates as JSON to `path` or the store's own path."""
+        path = path or self.path
+        if not path:
+            raise ValueError("No path to save selector templates to; pass one or create the store with a path")
+        with open(path, 'w') as f:
+            json.dump([asdict(t) for t in self.templates.values()], f, indent=2)
+
+    def load(self, path: str):
+        """Load templates persisted by `save`."""
+        try:
+            with open(path) as f:
+                for item in json.load(f):
+                    template = SelectorTemplate(**item)
+                    self.templates[(template.domain, template.description)] = template
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to load selector templates: {str(e)}")
@@ -3,7 +3,7 @@ from typing import Dict, Any
 from .celery_app import app
 from .profile_tasks import process_profile, update_profile
 from .enrichment_tasks import enrich_profile, bulk_enrich_profiles
-from .validation_tasks import validate_profile, validate_enrichment
+from .validation_tasks import validate_profile, validate_enrichment, revalidate_profiles
 
 # Schedule configuration
 CELERYBEAT_SCHEDULE: Dict[str, Any] = {
@@ -26,6 +26,11 @@ CELERYBEAT_SCHEDULE: Dict[str, Any] = {
         'task': 'tasks.validation_tasks.validate_profile',
         'schedule': crontab(hour='*/4'),  # Every 4 hours
         'options': {'queue': 'high_priority'}
+    },
+    'revalidate-profiles': {
+        'task': 'tasks.validation_tasks.revalidate_profiles',
+        'schedule': crontab(hour=3, minute=0),  # Nightly
+        'options': {'queue': 'low_priority'}
     }
 }
 
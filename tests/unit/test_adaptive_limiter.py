@@ -0,0 +1,96 @@
+import pytest
+import asyncio
+from prometheus_client import REGISTRY
+from pipeline.adaptive_limiter import AdaptiveLimiter, is_overload
+
+CONFIG = {'initial': 4, 'min': 1, 'max': 6, 'backoff': 0.5, 'window': 10, 'latency_tolerance': 2.0}
+
+class TooManyRequests(Exception):
+    status = 429
+
+async def complete(limiter, count, latency=0.01):
+    """Finish `count` requests while the limit is fully used"""
+    for _ in range(count):
+        slots = [await limiter.acquire() for _ in range(limiter.max_in_flight)]
+        for slot in slots:
+            await limiter.release(slot, latency)
+
+def test_overload_signals():
+    """Test timeouts, 429s and 503s count as overload and other failures do not."""
+    assert is_overload(asyncio.TimeoutError())
+    assert is_overload(TooManyRequests())
+    assert not is_overload(ValueError("bad record"))
+    assert not is_overload(None)
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_used_and_healthy():
+    """Test the limit rises additively under saturation, up to the maximum."""
+    limiter = AdaptiveLimiter('test_grow', CONFIG)
+
+    await complete(limiter, 2)
+    assert limiter.max_in_flight == 5
+
+    await complete(limiter, 20)
+    assert limiter.max_in_flight == 6
+
+@pytest.mark.asyncio
+async def test_idle_capacity_does_not_raise_the_limit():
+    """Test requests completing below the limit leave it alone."""
+    limiter = AdaptiveLimiter('test_idle', CONFIG)
+
+    for _ in range(20):
+        await limiter.release(await limiter.acquire(), 0.01)
+    assert limiter.max_in_flight == 4
+
+@pytest.mark.asyncio
+async def test_one_overload_burst_backs_off_once():
+    """Test failures from requests admitted before a decrease do not cut the limit again."""
+    def downs():
+        return REGISTRY.get_sample_value(
+            'adaptive_concurrency_adjustments_total',
+            {'limiter': 'test_burst', 'direction': 'down', 'reason': 'overload'}
+        ) or 0.0
+
+    limiter = AdaptiveLimiter('test_burst', CONFIG)
+    slots = [await limiter.acquire() for _ in range(4)]
+
+    for slot in slots:
+        await limiter.release(slot, 0.01, TooManyRequests())
+    assert limiter.max_in_flight == 2
+    assert downs() == 1
+
+    slot = await limiter.acquire()
+    slot.overload()
+    await limiter.release(slot, 0.01)
+    assert limiter.max_in_flight == 1
+    assert REGISTRY.get_sample_value('adaptive_concurrency_limit', {'limiter': 'test_burst'}) == 1
+
+@pytest.mark.asyncio
+async def test_rising_p95_backs_off():
+    """Test a window p95 well above the healthy baseline lowers the limit."""
+    limiter = AdaptiveLimiter('test_latency', {**CONFIG, 'max': 4})
+
+    for latency in [0.01] * 10 + [0.05] * 10:
+        await limiter.release(await limiter.acquire(), latency)
+
+    assert limiter.baseline == pytest.approx(0.014)
+    assert limiter.max_in_flight == 2
+
+@pytest.mark.asyncio
+async def test_slots_bound_concurrency():
+    """Test no more requests run at once than the limit allows."""
+    limiter = AdaptiveLimiter('test_bound', {**CONFIG, 'initial': 3, 'max': 3})
+    running = peak = 0
+
+    async def request():
+        nonlocal running, peak
+        async with limiter.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+    await asyncio.gather(*(request() for _ in range(20)))
+
+    assert peak == 3
+    assert limiter.in_flight == 0
@@ -0,0 +1,130 @@
+import pytest
+import asyncio
+from unittest.mock import patch
+from pipeline.async_consumer import AsyncBatchConsumer
+
+class StubMessage:
+    def __init__(self, topic, partition, offset, value=b'{}', key=None):
+        self._topic = topic
+        self._key = key
+        self._partition = partition
+        self._offset = offset
+        self._value = value
+
+    def topic(self):
+        return self._topic
+
+    def partition(self):
+        return self._partition
+
+    def offset(self):
+        return self._offset
+
+    def value(self):
+        return self._value
+
+    def key(self):
+        return self._key
+
+    def error(self):
+        return None
+
+class StubConsumer:
+    def __init__(self, config):
+        self.batches = []
+        self.commits = []
+        self.seeks = []
+
+    def subscribe(self, topics):
+        self.topics = topics
+
+    def consume(self, num_messages, timeout):
+        return self.batches.pop(0) if self.batches else []
+
+    def commit(self, offsets=None, asynchronous=True):
+        self.commits.append((offsets, asynchronous))
+
+    def seek(self, partition):
+        self.seeks.append(partition)
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def batch_consumer():
+    with patch('pipeline.async_consumer.Consumer', StubConsumer):
+        yield AsyncBatchConsumer({'group.id': 'test'}, batch_size=10, max_concurrency=2)
+
+def test_batch_offsets():
+    """Test the committed offset is the highest offset + 1 per partition."""
+    batch = [
+        StubMessage('raw', 0, 5),
+        StubMessage('raw', 0, 7),
+        StubMessage('raw', 1, 3)
+    ]
+
+    offsets = {(tp.topic, tp.partition): tp.offset for tp in AsyncBatchConsumer.batch_offsets(batch)}
+
+    assert offsets == {('raw', 0): 8, ('raw', 1): 4}
+
+@pytest.mark.asyncio
+async def test_batch_is_processed_then_committed_once(batch_consumer):
+    """Test one asynchronous commit covers a whole concurrently processed batch."""
+    batch_consumer.consumer.batches = [[StubMessage('raw', 0, i, key=str(i)) for i in range(6)]]
+    handled = []
+
+    async def handler(msg):
+        handled.append(msg.offset())
+        if len(handled) == 6:
+            batch_consumer.stop()
+
+    await batch_consumer.run(['raw'], handler)
+
+    assert sorted(handled) == list(range(6))
+    assert len(batch_consumer.consumer.commits) == 1
+    offsets, asynchronous = batch_consumer.consumer.commits[0]
+    assert asynchronous is True
+    assert offsets[0].offset == 6
+    await batch_consumer.close()
+
+@pytest.mark.asyncio
+async def test_same_key_messages_keep_order(batch_consumer):
+    """Test messages for one key are handled sequentially in offset order."""
+    batch = [StubMessage('raw', 0, i, key='profile-a' if i % 2 else 'profile-b') for i in range(8)]
+    handled = []
+
+    async def handler(msg):
+        await asyncio.sleep(0.001 * (8 - msg.offset()))
+        handled.append((msg.key(), msg.offset()))
+
+    await batch_consumer.process_batch(batch, handler)
+
+    assert [o for k, o in handled if k == 'profile-a'] == [1, 3, 5, 7]
+    assert [o for k, o in handled if k == 'profile-b'] == [0, 2, 4, 6]
+
+@pytest.mark.asyncio
+async def test_unrecovered_failure_is_not_committed(batch_consumer):
+    """Test a message that on_error cannot route is rewound instead of committed."""
+    batch_consumer.consumer.batches = [
+        [StubMessage('raw', 0, i, key=str(i)) for i in range(4)] +
+        [StubMessage('raw', 1, i, key=f'p1-{i}') for i in range(3)]
+    ]
+    handled = []
+
+    async def handler(msg):
+        handled.append(msg)
+        if len(handled) == 7:
+            batch_consumer.stop()
+        if (msg.partition(), msg.offset()) == (0, 2):
+            raise ValueError("bad record")
+
+    async def on_error(msg, error):
+        raise RuntimeError("dead letter topic unavailable")
+
+    await batch_consumer.run(['raw'], handler, on_error=on_error)
+
+    assert len(batch_consumer.consumer.commits) == 1
+    offsets, _ = batch_consumer.consumer.commits[0]
+    assert {(tp.partition, tp.offset) for tp in offsets} == {(0, 2), (1, 3)}
+    assert [(tp.partition, tp.offset) for tp in batch_consumer.consumer.seeks] == [(0, 2)]
+    await batch_consumer.close()
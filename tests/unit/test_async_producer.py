@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import patch
+from confluent_kafka import KafkaException
+from pipeline.async_producer import AsyncProducer
+
+class StubProducer:
+    """Producer double that reports deliveries on poll, like librdkafka."""
+
+    def __init__(self, config):
+        self.queued = []
+        self.delivered = []
+        self.flushes = 0
+        self.fail_topics = set()
+
+    def produce(self, topic, value=None, key=None, headers=None, on_delivery=None):
+        self.queued.append((topic, value, on_delivery))
+
+    def poll(self, timeout=0):
+        queued, self.queued = self.queued, []
+        for topic, value, on_delivery in queued:
+            err = 'delivery failed' if topic in self.fail_topics else None
+            self.delivered.append((topic, value))
+            on_delivery(err, (topic, value))
+        return len(queued)
+
+    def flush(self, timeout=None):
+        self.flushes += 1
+        self.poll()
+        return 0
+
+@pytest.fixture
+def async_producer():
+    with patch('pipeline.async_producer.Producer', StubProducer):
+        yield AsyncProducer({'bootstrap.servers': 'localhost:9092'}, poll_interval=0.01)
+
+@pytest.mark.asyncio
+async def test_produce_does_not_flush(async_producer):
+    """Test fire-and-forget produces never trigger a flush."""
+    futures = [await async_producer.produce('topic', value=str(i)) for i in range(10)]
+
+    for future in futures:
+        await future
+
+    assert async_producer.producer.flushes == 0
+    assert len(async_producer.producer.delivered) == 10
+    await async_producer.close()
+
+@pytest.mark.asyncio
+async def test_wait_returns_delivered_message(async_producer):
+    """Test callers can await confirmation of a single message."""
+    msg = await async_producer.produce('topic', value='payload', wait=True)
+
+    assert msg == ('topic', 'payload')
+    await async_producer.close()
+
+@pytest.mark.asyncio
+async def test_delivery_error_is_raised(async_producer):
+    """Test failed deliveries surface as KafkaException."""
+    async_producer.producer.fail_topics.add('broken')
+
+    with pytest.raises(KafkaException):
+        await async_producer.produce('broken', value='payload', wait=True)
+    await async_producer.close()
+
+@pytest.mark.asyncio
+async def test_close_flushes(async_producer):
+    """Test shutdown flushes once."""
+    await async_producer.produce('topic', value='payload')
+    await async_producer.close()
+
+    assert async_producer.producer.flushes == 1
+    assert async_producer.pending == 0
@@ -0,0 +1,101 @@
+import pytest
+import asyncio
+import json
+import os
+import time
+from pipeline.async_producer import AsyncProducer
+from pipeline.audit_sink import AuditSink
+from pipeline.memory_broker import MemoryBroker, MemoryProducer
+
+SETTINGS = {'bootstrap.servers': 'memory://audit-test'}
+STALLED_SETTINGS = {'bootstrap.servers': 'memory://audit-stalled'}
+
+class StalledProducer(MemoryProducer):
+    """Accepts messages but never acknowledges them, like an unreachable broker"""
+
+    def poll(self, timeout: float = 0) -> int:
+        time.sleep(min(timeout, 0.01))
+        return 0
+
+@pytest.fixture(autouse=True)
+def broker():
+    MemoryBroker.reset(SETTINGS['bootstrap.servers'])
+    yield MemoryBroker.for_servers(SETTINGS['bootstrap.servers'])
+    MemoryBroker.reset(SETTINGS['bootstrap.servers'])
+
+def audit_event(i):
+    return {'event_type': 'raw_html_produced', 'event_data': {'i': i}, 'timestamp': '2024-01-01T00:00:00'}
+
+def delivered(broker):
+    return sum(len(log) for log in broker.partitions('audit'))
+
+@pytest.mark.asyncio
+async def test_events_are_flushed_in_batches(broker, tmp_path):
+    """Test recorded events reach the topic without the caller awaiting delivery."""
+    sink = AuditSink(
+        AsyncProducer(SETTINGS, producer=MemoryProducer(SETTINGS)),
+        'audit',
+        str(tmp_path),
+        batch_size=10,
+        flush_interval=0.05
+    )
+    await sink.start()
+    for i in range(25):
+        sink.record(audit_event(i))
+    assert delivered(broker) < 25
+
+    await asyncio.sleep(0.2)
+    assert delivered(broker) == 25
+    await sink.close()
+    assert sink.stats['delivered'] == 25
+
+@pytest.mark.asyncio
+async def test_slow_broker_spools_then_replays(broker, tmp_path):
+    """Test unacknowledged batches go to the spool and are replayed later."""
+    stalled = AuditSink(
+        AsyncProducer(SETTINGS, poll_interval=0.01, producer=StalledProducer(STALLED_SETTINGS)),
+        'audit',
+        str(tmp_path),
+        max_buffer=5,
+        delivery_timeout=0.05
+    )
+    for i in range(8):
+        stalled.record(audit_event(i))
+    assert len(stalled.buffer) == 5
+    await stalled.flush()
+    assert not stalled.buffer
+    assert stalled.stats['spooled'] == 8
+    assert os.listdir(tmp_path) == [os.path.basename(stalled.spool_path)]
+    await stalled.producer.close()
+
+    # A healthy sink picks up the spool once its own deliveries succeed
+    healthy = AuditSink(AsyncProducer(SETTINGS, producer=MemoryProducer(SETTINGS)), 'audit', str(tmp_path))
+    await healthy.start()
+    await healthy.flush()
+    await healthy.close()
+    assert healthy.stats['replayed'] == 8
+    assert delivered(broker) == 8
+    assert os.listdir(tmp_path) == []
+
+@pytest.mark.asyncio
+async def test_interrupted_replay_keeps_the_spool(broker, tmp_path):
+    """Test a replay that dies before delivery is acknowledged leaves its events to a later replay."""
+    spool = tmp_path / f"spool-{os.getpid()}.jsonl"
+    spool.write_text(''.join(json.dumps(audit_event(i)) + '\n' for i in range(8)))
+    crashing = AuditSink(AsyncProducer(SETTINGS, producer=MemoryProducer(SETTINGS)), 'audit', str(tmp_path))
+
+    async def crash(batch):
+        raise RuntimeError("worker killed")
+
+    crashing._deliver = crash
+    with pytest.raises(RuntimeError):
+        await crashing.flush()
+    assert len(os.listdir(tmp_path)) == 1
+
+    healthy = AuditSink(AsyncProducer(SETTINGS, producer=MemoryProducer(SETTINGS)), 'audit', str(tmp_path))
+    await healthy.start()
+    await healthy.flush()
+    await healthy.close()
+    assert healthy.stats['replayed'] == 8
+    assert delivered(broker) == 8
+    assert os.listdir(tmp_path) == []
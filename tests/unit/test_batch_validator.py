@@ -0,0 +1,98 @@
+import pytest
+import pandas as pd
+from pipeline.stages.batch_validator import validate_batch
+from pipeline.stages.compiled_validator import CompiledValidator
+from pipeline.stages.data_validator import DataValidator
+
+RULES = {'required_fields': ['name', 'email'], 'min_confidence_score': 0.7}
+
+def named(profile):
+    return {**profile, 'name': 'John Doe', 'confidence_score': 0.9}
+
+@pytest.fixture
+def validator():
+    validator = DataValidator()
+    validator.validation_rules = RULES
+    return validator
+
+@pytest.mark.asyncio
+async def test_batch_verdicts_match_the_validator(validator, mock_profile_data):
+    """Test DataValidator gives the same verdict per record and per batch, dates and scores included."""
+    profile = named(mock_profile_data)
+    records = [
+        profile,
+        {**profile, 'confidence_score': 0.2},
+        {**profile, 'confidence_score': 'high'},
+        {**profile, 'start_date': '2024-01-01T00:00:00+00:00', 'end_date': '2024-06-01'},
+        {**profile, 'start_date': '1500-01-01', 'end_date': '2400-12-31'},
+        {**profile, 'birth_date': '2024-02-30'},
+        {**profile, 'birth_date': '20240101T0000'},
+        {'profile': profile, 'dates': {'start_date': '2024-01-01', 'end_date': '2023-01-01'}}
+    ]
+
+    verdicts = [await validator.validate(record) for record in records]
+
+    assert validator.validate_batch(records).tolist() == verdicts
+    assert verdicts == [True, False, False, False, True, False, True, False]
+
+def test_batch_mask_matches_record_at_a_time_validation(mock_profile_data):
+    """Test the per-record mask agrees with CompiledValidator, including nested and odd values."""
+    profile = named(mock_profile_data)
+    records = [
+        profile,
+        {**profile, 'email': 'broken'},
+        {**profile, 'email': 42},
+        {'profile': profile, 'dates': {'start_date': '2024-01-01', 'end_date': '2023-01-01'}},
+        {**profile, 'birth_date': 'last spring'},
+        {**profile, 'full_name': 'Jane Doe', 'first_name': 'John', 'last_name': 'Doe'},
+        {**profile, 'risk_score': 'high'},
+        {**profile, 'confidence_score': 0.2},
+        {'profile': {**profile, 'name': ''}},
+        {'email': 'a@example.com'}
+    ]
+    compiled = CompiledValidator(RULES)
+
+    result = validate_batch(records, RULES)
+
+    assert result.valid.tolist() == [compiled.check(record).valid for record in records]
+    assert result.valid.tolist() == [True] + [False] * 9
+    assert result.invalid_count == 9
+
+def test_top_level_fields_hide_nested_ones(mock_profile_data):
+    """Test rows read straight into columns resolve like the nested walk does."""
+    profile = named(mock_profile_data)
+    records = [
+        {**profile, 'history': [{'email': 'broken'}]},
+        {'name': 'Jane Roe', 'email': None, 'profile': {'email': 'broken'}},
+        {'name': 'Jane Roe', 'email': 'jane@example.com'}
+    ]
+    compiled = CompiledValidator(RULES)
+
+    result = validate_batch(records, RULES)
+
+    assert result.valid.tolist() == [compiled.check(record).valid for record in records]
+    assert result.failures['required.email'].tolist() == [False, True, False]
+
+def test_failures_are_reported_per_rule(mock_profile_data):
+    """Test each failing rule has its own boolean column."""
+    profile = named(mock_profile_data)
+    records = [profile, {**profile, 'phone': '12', 'linkedin_url': 'linkedin'}]
+
+    failures = validate_batch(records, RULES).failures
+
+    assert failures.loc[1, 'quality.phone'] and failures.loc[1, 'quality.url']
+    assert not failures.loc[0].any()
+    assert failures.loc[1].sum() == 2
+
+def test_flat_dataframe_is_validated_by_column():
+    """Test rows already in columns are validated without flattening, missing columns counting as absent."""
+    frame = pd.DataFrame({
+        'name': ['Jane Roe', None, 'Sam Poe'],
+        'email': ['jane@example.com', 'sam@example.com', 'sam@'],
+        'confidence_score': [0.9, 0.95, 0.8]
+    })
+
+    result = validate_batch(frame, RULES)
+
+    assert result.valid.tolist() == [True, False, False]
+    assert result.failures['required.name'].tolist() == [False, True, False]
@@ -0,0 +1,57 @@
+import pytest
+import os
+import time
+from pipeline.blob_store import LocalBlobStore, ClaimCheck
+
+@pytest.fixture
+def claim_check(tmp_path):
+    return ClaimCheck(LocalBlobStore(str(tmp_path)), threshold=100)
+
+def test_small_payload_stays_inline(claim_check):
+    """Test payloads under the threshold are not offloaded."""
+    message = claim_check.pack('html_content', '<html></html>')
+
+    assert message == {'html_content': '<html></html>'}
+    assert claim_check.resolve(message, 'html_content') == '<html></html>'
+
+def test_large_payload_is_offloaded(claim_check):
+    """Test large payloads travel as a reference and resolve transparently."""
+    html = '<html>' + 'x' * 1000 + '</html>'
+    message = claim_check.pack('html_content', html)
+
+    assert 'html_content' not in message
+    assert message['html_content_ref']['size'] == len(html)
+    assert claim_check.resolve(message, 'html_content') == html
+
+def test_tampered_blob_fails_integrity_check(claim_check):
+    """Test a blob whose content no longer matches its hash is rejected."""
+    message = claim_check.pack('html_content', 'y' * 500)
+    ref = message['html_content_ref']
+    with open(ref['uri'][len('file://'):], 'wb') as f:
+        f.write(b'tampered')
+
+    with pytest.raises(ValueError):
+        claim_check.resolve(message, 'html_content')
+
+@pytest.mark.asyncio
+async def test_async_pack_and_resolve(claim_check):
+    """Test the event-loop variants offload and load bodies like the sync ones."""
+    html = '<html>' + 'z' * 1000 + '</html>'
+    message = await claim_check.apack('html_content', html)
+
+    assert message == claim_check.pack('html_content', html)
+    assert await claim_check.aresolve(message, 'html_content') == html
+    assert await claim_check.aresolve({'html_content': 'inline'}, 'html_content') == 'inline'
+
+def test_purge_removes_only_unreferenced_old_blobs(claim_check):
+    """Test old blobs are purged unless a new message referenced them again."""
+    old = claim_check.pack('html_content', 'a' * 500)['html_content_ref']
+    reused = claim_check.pack('html_content', 'b' * 500)['html_content_ref']
+    long_ago = time.time() - 3600
+    for ref in (old, reused):
+        os.utime(ref['uri'][len('file://'):], (long_ago, long_ago))
+    claim_check.pack('html_content', 'b' * 500)
+
+    assert claim_check.store.purge(older_than=60) == 1
+    assert not os.path.exists(old['uri'][len('file://'):])
+    assert claim_check.resolve({'html_content_ref': reused}, 'html_content') == 'b' * 500
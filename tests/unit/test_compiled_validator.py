@@ -0,0 +1,69 @@
+import pytest
+from pipeline.stages.data_validator import DataValidator
+from pipeline.stages.compiled_validator import CompiledValidator, flatten_record
+
+RULES = {'required_fields': ['name', 'email'], 'min_confidence_score': 0.7}
+
+def test_flatten_resolves_fields_like_data_validator():
+    """Test the index matches DataValidator's pre-order, first-non-None lookup."""
+    record = {
+        'profile': {'name': None, 'details': {'name': 'Hidden'}},
+        'contact': {'email': 'a@example.com'},
+        'history': [{'title': 'Engineer'}, {'title': 'Manager'}],
+        'name': None
+    }
+    validator = DataValidator()
+    index = flatten_record(record, {'name', 'email', 'title', 'phone'})
+
+    assert index == {'email': 'a@example.com', 'title': 'Engineer'}
+    for field in ('name', 'email', 'title', 'phone'):
+        assert index.get(field) == validator._get_field_value(record, field)
+
+def test_check_reports_every_failing_rule():
+    """Test all failures are collected with their rule, field and value."""
+    record = {
+        'email': 'not-an-email',
+        'profile': {'full_name': 'Jane Roe', 'first_name': 'John', 'last_name': 'Roe'},
+        'employment': {'start_date': '2023-01-01', 'end_date': '2020-01-01', 'birth_date': 'yesterday'},
+        'confidence_score': 0.4
+    }
+
+    result = CompiledValidator(RULES).check(record)
+
+    assert not result.valid
+    assert {(f.rule, f.field) for f in result.failures} == {
+        ('required', 'name'),
+        ('quality.email', 'email'),
+        ('consistency.name', 'full_name'),
+        ('consistency.dates', 'start_date'),
+        ('format.date', 'birth_date'),
+        ('quality.min_score', 'confidence_score')
+    }
+
+def test_required_distinguishes_missing_from_empty():
+    """Test a required field that is present but empty is reported as empty."""
+    validator = CompiledValidator(RULES)
+
+    missing = validator.check({'email': 'a@example.com'}).failures
+    empty = validator.check({'email': 'a@example.com', 'profile': {'name': ''}}).failures
+
+    assert [f.message for f in missing] == ["Required field missing: name"]
+    assert [f.message for f in empty] == ["Required field empty: name"]
+
+@pytest.mark.asyncio
+async def test_verdicts_agree_with_data_validator(mock_profile_data):
+    """Test validate gives the same verdict as DataValidator on the shared rules."""
+    rules = {'required_fields': ['name', 'email']}
+    baseline = DataValidator()
+    baseline.validation_rules = rules
+    compiled = CompiledValidator(rules)
+    records = [
+        mock_profile_data,
+        {**mock_profile_data, 'email': 'broken'},
+        {'profile': mock_profile_data, 'start_date': '2024-01-01', 'end_date': '2023-01-01'},
+        {'profile': {**mock_profile_data, 'name': None}},
+        {'data': [{'name': 'Jane'}, {'email': 'jane@example.com', 'phone': '555'}]}
+    ]
+
+    for record in records:
+        assert await compiled.validate(record) == await baseline.validate(record)
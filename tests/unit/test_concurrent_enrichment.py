@@ -0,0 +1,79 @@
+import pytest
+import asyncio
+import time
+from pipeline.data_enricher import DataEnricher
+
+CONFIG = {
+    'hunter_api_key': 'test',
+    'rocketreach_api_key': 'test',
+    'pdl_api_key': 'test',
+    'lexisnexis_api_key': 'test'
+}
+
+def source(delay, data, calls=None):
+    async def fetch(profile):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if calls is not None:
+                calls.append('cancelled')
+            raise
+        return data
+    return fetch
+
+def stub_enricher(delays, **kwargs):
+    enricher = DataEnricher(CONFIG, **kwargs)
+    calls = []
+    enricher.sources = {
+        'hunter.io': source(delays[0], {'email_verification': {'status': 'valid'}}, calls),
+        'rocketreach': source(delays[1], {'profile_id': 7}, calls),
+        'peopledatalabs': source(delays[2], {'likelihood': 9}, calls),
+        'lexisnexis': source(delays[3], {'verification_status': 'clear'}, calls)
+    }
+    return enricher, calls
+
+@pytest.mark.asyncio
+async def test_sources_run_concurrently(mock_profile_data):
+    """Test latency is that of the slowest source, not the sum of all of them."""
+    enricher, _ = stub_enricher([0.1, 0.1, 0.1, 0.1], deadline=1)
+
+    start = time.perf_counter()
+    result = await enricher.enrich_profile(mock_profile_data)
+
+    assert time.perf_counter() - start < 0.3
+    assert result['enrichment']['late'] == []
+    assert result['enrichment']['sources'] == ['hunter.io', 'rocketreach', 'peopledatalabs', 'lexisnexis']
+
+@pytest.mark.asyncio
+async def test_sources_past_the_deadline_are_marked_late_and_cancelled(mock_profile_data):
+    """Test a slow source is left out, reported as late and not left running."""
+    enricher, calls = stub_enricher([0, 0, 5, 0], deadline=0.05)
+
+    start = time.perf_counter()
+    result = await enricher.enrich_profile(mock_profile_data)
+    await asyncio.sleep(0)
+
+    assert time.perf_counter() - start < 1
+    assert result['enrichment']['late'] == ['peopledatalabs']
+    assert 'likelihood' not in result['enrichment']['data']
+    assert calls == ['cancelled']
+
+@pytest.mark.asyncio
+async def test_late_sources_are_backfilled(mock_profile_data):
+    """Test the backfill callback receives the profile with the late source included."""
+    delivered = []
+
+    async def backfill(enriched):
+        delivered.append(enriched)
+
+    enricher, _ = stub_enricher([0, 0.2, 0, 0], deadline=0.05, backfill=backfill)
+
+    result = await enricher.enrich_profile(mock_profile_data)
+    assert result['enrichment']['late'] == ['rocketreach']
+    assert not delivered
+
+    await enricher.wait_for_backfills()
+
+    assert len(delivered) == 1
+    assert delivered[0]['enrichment']['backfilled'] == ['rocketreach']
+    assert delivered[0]['enrichment']['data']['profile_id'] == 7
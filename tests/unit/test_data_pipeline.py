@@ -0,0 +1,25 @@
+import pytest
+from unittest.mock import AsyncMock
+from pipeline.data_pipeline import DataPipeline
+
+JANE = {'first_name': 'Jane', 'last_name': 'Lindqvist', 'email': 'jane.lindqvist@acme.com'}
+
+@pytest.fixture
+def pipeline():
+    pipeline = DataPipeline({'resolve_entities': True})
+    pipeline.collector.collect = AsyncMock(return_value={'api_data': None, 'web_data': []})
+    pipeline.processor.process = AsyncMock(side_effect=lambda raw: {'combined_data': {'title': 'CTO'}})
+    pipeline.validator.validate = AsyncMock(return_value=True)
+    pipeline.enricher.enrich = AsyncMock(side_effect=lambda data: {**data, 'enriched': True})
+    return pipeline
+
+@pytest.mark.asyncio
+async def test_duplicate_returns_its_processed_record(pipeline):
+    """Test a duplicate skips enrichment but still returns its processed data and entity id."""
+    first = await pipeline.process_data(JANE)
+    second = await pipeline.process_data({**JANE, 'email': 'JANE.LINDQVIST@acme.com'})
+
+    assert pipeline.enricher.enrich.await_count == 1
+    assert second['metadata']['status'] == 'duplicate'
+    assert second['metadata']['entity_id'] == first['data']['entity_id']
+    assert second['data'] == {'combined_data': {'title': 'CTO'}, 'entity_id': first['data']['entity_id']}
@@ -0,0 +1,46 @@
+import pytest
+import pandas as pd
+from pipeline.stages.data_processor import DataProcessor
+
+RAW_BATCH = [
+    {
+        'api_data': {'results': [{'name': 'John Doe', 'email': None}, {'name': 'Jane Doe', 'phone': float('nan')}]},
+        'web_data': [{'url': 'https://example.com', 'title': ' Home ', 'content': 'a  b', 'links': ['https://x', 'ftp://y']}]
+    },
+    {'api_data': {'results': [1, 2]}},
+    {'api_data': {'results': []}},
+    {'api_data': None}
+]
+
+@pytest.mark.asyncio
+async def test_single_record_path_matches_dataframe_round_trip():
+    """Test rows are filled exactly as the per-record DataFrame path fills them."""
+    processor = DataProcessor()
+
+    for raw_data in RAW_BATCH:
+        api_data = raw_data['api_data']
+        expected = processor._process_api_frame(api_data) if api_data else {}
+        assert processor._process_api_data(api_data) == expected
+
+    processed = await processor.process(RAW_BATCH[0])
+    assert processed['combined_data']['api_results'] == [
+        {'name': 'John Doe', 'email': '', 'phone': ''},
+        {'name': 'Jane Doe', 'email': '', 'phone': ''}
+    ]
+
+@pytest.mark.asyncio
+async def test_batch_matches_processing_each_record():
+    """Test process_batch returns what process returns for every record."""
+    processor = DataProcessor()
+
+    batch = await processor.process_batch(RAW_BATCH)
+
+    assert batch == [await processor.process(raw_data) for raw_data in RAW_BATCH]
+
+def test_api_frame_holds_every_row_indexed_by_record():
+    """Test the columnar form keeps each row's record position and fills gaps."""
+    frame = DataProcessor().process_api_frame(RAW_BATCH + [{'api_data': {'results': [{'title': 'CTO'}]}}])
+
+    assert frame.index.tolist() == [0, 0, 4]
+    assert frame.loc[4, 'name'] == '' and frame.loc[4, 'title'] == 'CTO'
+    assert isinstance(frame, pd.DataFrame)
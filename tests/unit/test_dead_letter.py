@@ -0,0 +1,131 @@
+import pytest
+import time
+from datetime import datetime, timedelta
+from pipeline.kafka_config import KafkaConfig
+from pipeline.kafka_producer import DataProducer
+from pipeline.memory_broker import MemoryBroker
+from pipeline.dead_letter import DeadLetterReplayer, ReplayFilter, TokenBucket
+
+@pytest.fixture
+def kafka_config(tmp_path):
+    config = KafkaConfig()
+    config.BACKEND = 'memory'
+    config.BOOTSTRAP_SERVERS = 'memory://dead-letter-test'
+    config.BLOB_STORE_PATH = str(tmp_path / 'blobs')
+    config.AUDIT_SPOOL_DIR = str(tmp_path / 'audit')
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+    yield config
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+
+def topic_records(producer, topic):
+    broker = MemoryBroker.for_servers(producer.config.BOOTSTRAP_SERVERS)
+    return [
+        (msg, producer.codec.decode(msg.value()))
+        for log in broker.partitions(topic)
+        for msg in log
+    ]
+
+async def write_failure(producer, stage, data, error_type, failed_at=None):
+    await producer.produce(
+        producer.config.TOPICS['failed_processing'],
+        value=producer.codec.encode('processing_failure', {
+            'stage': stage,
+            'data': data,
+            'error': f'{error_type}: upstream unavailable',
+            'error_type': error_type,
+            'timestamp': (failed_at or datetime.utcnow()).isoformat()
+        }),
+        wait=True
+    )
+
+@pytest.mark.asyncio
+async def test_replay_routes_matching_failures_to_stage_topics(kafka_config, mock_profile_data):
+    """Test filtered failures are re-injected into the topic their stage consumes."""
+    producer = DataProducer(kafka_config)
+    await write_failure(producer, 'enrichment', mock_profile_data, 'TimeoutError')
+    await write_failure(producer, 'enrichment', mock_profile_data, 'ValueError')
+    await write_failure(producer, 'extraction', {
+        'url': 'https://example.com/john',
+        'html_content': '<html></html>',
+        'timestamp': datetime.utcnow().isoformat()
+    }, 'TimeoutError')
+    await write_failure(producer, 'validation', mock_profile_data, 'TimeoutError',
+                        failed_at=datetime.utcnow() - timedelta(days=2))
+
+    replayer = DeadLetterReplayer(kafka_config, producer=producer, rate=1000, idle_timeout=0.05)
+    stats = await replayer.replay(ReplayFilter(
+        error_types=['TimeoutError'],
+        since=datetime.utcnow() - timedelta(hours=1)
+    ))
+
+    assert stats == {'scanned': 4, 'matched': 2, 'replayed': 2, 'unreplayable': 0, 'failed': 0}
+    extracted = topic_records(producer, kafka_config.TOPICS['extracted_data'])
+    assert [data['email'] for _, data in extracted] == [mock_profile_data['email']]
+    assert extracted[0][0].key() == b'linkedin:linkedin.com/in/johndoe'
+    assert dict(extracted[0][0].headers())['replayed-from'].startswith(b'failed-processing-data:')
+    raw = topic_records(producer, kafka_config.TOPICS['raw_html'])
+    assert [data['url'] for _, data in raw] == ['https://example.com/john']
+    assert topic_records(producer, kafka_config.TOPICS['enriched_data']) == []
+    await producer.close()
+
+@pytest.mark.asyncio
+async def test_extraction_failures_without_html_are_not_replayed(kafka_config):
+    """Test fused-mode failures that carry only the URL are counted, not replayed."""
+    producer = DataProducer(kafka_config)
+    await write_failure(producer, 'extraction', {'url': 'https://example.com/john'}, 'ValueError')
+
+    replayer = DeadLetterReplayer(kafka_config, producer=producer, idle_timeout=0.05)
+    stats = await replayer.replay()
+
+    assert stats['matched'] == 1
+    assert stats['unreplayable'] == 1
+    assert topic_records(producer, kafka_config.TOPICS['raw_html']) == []
+    await producer.close()
+
+@pytest.mark.asyncio
+async def test_reruns_of_a_filter_only_replay_new_failures(kafka_config, mock_profile_data):
+    """Test a filter's progress is committed, while other filters and dry runs still see everything."""
+    producer = DataProducer(kafka_config)
+    await write_failure(producer, 'enrichment', mock_profile_data, 'TimeoutError')
+    await write_failure(producer, 'enrichment', mock_profile_data, 'ValueError')
+    replayer = DeadLetterReplayer(kafka_config, producer=producer, rate=1000, idle_timeout=0.05)
+    timeouts = ReplayFilter(error_types=['TimeoutError'])
+
+    assert (await replayer.replay(timeouts, dry_run=True))['matched'] == 1
+    assert (await replayer.replay(timeouts))['replayed'] == 1
+    assert (await replayer.replay(timeouts))['scanned'] == 0
+
+    await write_failure(producer, 'enrichment', mock_profile_data, 'TimeoutError')
+    stats = await replayer.replay(timeouts)
+
+    assert (stats['scanned'], stats['replayed']) == (1, 1)
+    assert (await replayer.replay(ReplayFilter(error_types=['ValueError'])))['replayed'] == 1
+    assert len(topic_records(producer, kafka_config.TOPICS['extracted_data'])) == 3
+    await producer.close()
+
+@pytest.mark.asyncio
+async def test_failed_replays_are_retried_by_the_next_run(kafka_config, mock_profile_data):
+    """Test the commit stops at a record whose replay failed."""
+    producer = DataProducer(kafka_config)
+    await write_failure(producer, 'enrichment', mock_profile_data, 'TimeoutError')
+    replayer = DeadLetterReplayer(kafka_config, producer=producer, rate=1000, idle_timeout=0.05)
+    produce = producer.produce
+
+    async def unavailable(*args, **kwargs):
+        raise ConnectionError("broker unavailable")
+
+    producer.produce = unavailable
+    assert (await replayer.replay())['failed'] == 1
+    producer.produce = produce
+    assert (await replayer.replay())['replayed'] == 1
+    assert (await replayer.replay())['scanned'] == 0
+    await producer.close()
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_after_burst():
+    """Test acquisitions beyond the burst wait for refill."""
+    bucket = TokenBucket(rate=100, capacity=2)
+    start = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert time.monotonic() - start >= 0.025
@@ -0,0 +1,154 @@
+import pytest
+import aiohttp
+from unittest.mock import AsyncMock
+from prometheus_client import REGISTRY
+from cache import enrichment_cache
+from cache.enrichment_cache import EnrichmentCache, set_enrichment_cache
+from integrations import HunterAPI, LexisNexisAPI, PeopleDataLabsAPI
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+class DictRedis:
+    """Stands in for RedisManager's get/set interface"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, expiry=3600):
+        self.values[key] = value
+        return True
+
+def cache_config(**overrides):
+    config = {
+        'enabled': True,
+        'redis': False,
+        'memory_entries': 100,
+        'memory_ttl': 3600,
+        'negative_ttl': 60,
+        'ttls': {'hunter': 600, 'pdl': 6000},
+        'costs': {'pdl': 0.25}
+    }
+    config.update(overrides)
+    return config
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(enrichment_cache, 'time', clock)
+    set_enrichment_cache(EnrichmentCache(cache_config()))
+    yield clock
+    set_enrichment_cache(None)
+
+@pytest.mark.asyncio
+async def test_lookups_share_entries_by_normalized_identity(clock):
+    """Test equivalent lookups reach the API once until the source TTL runs out."""
+    hunter = HunterAPI('test-key')
+    hunter._make_request = AsyncMock(return_value={'data': {'status': 'valid'}})
+
+    first = await hunter.verify_email(' John.Doe@Example.com')
+    second = await hunter.verify_email('john.doe@example.com')
+    clock.now += 601
+    await hunter.verify_email('john.doe@example.com')
+
+    assert first == second == {'data': {'status': 'valid'}}
+    assert hunter._make_request.await_count == 2
+
+@pytest.mark.asyncio
+async def test_positional_and_keyword_calls_share_entries(clock):
+    """Test a lookup is keyed by parameter name, however its arguments are passed."""
+    pdl = PeopleDataLabsAPI('test-key')
+    pdl._make_request = AsyncMock(return_value={'likelihood': 9})
+    params = {'email': 'john.doe@example.com'}
+
+    await pdl.enrich_person(params)
+    await pdl.enrich_person(params=params)
+
+    assert pdl._make_request.await_count == 1
+
+@pytest.mark.asyncio
+async def test_not_found_is_cached_for_the_negative_ttl(clock):
+    """Test a 404 is remembered for the shorter negative TTL and then retried."""
+    pdl = PeopleDataLabsAPI('test-key')
+    pdl._make_request = AsyncMock(side_effect=aiohttp.ClientResponseError(None, (), status=404))
+    params = {'profile': ['https://linkedin.com/in/johndoe', None], 'min_likelihood': 0.7}
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await pdl.enrich_person(params)
+    assert await pdl.enrich_person(params) == {}
+    clock.now += 61
+    with pytest.raises(aiohttp.ClientResponseError):
+        await pdl.enrich_person(params)
+
+    assert pdl._make_request.await_count == 2
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(clock):
+    """Test a failed call other than a 404 is retried on the next lookup."""
+    hunter = HunterAPI('test-key')
+    hunter._make_request = AsyncMock(side_effect=[ConnectionError("reset"), {'data': {}}])
+
+    with pytest.raises(ConnectionError):
+        await hunter.domain_search('example.com')
+    assert await hunter.domain_search('example.com') == {'data': {}}
+
+@pytest.mark.asyncio
+async def test_partial_background_checks_are_not_cached(clock):
+    """Test a check with a failed section is retried, and a complete one is cached."""
+    lexisnexis = LexisNexisAPI('test-key')
+    failures = [ConnectionError("reset")]
+
+    async def respond(endpoint, data=None):
+        if 'public-records' in endpoint and failures:
+            raise failures.pop()
+        return {'endpoint': endpoint}
+
+    lexisnexis._make_request = AsyncMock(side_effect=respond)
+    person = {'id': '42', 'first_name': 'Jane', 'last_name': 'Roe'}
+
+    partial = await lexisnexis.comprehensive_person_check(person)
+    complete = await lexisnexis.comprehensive_person_check(person)
+    cached = await lexisnexis.comprehensive_person_check(person)
+
+    assert partial['failed_checks'] == ['public_records']
+    assert partial['public_records'] == {}
+    assert complete['failed_checks'] == []
+    assert cached == complete
+    assert lexisnexis._make_request.await_count == 8
+
+@pytest.mark.asyncio
+async def test_hits_report_spend_avoided(clock):
+    """Test cache hits are counted with the source's per-call cost."""
+    def sample(name, labels):
+        return REGISTRY.get_sample_value(name, labels) or 0.0
+
+    hits_before = sample('enrichment_cache_lookups_total', {'source': 'pdl', 'result': 'hit'})
+    spend_before = sample('enrichment_cache_spend_avoided_total', {'source': 'pdl'})
+    pdl = PeopleDataLabsAPI('test-key')
+    pdl._make_request = AsyncMock(return_value={'likelihood': 9})
+
+    for _ in range(3):
+        await pdl.enrich_company({'website': 'example.com'})
+
+    assert sample('enrichment_cache_lookups_total', {'source': 'pdl', 'result': 'hit'}) - hits_before == 2
+    assert sample('enrichment_cache_spend_avoided_total', {'source': 'pdl'}) - spend_before == pytest.approx(0.5)
+
+@pytest.mark.asyncio
+async def test_second_tier_is_shared_between_processes(clock):
+    """Test a result stored by one cache is served to another through Redis."""
+    redis = DictRedis()
+    writer, reader = EnrichmentCache(cache_config(), redis), EnrichmentCache(cache_config(), redis)
+    loader = AsyncMock(return_value={'profile_id': 7})
+
+    await writer.fetch('rocketreach', 'lookup_person', {'name': 'Jane Roe'}, loader)
+    result = await reader.fetch('rocketreach', 'lookup_person', {'name': 'jane roe'}, loader)
+
+    assert result == {'profile_id': 7}
+    assert loader.await_count == 1
@@ -0,0 +1,83 @@
+import pytest
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+from config.settings import ENRICHMENT_PLANNER_CONFIG
+from integrations.field_provenance import PROVENANCE_KEY
+from integrations.source_planner import SourcePlanner, SourceStats
+from pipeline.stages.data_enricher import DataEnricher
+
+enrichment_tasks = pytest.importorskip('tasks.enrichment_tasks', reason="celery is required for the task modules")
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+class StubEnricher(DataEnricher):
+    """The real enricher with its provider calls replaced"""
+
+    def __init__(self):
+        super().__init__()
+        self.fetchers = {'hunter': self._hunter}
+
+    async def _hunter(self, data):
+        return {'email_verification': {'status': 'valid'}}
+
+def test_bulk_enrichment_refreshes_due_profiles():
+    """Test the task path builds its enricher and stamps the re-enriched fields."""
+    profiles = [{'first_name': 'Jane', 'last_name': 'Roe', 'email': 'jane@example.com'}]
+    planner = SourcePlanner(stats=SourceStats(), costs={})
+
+    with patch.object(enrichment_tasks, 'DataEnricher', StubEnricher), \
+         patch('pipeline.stages.data_enricher.get_source_planner', return_value=planner):
+        summary, enriched = asyncio.run(enrichment_tasks._bulk_enrich(profiles, NOW, chunk_size=10))
+
+    assert summary['profiles_enriched'] == 1
+    assert summary['profiles_failed'] == 0
+    assert enriched[0][PROVENANCE_KEY]['email_verification']['source'] == 'hunter'
+
+def test_stored_profiles_are_looked_up_by_their_columns():
+    """Test identity columns fill the record so sources have something to call with."""
+    row = SimpleNamespace(
+        raw_data={'title': 'CTO', 'email': None},
+        first_name='Jane', last_name='Roe', email='jane@example.com', phone=None,
+        location=None, title='Engineer', company='Acme', linkedin_url=None
+    )
+
+    record = enrichment_tasks._profile_record(row)
+
+    assert record == {'first_name': 'Jane', 'last_name': 'Roe', 'email': 'jane@example.com', 'title': 'CTO', 'company': 'Acme'}
+    assert set(enrichment_tasks.get_source_planner().callable_sources(record, DataEnricher.SOURCES)) >= {'hunter', 'pdl'}
+
+class CountingEnricher(DataEnricher):
+    """The real enricher with provider calls that are only counted"""
+
+    calls = []
+
+    def __init__(self):
+        super().__init__()
+        self.fetchers = {source: self._counted(source) for source in ('hunter', 'lexisnexis', 'pdl')}
+
+    def _counted(self, source):
+        async def fetch(data):
+            self.calls.append(source)
+            return {}
+        return fetch
+
+def test_estimate_counts_the_calls_bulk_enrichment_makes():
+    """Test with the default (planner off) settings the estimate matches the calls made."""
+    fresh = datetime.utcnow().isoformat()
+    provenance = {
+        field: {'source': 'pdl', 'fetched_at': fresh}
+        for field in ENRICHMENT_PLANNER_CONFIG['fields'] if field != 'email_verification'
+    }
+    profiles = [{'first_name': 'Jane', 'last_name': 'Roe', 'email': 'jane@example.com', PROVENANCE_KEY: provenance}]
+    CountingEnricher.calls = []
+
+    with patch.object(enrichment_tasks, 'DataEnricher', CountingEnricher), \
+         patch.dict(ENRICHMENT_PLANNER_CONFIG, {'enabled': False}):
+        estimate = enrichment_tasks.estimate_bulk_enrichment(profiles)
+        enrichment_tasks.bulk_enrich_profiles(profiles)
+
+    assert CountingEnricher.calls == ['hunter']
+    assert estimate['planned_calls'] == len(CountingEnricher.calls)
+    assert estimate['by_source'] == {'hunter': 1}
@@ -0,0 +1,99 @@
+import pytest
+from pipeline.entity_resolver import Duplicate, EntityIndex, identity_record, normalize_email, normalize_name
+from pipeline.stages.data_processor import DataProcessor
+
+CONFIG = {
+    'num_perm': 64,
+    'bands': 16,
+    'threshold': 0.5,
+    'max_bucket': 8,
+    'max_entities': 100,
+    'free_email_domains': ['gmail.com']
+}
+
+JANE = {
+    'first_name': 'Jane',
+    'last_name': 'Lindqvist',
+    'email': 'jane.lindqvist@acme.com',
+    'company_domain': 'acme.com',
+    'linkedin_url': 'https://www.linkedin.com/in/jane-lindqvist'
+}
+
+@pytest.fixture
+def index():
+    index = EntityIndex(CONFIG)
+    index.resolve(JANE)
+    return index
+
+def test_identifiers_are_normalized():
+    """Test names lose accents and punctuation and mailboxes lose tags and free-mail dots."""
+    assert normalize_name({'first_name': 'José', 'last_name': "O'Neil-Ríos"}) == 'jose o neil rios'
+    assert normalize_name({'name': '  Jane   DOE '}) == 'jane doe'
+    assert normalize_email(' J.Doe+news@GMail.com', {'gmail.com'}) == 'jdoe@gmail.com'
+    assert normalize_email('j.doe+news@acme.com', {'gmail.com'}) == 'j.doe@acme.com'
+    assert normalize_email('not-an-email', set()) is None
+
+@pytest.mark.parametrize('variant, match', [
+    ({'email': 'JANE.LINDQVIST+crm@ACME.com', 'linkedin_url': None}, 'email'),
+    ({'email': None, 'linkedin_url': 'http://linkedin.com/in/jane-lindqvist/'}, 'linkedin'),
+    ({'email': None, 'linkedin_url': None, 'first_name': 'JANE'}, 'name_domain'),
+    ({'email': None, 'linkedin_url': None, 'last_name': 'Lindqvst'}, 'minhash')
+])
+def test_variants_resolve_to_the_same_entity(index, variant, match):
+    """Test each way a duplicate arrives is matched, and how."""
+    entity_id = next(iter(index.entities))
+
+    assert index.match({**JANE, **variant}) == (entity_id, match)
+
+@pytest.mark.parametrize('other', [
+    # Same name, different company
+    {'email': None, 'linkedin_url': None, 'company_domain': 'other.com'},
+    # Same name and company, but a different mailbox there
+    {'email': 'jlindqvist@acme.com', 'linkedin_url': None},
+    # Same name and company, but a different LinkedIn profile
+    {'email': None, 'linkedin_url': 'https://linkedin.com/in/jane-lindqvist-2'},
+    # A similar name and nothing else in common
+    {'email': 'jane@gmail.com', 'linkedin_url': None, 'company_domain': None, 'last_name': 'Lindqvst'}
+])
+def test_different_people_are_kept_apart(index, other):
+    """Test conflicting identifiers or a name alone never merge records."""
+    assert index.match({**JANE, **other}) == (None, 'none')
+
+def test_duplicates_merge_into_the_entity_and_are_indexed_by_new_keys(index):
+    """Test a duplicate fills the entity's gaps and its new identifiers find it later."""
+    entity_id = next(iter(index.entities))
+
+    resolved = index.resolve_record({**JANE, 'phone': '+14155550100', 'email': 'jane@gmail.com'})
+    assert resolved == Duplicate(entity_id, {**JANE, 'phone': '+14155550100'})
+
+    assert index.match({'first_name': 'J', 'last_name': 'Lindqvist', 'email': 'JANE@gmail.com'}) == (entity_id, 'email')
+
+    other = index.resolve_record({'first_name': 'Sam', 'last_name': 'Okafor', 'email': 'sam@gmail.com'})
+    assert other['entity_id'] != entity_id
+
+def test_oldest_entities_are_dropped_with_their_keys():
+    """Test the index stays within max_entities and evicted entities stop matching."""
+    index = EntityIndex({**CONFIG, 'max_entities': 2})
+    for i in range(3):
+        index.resolve({'first_name': 'Jane', 'last_name': f'Doe{i}', 'email': f'jane{i}@gmail.com'})
+
+    assert len(index.entities) == 2
+    assert index.match({'email': 'jane0@gmail.com'}) == (None, 'none')
+    assert all(entity_ids for entity_ids in index.buckets.values())
+
+@pytest.mark.asyncio
+async def test_processed_records_resolve_on_their_identifiers(index):
+    """Test the processor's output is matched through its params and sole API row."""
+    entity_id = next(iter(index.entities))
+    processed = await DataProcessor().process({
+        'api_data': {'results': [{'email': 'Jane.Lindqvist@acme.com', 'title': 'CTO'}]},
+        'web_data': [{'url': 'https://acme.com/team', 'title': 'Team', 'content': 'Jane', 'links': []}]
+    })
+
+    record = identity_record(processed, {'first_name': 'Jane', 'last_name': 'Lindqvist', 'query': 'cto'})
+    assert record == {'first_name': 'Jane', 'last_name': 'Lindqvist', 'email': 'Jane.Lindqvist@acme.com'}
+    assert index.match(record) == (entity_id, 'email')
+
+    # Several search hits may be different people, and content is never an identifier
+    processed['combined_data']['api_results'].append({'email': 'sam@acme.com'})
+    assert identity_record(processed, {'profile_url': 'https://acme.com/team'}) == {}
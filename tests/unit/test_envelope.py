@@ -0,0 +1,51 @@
+import pytest
+import json
+from pipeline.envelope import EnvelopeCodec, Schema, SchemaRegistry, SchemaError
+
+@pytest.fixture
+def codec():
+    return EnvelopeCodec()
+
+def test_round_trip(codec):
+    """Test records survive encoding and decoding unchanged."""
+    record = {
+        'url': 'https://example.com',
+        'html_content': '<html></html>',
+        'timestamp': '2024-01-01T00:00:00'
+    }
+
+    data = codec.encode('raw_html', record)
+
+    assert data[0] == 0
+    assert codec.decode(data) == record
+
+def test_legacy_json_is_decoded(codec):
+    """Test messages written before envelopes still decode."""
+    legacy = json.dumps({'first_name': 'John'}).encode()
+
+    assert codec.decode(legacy) == {'first_name': 'John'}
+
+def test_missing_required_field_is_rejected(codec):
+    """Test encoding enforces the schema's required fields."""
+    with pytest.raises(SchemaError):
+        codec.encode('raw_html', {'url': 'https://example.com'})
+
+def test_new_version_defaults_are_applied():
+    """Test old records read with a newer schema get the new field defaults."""
+    v1 = Schema(id=10, name='thing', version=1, fields={'a': {'required': True}})
+    v2 = Schema(id=11, name='thing', version=2, fields={
+        'a': {'required': True},
+        'b': {'required': True, 'default': 0}
+    })
+    writer = EnvelopeCodec(SchemaRegistry([v1]))
+    reader = EnvelopeCodec(SchemaRegistry([v1, v2]))
+
+    assert reader.decode(writer.encode('thing', {'a': 1})) == {'a': 1, 'b': 0}
+
+def test_incompatible_version_is_refused():
+    """Test the registry refuses versions that break existing readers."""
+    v1 = Schema(id=10, name='thing', version=1, fields={'a': {'required': True}})
+    v2 = Schema(id=11, name='thing', version=2, fields={'b': {'required': True}})
+
+    with pytest.raises(SchemaError):
+        SchemaRegistry([v1, v2])
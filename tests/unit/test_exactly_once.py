@@ -0,0 +1,119 @@
+import pytest
+from unittest.mock import AsyncMock
+from pipeline.kafka_config import KafkaConfig
+from pipeline.kafka_producer import DataProducer
+from pipeline.kafka_processor import DataProcessor
+from pipeline.memory_broker import MemoryBroker
+
+@pytest.fixture
+def kafka_config(tmp_path):
+    config = KafkaConfig()
+    config.BACKEND = 'memory'
+    config.BOOTSTRAP_SERVERS = 'memory://exactly-once-test'
+    config.BLOB_STORE_PATH = str(tmp_path / 'blobs')
+    config.AUDIT_SPOOL_DIR = str(tmp_path / 'audit')
+    config.CONSUMER_BATCH_TIMEOUT = 0.05
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+    yield config
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+
+async def start_processor(kafka_config, profile):
+    """Seed three extracted profiles and subscribe an exactly-once enrichment processor"""
+    upstream = DataProducer(kafka_config)
+    for i in range(3):
+        await upstream.produce(
+            kafka_config.TOPICS['extracted_data'],
+            key=f'email:person{i}@example.com',
+            value=upstream.codec.encode('profile', {**profile, 'email': f'person{i}@example.com'}),
+            wait=True
+        )
+    await upstream.close()
+
+    enricher = AsyncMock()
+    enricher.enrich.side_effect = lambda data: {**data, 'enrichment': {'sources': ['stub']}}
+    processor = DataProcessor(kafka_config, stages=['enrichment'], enricher=enricher, exactly_once=True)
+    consumer = processor.consumers['enrichment']
+    await consumer.subscribe([kafka_config.TOPICS['extracted_data']])
+    await processor.producer.producer.init_transactions()
+    return processor
+
+def topic_size(kafka_config, name):
+    broker = MemoryBroker.for_servers(kafka_config.BOOTSTRAP_SERVERS)
+    return sum(len(log) for log in broker.partitions(kafka_config.TOPICS[name]))
+
+def group_lag(kafka_config):
+    broker = MemoryBroker.for_servers(kafka_config.BOOTSTRAP_SERVERS)
+    return sum(broker.group_lag('data-enrichment-group', kafka_config.TOPICS['extracted_data']).values())
+
+def test_exactly_once_requires_single_stage(kafka_config):
+    """Test a transactional producer is never shared between stage loops."""
+    kafka_config.EXACTLY_ONCE = True
+    for processor in (DataProcessor(kafka_config), DataProcessor(kafka_config, stages=[])):
+        assert not processor.exactly_once
+        assert not processor.producer.transactional_id
+    assert DataProcessor(kafka_config, stages=['enrichment']).producer.transactional_id
+    with pytest.raises(ValueError):
+        DataProcessor(kafka_config, stages=['enrichment'], producer=DataProducer(kafka_config), exactly_once=True)
+
+@pytest.mark.asyncio
+async def test_batch_outputs_and_offsets_commit_together(kafka_config, mock_profile_data):
+    """Test a committed transaction publishes outputs and consumer offsets at once."""
+    processor = await start_processor(kafka_config, mock_profile_data)
+    consumer = processor.consumers['enrichment']
+    batch = await consumer.consume_batch()
+    assert len(batch) == 3
+
+    committed = await consumer.process_transaction(batch, processor._handle_extracted_data, processor.producer.producer)
+
+    assert committed
+    assert topic_size(kafka_config, 'enriched_data') == 3
+    assert group_lag(kafka_config) == 0
+    await processor.close()
+
+@pytest.mark.asyncio
+async def test_failed_record_is_dead_lettered_in_the_transaction(kafka_config, mock_profile_data):
+    """Test one failing record goes to the failed topic while the rest of its batch commits."""
+    processor = await start_processor(kafka_config, mock_profile_data)
+    consumer = processor.consumers['enrichment']
+    batch = await consumer.consume_batch()
+
+    async def fail_on_second(msg):
+        if msg.key() == b'email:person1@example.com':
+            raise ConnectionError("broker unavailable")
+        await processor._handle_extracted_data(msg)
+
+    committed = await consumer.process_transaction(
+        batch, fail_on_second, processor.producer.producer, processor._failure_router('enrichment')
+    )
+
+    assert committed
+    assert topic_size(kafka_config, 'enriched_data') == 2
+    assert topic_size(kafka_config, 'failed_processing') == 1
+    assert group_lag(kafka_config) == 0
+    await processor.close()
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_aborted_and_redelivered(kafka_config, mock_profile_data):
+    """Test a failure that cannot be dead-lettered publishes nothing, commits nothing and rewinds."""
+    processor = await start_processor(kafka_config, mock_profile_data)
+    consumer = processor.consumers['enrichment']
+    batch = await consumer.consume_batch()
+
+    async def fail_on_second(msg):
+        await processor._handle_extracted_data(msg)
+        if msg.key() == b'email:person1@example.com':
+            raise ConnectionError("broker unavailable")
+
+    async def dead_letter_down(msg, error):
+        raise ConnectionError("broker unavailable")
+
+    committed = await consumer.process_transaction(
+        batch, fail_on_second, processor.producer.producer, dead_letter_down
+    )
+
+    assert not committed
+    assert topic_size(kafka_config, 'enriched_data') == 0
+    assert group_lag(kafka_config) == 3
+    redelivered = await consumer.consume_batch()
+    assert sorted(m.offset() for m in redelivered) == sorted(m.offset() for m in batch)
+    await processor.close()
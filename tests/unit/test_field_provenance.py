@@ -0,0 +1,110 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import ANY, patch
+from integrations.field_provenance import PROVENANCE_KEY, expired_fields, stamp
+from integrations.source_planner import SourcePlanner, SourceStats
+from pipeline.stages.data_enricher import DataEnricher
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+CONFIG = {
+    'ttls': {'verification': 7 * 86400, 'employment': 14 * 86400, 'risk': 86400},
+    'classes': {'email_verification': 'verification', 'title': 'employment', 'background_check': 'risk'},
+    'default_ttl': 30 * 86400
+}
+
+def fetched(days_ago, source='hunter'):
+    return {'source': source, 'fetched_at': (NOW - timedelta(days=days_ago)).isoformat()}
+
+def test_each_field_class_expires_on_its_own_ttl():
+    """Test only fields older than their class TTL are due."""
+    record = {PROVENANCE_KEY: {
+        'email_verification': fetched(8),
+        'title': fetched(8),
+        'background_check': fetched(2, source=None)
+    }}
+
+    due = expired_fields(record, ['email_verification', 'title', 'background_check'], NOW, config=CONFIG)
+
+    assert due == {'email_verification', 'background_check'}
+
+def test_fields_without_provenance_fall_back_to_the_update_time():
+    """Test untracked fields age from the profile's last update, or are due without one."""
+    wanted = ['title', 'skills']
+
+    assert expired_fields({}, wanted, NOW, config=CONFIG) == {'title', 'skills'}
+    assert expired_fields({}, wanted, NOW, default_fetched_at=NOW - timedelta(days=20), config=CONFIG) == {'title'}
+
+def test_stamp_marks_misses_and_leaves_the_input_untouched():
+    """Test unfilled fields are stamped too, on a copy of the provenance."""
+    original = {PROVENANCE_KEY: {'title': fetched(30)}}
+    record = dict(original)
+
+    stamp(record, {'title': 'rocketreach'}, ['title', 'phone'], NOW, CONFIG)
+
+    assert record[PROVENANCE_KEY] == {
+        'title': {'source': 'rocketreach', 'fetched_at': NOW.isoformat()},
+        'phone': {'source': None, 'fetched_at': NOW.isoformat()}
+    }
+    assert original[PROVENANCE_KEY] == {'title': fetched(30)}
+
+@pytest.mark.asyncio
+async def test_partial_re_enrichment_calls_only_sources_for_due_fields():
+    """Test requesting one expired field calls just the source for it and stamps it."""
+    with patch.object(DataEnricher, '_initialize_apis', return_value={}):
+        enricher = DataEnricher()
+    calls = []
+
+    def source(name, result):
+        async def fetch(data):
+            calls.append(name)
+            return result
+        return fetch
+
+    enricher.fetchers = {
+        'hunter': source('hunter', {'email_verification': {'status': 'valid'}}),
+        'lexisnexis': source('lexisnexis', {'risk_assessment': {'score': 1}}),
+        'pdl': source('pdl', {'job_title': 'CTO'})
+    }
+    profile = {'first_name': 'Jane', 'last_name': 'Roe', 'email': 'jane@example.com', 'title': 'CEO'}
+    planner = SourcePlanner(stats=SourceStats(), costs={})
+
+    with patch.dict('pipeline.stages.data_enricher.ENRICHMENT_PLANNER_CONFIG', {'enabled': True}), \
+         patch('pipeline.stages.data_enricher.get_source_planner', return_value=planner):
+        enriched = await enricher.enrich(profile, fields=['email_verification'])
+
+    assert calls == ['hunter']
+    assert enriched[PROVENANCE_KEY]['email_verification']['source'] == 'hunter'
+    assert set(enriched[PROVENANCE_KEY]) == {'email_verification'}
+    assert enriched['enrichment_metadata']['skipped'] == ['lexisnexis', 'pdl']
+    assert PROVENANCE_KEY not in profile
+
+def test_enricher_builds_with_the_default_config():
+    """Test every source has config and clients that cannot be built are skipped, not fatal."""
+    enricher = DataEnricher()
+
+    assert set(enricher.fetchers) == set(enricher.apis)
+    assert set(enricher.fetchers) <= set(DataEnricher.SOURCES)
+    assert 'hunter' in enricher.fetchers
+
+@pytest.mark.asyncio
+async def test_fields_no_called_source_covers_stay_due():
+    """Test only fields a source that answered could fill are stamped, misses included."""
+    with patch.object(DataEnricher, '_initialize_apis', return_value={}):
+        enricher = DataEnricher()
+
+    async def hunter(data):
+        return {}
+
+    async def lexisnexis(data):
+        raise TimeoutError("provider down")
+
+    enricher.fetchers = {'hunter': hunter, 'lexisnexis': lexisnexis}
+    profile = {'last_name': 'Roe', 'email': 'jane@example.com'}
+    planner = SourcePlanner(stats=SourceStats(), costs={})
+
+    with patch('pipeline.stages.data_enricher.get_source_planner', return_value=planner):
+        enriched = await enricher.enrich(profile, fields=['email_verification', 'background_check', 'skills'])
+
+    assert enriched[PROVENANCE_KEY] == {'email_verification': {'source': None, 'fetched_at': ANY}}
+    assert expired_fields(enriched, ['background_check', 'skills'], NOW, config=CONFIG) == {'background_check', 'skills'}
@@ -0,0 +1,57 @@
+import pytest
+import time
+from prometheus_client import REGISTRY
+from pipeline.kafka_config import KafkaConfig
+from pipeline.memory_broker import MemoryBroker, MemoryMessage
+from pipeline.flow_metrics import (
+    ORIGIN_HEADER, ConsumerLagMonitor, desired_workers, origin_headers, observe_message_age
+)
+
+@pytest.fixture
+def kafka_config():
+    config = KafkaConfig()
+    config.BACKEND = 'memory'
+    config.BOOTSTRAP_SERVERS = 'memory://flow-metrics-test'
+    # Deliberately out of date: the broker's metadata says two partitions
+    config.TOPIC_PARTITIONS = {**config.TOPIC_PARTITIONS, 'raw_html': 12}
+    config.LAG_TARGET_PER_WORKER = 1
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+    yield config
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+
+def test_lag_monitor_reports_backlog_and_desired_workers(kafka_config):
+    """Test lag is measured from committed offsets and workers are capped by real partitions."""
+    broker = MemoryBroker.for_servers(kafka_config.BOOTSTRAP_SERVERS)
+    topic = kafka_config.TOPICS['raw_html']
+    broker.create_topic(topic, 2)
+    for i in range(7):
+        broker.append(topic, i % 2, None, b'page', None)
+    broker.committed[(kafka_config.CONSUMER_GROUPS['extraction'], topic, 0)] = 3
+
+    monitor = ConsumerLagMonitor(kafka_config)
+    signals = monitor.collect()
+    monitor.close()
+
+    assert signals['extraction'] == {'backlog': 4, 'desired_workers': 2}
+    assert REGISTRY.get_sample_value(
+        'pipeline_consumer_lag_messages',
+        {'group': 'profile-extraction-group', 'topic': topic, 'partition': '1'}
+    ) == 3
+    assert REGISTRY.get_sample_value('pipeline_stage_backlog_messages', {'stage': 'extraction'}) == 4
+
+def test_desired_workers_bounds():
+    """Test the scaling signal keeps one worker and never exceeds partitions."""
+    assert desired_workers(0, 1000, 12) == 1
+    assert desired_workers(2500, 1000, 12) == 3
+    assert desired_workers(10 ** 6, 1000, 12) == 12
+
+def test_origin_header_carries_message_age():
+    """Test the origin timestamp is forwarded and observed as end-to-end age."""
+    origin = str(int(time.time() * 1000) - 2000)
+    msg = MemoryMessage('validated', 0, 0, None, b'{}', {ORIGIN_HEADER: origin}, 0)
+    assert origin_headers(msg) == {ORIGIN_HEADER: origin.encode('utf-8')}
+    assert origin_headers(MemoryMessage('validated', 0, 0, None, b'{}', None, 0)) is None
+
+    before = REGISTRY.get_sample_value('pipeline_message_age_seconds_sum') or 0
+    observe_message_age(msg)
+    assert REGISTRY.get_sample_value('pipeline_message_age_seconds_sum') - before >= 2
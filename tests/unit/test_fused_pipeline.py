@@ -0,0 +1,73 @@
+import pytest
+import json
+from unittest.mock import AsyncMock
+from pipeline.kafka_config import KafkaConfig
+from pipeline.kafka_processor import DataProcessor
+from pipeline.fused_lookup import lookup_profile
+from pipeline.memory_broker import MemoryBroker
+
+PROFILE_HTML = """
+<html><head><title>John Doe - Example</title>
+<script type="application/ld+json">{}</script></head>
+<body><a href="mailto:john.doe@example.com">Email</a></body></html>
+""".format(json.dumps({
+    '@type': 'Person',
+    'name': 'John Doe',
+    'givenName': 'John',
+    'familyName': 'Doe',
+    'jobTitle': 'Software Engineer',
+    'worksFor': {'name': 'Test Company'},
+    'sameAs': ['https://linkedin.com/in/johndoe']
+}))
+
+@pytest.fixture
+def processor():
+    enricher = AsyncMock()
+    enricher.enrich.side_effect = lambda data: {**data, 'enrichment': {'sources': ['stub']}}
+    validator = AsyncMock()
+    validator.validate.return_value = True
+    return DataProcessor(KafkaConfig(), stages=[], enricher=enricher, validator=validator)
+
+@pytest.mark.asyncio
+async def test_fused_runs_all_stages_in_memory(processor):
+    """Test one request goes through extraction, enrichment and validation."""
+    result = await processor.process_fused('https://example.com/john', PROFILE_HTML, publish=False)
+
+    assert result['full_name'] == 'John Doe'
+    assert result['email'] == 'john.doe@example.com'
+    assert result['linkedin_url'] == 'https://linkedin.com/in/johndoe'
+    assert result['enrichment']['sources'] == ['stub']
+    assert result['validation']['status'] == 'valid'
+    assert result['pipeline']['mode'] == 'fused'
+    assert processor.consumers == {}
+
+@pytest.mark.asyncio
+async def test_fused_validation_failure_raises(processor):
+    """Test validation failures surface to the interactive caller."""
+    processor.validator.validate.return_value = False
+
+    with pytest.raises(ValueError):
+        await processor.process_fused(
+            'https://example.com/john',
+            PROFILE_HTML,
+            publish=False,
+            record_failures=False
+        )
+
+@pytest.mark.asyncio
+async def test_lookup_profile_publishes_the_fused_result(tmp_path):
+    """Test an interactive lookup runs the real validator in memory and publishes once."""
+    config = KafkaConfig()
+    config.BACKEND = 'memory'
+    config.BOOTSTRAP_SERVERS = 'memory://fused-lookup-test'
+    config.AUDIT_SPOOL_DIR = str(tmp_path / 'audit')
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+    enricher = AsyncMock()
+    enricher.enrich.side_effect = lambda data: {**data, 'name': 'John Doe', 'location': 'Berlin', 'skills': ['Python']}
+
+    profile = await lookup_profile('https://example.com/john', PROFILE_HTML, config, enricher=enricher)
+
+    broker = MemoryBroker.for_servers(config.BOOTSTRAP_SERVERS)
+    assert profile['validation']['status'] == 'valid'
+    assert sum(len(log) for log in broker.partitions(config.TOPICS['validated_data'])) == 1
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
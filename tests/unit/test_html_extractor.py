@@ -0,0 +1,34 @@
+import json
+from pipeline.html_extractor import extract_profile_fields
+
+def page(*json_ld):
+    scripts = ''.join(f'<script type="application/ld+json">{json.dumps(item)}</script>' for item in json_ld)
+    return f"<html><head><title>Profile</title>{scripts}</head><body></body></html>"
+
+def test_person_fields_from_json_ld():
+    """Test a Person inside a @graph supplies the profile fields."""
+    profile = extract_profile_fields(page({'@graph': [{
+        '@type': 'Person',
+        'name': 'Jane Doe',
+        'email': 'mailto:jane@example.com',
+        'worksFor': {'name': 'Acme'},
+        'sameAs': ['https://twitter.com/jane', 'https://linkedin.com/in/janedoe']
+    }]}))
+
+    assert profile['full_name'] == 'Jane Doe'
+    assert profile['email'] == 'jane@example.com'
+    assert profile['company'] == 'Acme'
+    assert profile['linkedin_url'] == 'https://linkedin.com/in/janedoe'
+
+def test_unexpected_json_ld_shapes_are_skipped():
+    """Test scalar JSON-LD and non-string identifiers do not break extraction."""
+    profile = extract_profile_fields(page('just a string', 42, {
+        '@type': 'Person',
+        'name': 'Jane Doe',
+        'email': ['jane@example.com'],
+        'sameAs': [{'@id': 'https://example.com/jane'}, None, 'https://linkedin.com/in/janedoe']
+    }))
+
+    assert profile['full_name'] == 'Jane Doe'
+    assert 'email' not in profile
+    assert profile['linkedin_url'] == 'https://linkedin.com/in/janedoe'
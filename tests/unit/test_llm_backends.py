@@ -0,0 +1,50 @@
+import pytest
+import asyncio
+from llm import FakeLLMBackend, get_backend
+from parse import aparse_chunks, pack_chunks, parse_with_ollama
+
+@pytest.fixture
+def fake_backend():
+    return FakeLLMBackend(base_latency_ms=1, decode_ms_per_token=0, max_concurrency=2)
+
+def test_fake_backend_is_deterministic(fake_backend):
+    """Test the same prompt always yields the same completion."""
+    assert fake_backend.generate("alpha beta gamma") == fake_backend.generate("alpha beta gamma")
+    assert fake_backend.stats['calls'] == 2
+
+def test_get_backend_reuses_instances():
+    """Test backends are cached per kind and options."""
+    first = get_backend('fake', seed=42)
+    second = get_backend('fake', seed=42)
+    other = get_backend('fake', seed=7)
+
+    assert first is second
+    assert first is not other
+
+def test_pack_chunks():
+    """Test chunks are grouped into packs in order."""
+    packs = pack_chunks(['a', 'b', 'c'], pack_size=2)
+
+    assert packs == ['a\n\nb', 'c']
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_respected(fake_backend):
+    """Test the fake backend never serves more than its slot count."""
+    await aparse_chunks(['chunk'] * 10, 'names', fake_backend, concurrency=8)
+
+    assert fake_backend.stats['calls'] == 10
+    assert fake_backend.peak_in_flight == 2
+
+@pytest.mark.asyncio
+async def test_packing_reduces_calls(fake_backend):
+    """Test packing sends fewer, larger requests."""
+    await aparse_chunks(['chunk'] * 10, 'names', fake_backend, concurrency=2, pack_size=5)
+
+    assert fake_backend.stats['calls'] == 2
+
+def test_parse_with_ollama_accepts_backend(fake_backend):
+    """Test the legacy entry point can run against an injected backend."""
+    result = parse_with_ollama(['John Doe, engineer'], 'names', backend=fake_backend)
+
+    assert result
+    assert fake_backend.stats['calls'] == 1
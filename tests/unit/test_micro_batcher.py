@@ -0,0 +1,99 @@
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+from cache.enrichment_cache import EnrichmentCache, set_enrichment_cache
+from integrations import PeopleDataLabsAPI
+from integrations.micro_batcher import MicroBatcher
+
+@pytest.fixture(autouse=True)
+def uncached():
+    set_enrichment_cache(EnrichmentCache({'enabled': False}))
+    yield
+    set_enrichment_cache(None)
+
+def echo_batches(sent):
+    async def send(batch):
+        sent.append(list(batch))
+        return [f"result {request}" for request in batch]
+    return send
+
+@pytest.mark.asyncio
+async def test_requests_are_sent_in_batches_of_at_most_max_size():
+    """Test a burst is cut into full batches and results reach the right callers."""
+    sent = []
+    batcher = MicroBatcher(echo_batches(sent), max_size=3, max_wait=1)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(i) for i in range(6))),
+        timeout=0.5
+    )
+
+    assert results == [f"result {i}" for i in range(6)]
+    assert sent == [[0, 1, 2], [3, 4, 5]]
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_sent_after_max_wait():
+    """Test requests never wait longer than max_wait for a batch to fill."""
+    sent = []
+    batcher = MicroBatcher(echo_batches(sent), max_size=100, max_wait=0.02)
+
+    results = await asyncio.wait_for(asyncio.gather(batcher.submit('a'), batcher.submit('b')), timeout=0.5)
+
+    assert results == ['result a', 'result b']
+    assert sent == [['a', 'b']]
+
+@pytest.mark.asyncio
+async def test_failures_reach_only_the_affected_callers():
+    """Test a per-request error fails that caller and a bulk error fails the batch."""
+    async def partly_failing(batch):
+        return [ValueError("bad request") if request == 'bad' else request for request in batch]
+
+    batcher = MicroBatcher(partly_failing, max_size=2, max_wait=1)
+    results = await asyncio.gather(batcher.submit('ok'), batcher.submit('bad'), return_exceptions=True)
+    assert results[0] == 'ok' and isinstance(results[1], ValueError)
+
+    batcher = MicroBatcher(AsyncMock(side_effect=ConnectionError("reset")), max_size=2, max_wait=1)
+    results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+@pytest.mark.asyncio
+async def test_pdl_enrich_person_uses_bulk_endpoint():
+    """Test concurrent person enrichments go out as one bulk_enrich call."""
+    pdl = PeopleDataLabsAPI('test-key', batching=True)
+    pdl.bulk_enrich = AsyncMock(return_value=[
+        {'status': 200, 'likelihood': 9, 'data': {'full_name': 'person 0'}},
+        {'status': 404, 'error': {'type': 'not_found'}},
+        {'status': 200, 'likelihood': 8, 'data': {'full_name': 'person 2'}}
+    ])
+    pdl._make_request = AsyncMock()
+
+    results = await asyncio.gather(*(
+        pdl.enrich_person({'profile': [f'https://linkedin.com/in/person{i}'], 'min_likelihood': 0.7})
+        for i in range(3)
+    ))
+
+    assert pdl.bulk_enrich.await_count == 1
+    assert len(pdl.bulk_enrich.await_args.args[0]) == 3
+    assert pdl._make_request.await_count == 0
+    assert [result.get('likelihood') for result in results] == [9, None, 8]
+
+@pytest.mark.asyncio
+async def test_pdl_bulk_request_body_and_responses():
+    """Test the bulk call uses PDL's request format and maps each response back to its caller."""
+    pdl = PeopleDataLabsAPI('test-key', batching=True)
+    pdl._make_request = AsyncMock(return_value=[
+        {'status': 200, 'likelihood': 9, 'data': {'full_name': 'person 0'}},
+        {'status': 404, 'error': {'type': 'not_found'}},
+        {'status': 500, 'error': {'type': 'error'}}
+    ])
+    params = [{'profile': [f'https://linkedin.com/in/person{i}']} for i in range(3)]
+
+    results = await asyncio.gather(*(pdl.enrich_person(p) for p in params), return_exceptions=True)
+
+    assert pdl._make_request.await_count == 1
+    endpoint = pdl._make_request.await_args.args[0]
+    assert endpoint == 'https://api.peopledatalabs.com/v5/person/bulk'
+    assert pdl._make_request.await_args.kwargs['data'] == {'requests': [{'params': p} for p in params]}
+    assert results[0]['data'] == {'full_name': 'person 0'}
+    assert results[1] == {}
+    assert isinstance(results[2], RuntimeError)
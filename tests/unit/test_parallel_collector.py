@@ -0,0 +1,55 @@
+import pytest
+from pipeline.parallel_collector import ParallelCollector
+
+class TooManyRequests(Exception):
+    status = 429
+
+class StubRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, expiry=None):
+        self.store[key] = value
+
+@pytest.fixture
+def collector():
+    collector = ParallelCollector(StubRedis())
+    collector.limiter.config.update({'initial': 8, 'min': 1, 'max': 16, 'backoff': 0.5})
+    collector.limiter.limit = 8.0
+    return collector
+
+@pytest.mark.asyncio
+async def test_rate_limited_source_lowers_the_limit(collector):
+    """Test a 429 swallowed by DataCollector still reaches the limiter."""
+    async def rate_limited(params):
+        raise TooManyRequests("429 Too Many Requests")
+
+    async def no_pages(params):
+        return []
+
+    collector.collector._collect_api_data = rate_limited
+    collector.collector._collect_web_data = no_pages
+
+    results = await collector.collect_batch([{'id': 'p1'}])
+
+    assert len(results) == 1
+    assert collector.max_concurrent == 4
+
+@pytest.mark.asyncio
+async def test_ordinary_failure_keeps_the_limit(collector):
+    """Test a source failure that is not overload does not back off."""
+    async def broken(params):
+        raise ValueError("unexpected payload")
+
+    async def no_pages(params):
+        return []
+
+    collector.collector._collect_api_data = broken
+    collector.collector._collect_web_data = no_pages
+
+    await collector.collect_batch([{'id': 'p1'}])
+
+    assert collector.max_concurrent == 8
@@ -0,0 +1,13 @@
+from pipeline.partitioning import normalize_url, profile_key
+
+def test_normalize_url():
+    """Test equivalent URLs normalize to the same key."""
+    assert normalize_url('https://www.LinkedIn.com/in/johndoe/') == 'linkedin.com/in/johndoe'
+    assert normalize_url('linkedin.com/in/johndoe') == 'linkedin.com/in/johndoe'
+
+def test_profile_key_prefers_strongest_identity(mock_profile_data):
+    """Test the LinkedIn URL wins over email and page URL."""
+    assert profile_key(mock_profile_data) == 'linkedin:linkedin.com/in/johndoe'
+    assert profile_key({'email': ' John.Doe@Example.com'}) == 'email:john.doe@example.com'
+    assert profile_key({}, default='https://example.com/team/') == 'url:example.com/team'
+    assert profile_key({}) is None
@@ -0,0 +1,63 @@
+import pytest
+from scraper.selector_templates import SelectorTemplateStore
+
+def profile_page(name, title):
+    return (
+        "<html><body><div class='nav'>Home</div>"
+        f"<div id='main'><h1 class='name'>{name}</h1><p>About</p>"
+        f"<span class='title'>{title}</span></div></body></html>"
+    )
+
+@pytest.fixture
+def template_store():
+    return SelectorTemplateStore(min_samples=2, min_confidence=0.9)
+
+def test_template_not_used_until_confident(template_store):
+    """Test a freshly induced template still defers to the LLM."""
+    url = "https://example.com/people/1"
+    template = template_store.observe(url, profile_page("John Doe", "CEO"), "people", "John Doe\nCEO")
+
+    assert template is not None
+    assert template.fields['value_0']['css'] == 'div#main > h1.name'
+    assert template_store.extract(url, profile_page("Jane Roe", "CTO"), "people") is None
+
+def test_confident_template_replaces_llm(template_store):
+    """Test a validated template extracts later pages on the same domain."""
+    template_store.observe("https://example.com/people/1", profile_page("John Doe", "CEO"), "people", "John Doe\nCEO")
+    template_store.observe("https://example.com/people/2", profile_page("Jane Roe", "CTO"), "people", "Jane Roe\nCTO")
+
+    result = template_store.extract("https://example.com/people/3", profile_page("Max Mustermann", "VP Sales"), "people")
+
+    assert result == "Max Mustermann\nVP Sales"
+    assert template_store.stats['template_hits'] == 1
+
+def test_template_falls_back_when_layout_changes(template_store):
+    """Test a template that stops matching is demoted."""
+    template_store.observe("https://example.com/people/1", profile_page("John Doe", "CEO"), "people", "John Doe\nCEO")
+    template_store.observe("https://example.com/people/2", profile_page("Jane Roe", "CTO"), "people", "Jane Roe\nCTO")
+
+    redesigned = "<html><body><section><b>Max Mustermann</b></section></body></html>"
+
+    assert template_store.extract("https://example.com/people/3", redesigned, "people") is None
+    assert template_store.stats['fallbacks'] == 1
+    assert template_store.extract("https://example.com/people/4", profile_page("A B", "C"), "people") is None
+
+def test_structured_extraction(template_store):
+    """Test dict extractions keep their field names."""
+    url = "https://example.com/people/1"
+    template_store.observe(url, profile_page("John Doe", "CEO"), "people", {'name': 'John Doe', 'title': 'CEO'})
+    template_store.observe(url, profile_page("Jane Roe", "CTO"), "people", {'name': 'Jane Roe', 'title': 'CTO'})
+
+    assert template_store.extract(url, profile_page("A B", "C"), "people") == {'name': 'A B', 'title': 'C'}
+
+def test_save_needs_a_path(template_store, tmp_path):
+    """Test saving without any path fails clearly and a store path round-trips."""
+    with pytest.raises(ValueError):
+        template_store.save()
+
+    path = str(tmp_path / 'templates.json')
+    store = SelectorTemplateStore(path=path)
+    store.observe("https://example.com/people/1", profile_page("John Doe", "CEO"), "people", "John Doe\nCEO")
+    store.save()
+
+    assert SelectorTemplateStore(path=path).templates.keys() == store.templates.keys()
@@ -0,0 +1,93 @@
+import pytest
+import asyncio
+from cache.enrichment_cache import EnrichmentCache, set_enrichment_cache
+from integrations import HunterAPI
+from integrations.singleflight import SingleFlight
+
+class Upstream:
+    def __init__(self, result=None, error=None, delay=0.05):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_upstream_call():
+    """Test a burst of identical lookups collapses into a single call."""
+    flight = SingleFlight('clearbit')
+    upstream = Upstream({'name': 'Example'})
+
+    results = await asyncio.gather(*(flight.do('example.com', upstream) for _ in range(10)))
+
+    assert upstream.calls == 1
+    assert results == [{'name': 'Example'}] * 10
+    assert flight.stats == {'calls': 1, 'coalesced': 9, 'shared': 0}
+    assert flight.in_flight == {}
+
+@pytest.mark.asyncio
+async def test_failures_reach_waiting_callers_but_are_not_kept():
+    """Test every waiting caller sees the failure and the next call tries again."""
+    flight = SingleFlight('zoominfo')
+    failing = Upstream(error=ConnectionError("timeout"))
+
+    results = await asyncio.gather(*(flight.do('example.com', failing) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+    assert await flight.do('example.com', Upstream({'ok': True})) == {'ok': True}
+    assert failing.calls == 1
+
+@pytest.mark.asyncio
+async def test_recent_results_are_shared_only_when_enabled():
+    """Test a finished result is reused for share_for seconds and no longer."""
+    flight = SingleFlight('hunter', share_for=0.05)
+    upstream = Upstream({'emails': []}, delay=0)
+
+    await flight.do('example.com', upstream)
+    await flight.do('example.com', upstream)
+    await asyncio.sleep(0.06)
+    await flight.do('example.com', upstream)
+
+    assert upstream.calls == 2
+    assert flight.stats['shared'] == 1
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_fail_followers():
+    """Test followers retry when the caller running the lookup is cancelled."""
+    flight = SingleFlight('apollo')
+    upstream = Upstream({'id': 1}, delay=0.05)
+
+    leader = asyncio.create_task(flight.do('key', upstream))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do('key', upstream))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await follower == {'id': 1}
+    assert upstream.calls == 2
+
+@pytest.mark.asyncio
+async def test_client_domain_lookups_are_coalesced():
+    """Test concurrent domain searches for one domain make one provider request, cache or not."""
+    set_enrichment_cache(EnrichmentCache({'enabled': False}))
+    try:
+        hunter = HunterAPI('test-key')
+        request = Upstream({'data': {'emails': []}})
+        hunter._make_request = lambda *args, **kwargs: request()
+
+        results = await asyncio.gather(
+            hunter.domain_search('example.com'),
+            hunter.domain_search(' Example.com'),
+            hunter.domain_search('other.com')
+        )
+
+        assert request.calls == 2
+        assert results[0] == results[1] == {'data': {'emails': []}}
+    finally:
+        set_enrichment_cache(None)
@@ -0,0 +1,88 @@
+import pytest
+from prometheus_client import REGISTRY
+from integrations.source_planner import SourcePlanner, SourceSpec, SourceStats, missing_fields
+
+CATALOG = {
+    'cheap': SourceSpec('cheap', {'email': ['email'], 'phone': ['phone']}, coverage=0.6),
+    'pricey': SourceSpec('pricey', {'email': ['work_email'], 'phone': ['mobile'], 'title': ['job_title']}, coverage=0.6),
+    'company': SourceSpec('company', {'company_info': ['employees']}, requires_any=('company_domain',), coverage=0.9)
+}
+
+CONFIG = {'fields': ['email', 'phone', 'title', 'company_info'], 'cost_weight': 10, 'latency_weight': 1, 'max_waves': 3}
+
+class Source:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def __call__(self, profile):
+        self.calls += 1
+        return self.result
+
+def planner(costs=None, stats=None):
+    return SourcePlanner(CATALOG, stats or SourceStats(), CONFIG, costs or {'cheap': 0.01, 'pricey': 0.5})
+
+def test_missing_fields_counts_stale_values_as_missing():
+    """Test present fields are skipped unless they are known to be stale."""
+    profile = {'email': 'jane@example.com', 'phone': '', 'title': 'CTO'}
+
+    assert missing_fields(profile, ['email', 'phone', 'title']) == {'phone'}
+    assert missing_fields(profile, ['email', 'phone', 'title'], stale=['title']) == {'phone', 'title'}
+
+def test_missing_fields_ignores_nested_values():
+    """Test only top-level fields and provenance-recorded fills count as present."""
+    profile = {
+        'experience': [{'title': 'Engineer', 'company': 'Acme'}],
+        'pdl_data': {'mobile_phone': '555'},
+        'field_provenance': {'phone': {'source': 'pdl'}, 'email': {'source': None}}
+    }
+
+    assert missing_fields(profile, ['email', 'phone', 'title']) == {'email', 'title'}
+
+def test_wave_prefers_the_cheaper_source_for_the_same_fields():
+    """Test the greedy cover picks expected fields per unit of cost."""
+    assert planner().next_wave({'email', 'phone'}, ['cheap', 'pricey']) == ['cheap']
+    assert planner().next_wave({'email', 'title'}, ['cheap', 'pricey']) == ['cheap', 'pricey']
+    assert planner().next_wave(set(), ['cheap', 'pricey']) == []
+
+@pytest.mark.asyncio
+async def test_later_sources_are_called_only_for_what_is_left():
+    """Test a source filling every gap means the fallback is never called."""
+    cheap, pricey = Source({'email': 'a@example.com', 'phone': '555'}), Source({'job_title': 'CTO'})
+    profile = {'title': 'CTO', 'company_info': {'employees': 10}}
+
+    results, missing = await planner().run(profile, {'cheap': cheap, 'pricey': pricey})
+
+    assert (cheap.calls, pricey.calls) == (1, 0)
+    assert set(results) == {'cheap'} and missing == set()
+
+    cheap.result = {'email': 'a@example.com'}
+    results, missing = await planner().run(profile, {'cheap': cheap, 'pricey': pricey})
+    assert pricey.calls == 1
+    assert missing == {'phone'}
+
+@pytest.mark.asyncio
+async def test_sources_without_their_inputs_are_skipped():
+    """Test a source is not called when the profile lacks every input it needs."""
+    def sample():
+        return REGISTRY.get_sample_value('enrichment_planner_calls_total', {'source': 'company', 'result': 'skipped'}) or 0.0
+
+    company = Source({'employees': 10})
+    before = sample()
+
+    results, missing = await planner().run({'email': 'a', 'phone': 'b', 'title': 'c'}, {'company': company})
+    assert company.calls == 0 and missing == {'company_info'}
+    assert sample() - before == 1
+
+    await planner().run({'company_domain': 'example.com'}, {'company': company})
+    assert company.calls == 1
+
+def test_observed_misses_and_latency_change_the_ranking():
+    """Test a source that keeps coming back empty or slow loses its place."""
+    stats = SourceStats(prior_weight=2)
+    for _ in range(20):
+        stats.record('cheap', ['email', 'phone'], [], 4.0)
+
+    assert stats.coverage(CATALOG['cheap'], 'email') == pytest.approx(1.2 / 22)
+    assert stats.p95('cheap') == 4.0
+    assert planner(stats=stats).next_wave({'email', 'phone'}, ['cheap', 'pricey']) == ['pricey']
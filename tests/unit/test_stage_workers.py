@@ -0,0 +1,53 @@
+import pytest
+import asyncio
+from pipeline.kafka_config import KafkaConfig
+from pipeline.kafka_producer import DataProducer
+from pipeline.memory_broker import MemoryBroker
+from pipeline.stage_workers import StageWorkerPool
+
+@pytest.fixture
+def kafka_config(tmp_path):
+    config = KafkaConfig()
+    config.BACKEND = 'memory'
+    config.BOOTSTRAP_SERVERS = 'memory://stage-workers-test'
+    config.BLOB_STORE_PATH = str(tmp_path / 'blobs')
+    config.AUDIT_SPOOL_DIR = str(tmp_path / 'audit')
+    config.CONSUMER_BATCH_TIMEOUT = 0.05
+    config.EXACTLY_ONCE = False
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+    yield config
+    MemoryBroker.reset(config.BOOTSTRAP_SERVERS)
+
+def topic_size(kafka_config, name):
+    broker = MemoryBroker.for_servers(kafka_config.BOOTSTRAP_SERVERS)
+    return sum(len(log) for log in broker.partitions(kafka_config.TOPICS[name]))
+
+@pytest.mark.asyncio
+async def test_validation_workers_reject_invalid_records(kafka_config):
+    """Test a stage worker validates with the real DataValidator and dead-letters failures."""
+    upstream = DataProducer(kafka_config)
+    records = [
+        {'name': 'Jane Roe', 'location': 'Berlin', 'skills': ['Python'], 'email': 'jane@example.com'},
+        {'name': 'Sam Okafor', 'location': '', 'skills': [], 'email': 'not-an-email'}
+    ]
+    for record in records:
+        await upstream.produce(
+            kafka_config.TOPICS['enriched_data'],
+            key=record['name'],
+            value=upstream.codec.encode('profile', record),
+            wait=True
+        )
+    await upstream.close()
+
+    pool = StageWorkerPool(kafka_config, {'validation': 1})
+    task = asyncio.create_task(pool.run())
+    for _ in range(100):
+        if topic_size(kafka_config, 'validated_data') + topic_size(kafka_config, 'failed_processing') == 2:
+            break
+        await asyncio.sleep(0.02)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert topic_size(kafka_config, 'validated_data') == 1
+    assert topic_size(kafka_config, 'failed_processing') == 1
@@ -0,0 +1,96 @@
+import pytest
+import asyncio
+from pipeline.streaming import StreamStage, stream_stages
+
+async def numbers(count, produced=None):
+    for i in range(count):
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+def stage(name, func, concurrency=1, queue_size=2):
+    return StreamStage(name, func, concurrency, queue_size)
+
+@pytest.mark.asyncio
+async def test_stages_overlap_and_emit_as_finished():
+    """Test slow items do not hold back faster ones and stages run concurrently."""
+    active = {'collect': 0, 'enrich': 0}
+    overlap = []
+
+    async def collect(i):
+        active['collect'] += 1
+        overlap.append(active['enrich'])
+        await asyncio.sleep(0.01)
+        active['collect'] -= 1
+        return i
+
+    async def enrich(i):
+        active['enrich'] += 1
+        await asyncio.sleep(0.2 if i == 0 else 0.01)
+        active['enrich'] -= 1
+        return i * 10
+
+    results = [
+        item.value async for item in stream_stages(
+            numbers(6),
+            [stage('collect', collect), stage('enrich', enrich, concurrency=3)]
+        )
+    ]
+
+    assert sorted(results) == [0, 10, 20, 30, 40, 50]
+    assert results[-1] == 0
+    assert any(overlap)
+
+@pytest.mark.asyncio
+async def test_errors_skip_later_stages_and_are_reported():
+    """Test a failing item is yielded with its error and never reaches later stages."""
+    enriched = []
+
+    async def validate(i):
+        if i == 2:
+            raise ValueError("Data validation failed")
+        return i
+
+    async def enrich(i):
+        enriched.append(i)
+        return i
+
+    items = [item async for item in stream_stages(numbers(4), [stage('validate', validate), stage('enrich', enrich)])]
+
+    failed = [item for item in items if item.error]
+    assert [(item.source, item.failed_stage) for item in failed] == [(2, 'validate')]
+    assert sorted(enriched) == [0, 1, 3]
+
+@pytest.mark.asyncio
+async def test_backpressure_bounds_how_far_the_source_runs_ahead():
+    """Test a stalled consumer stops the source after the queues fill up."""
+    produced = []
+
+    async def identity(i):
+        return i
+
+    stream = stream_stages(numbers(10000, produced), [stage('a', identity), stage('b', identity)], output_size=2)
+    first = await stream.__anext__()
+    await asyncio.sleep(0.05)
+    await stream.aclose()
+
+    assert first.value == 0
+    assert len(produced) < 20
+
+@pytest.mark.asyncio
+async def test_stages_can_see_the_source():
+    """Test a stage marked with_source gets the original input alongside the value."""
+    async def double(i):
+        return i * 2
+
+    async def tag(value, source):
+        return (source, value)
+
+    results = [
+        item.value async for item in stream_stages(
+            numbers(3),
+            [stage('double', double), StreamStage('tag', tag, with_source=True)]
+        )
+    ]
+
+    assert sorted(results) == [(0, 0), (1, 2), (2, 4)]